@@ -0,0 +1,78 @@
+import os
+import tempfile
+import time
+from typing import Callable, Tuple, Any
+
+from typing_extensions import Annotated
+import typer
+
+from manager import connection_manager
+from manager.database_manager import insert_into_database, select_from_database
+from manager.migration_manager import reset_schema
+
+
+# Création de l'application Typer du benchmark
+app: typer.Typer = typer.Typer()
+
+# Données d'une tâche type utilisée pour chaque insertion
+TASK: Tuple[Any, ...] = ("tâche de benchmark", "benchmark", "moyenne", "à faire")
+
+def connect_per_query() -> None:
+    """
+    Reproduit l'ancien comportement : une connexion ouverte, validée et fermée pour chaque requête.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    insert_into_database(TASK)
+    connection_manager.close_connections()
+
+def measure(operation: Callable[[], Any], iterations: int) -> float:
+    """
+    Mesure la latence moyenne d'une opération.
+
+    Args:
+        operation (Callable[[], Any]): L'opération à chronométrer.
+        iterations (int): Le nombre de répétitions.
+
+    Returns:
+        float: La latence moyenne par opération, en microsecondes.
+    """
+    start: float = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+@app.command()
+def run(iterations: Annotated[int, typer.Option(help="Nombre d'opérations par scénario")] = 2000) -> None:
+    """
+    Compare la latence par opération avec et sans connexion persistante.
+
+    Args:
+        iterations (int): Le nombre d'opérations par scénario.
+
+    Returns:
+        None: La fonction affiche les résultats.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Base de données temporaire isolée du fichier de travail
+        database: str = os.path.join(directory, "benchmark.sqlite3")
+        connection_manager.configure(database=database)
+        reset_schema()
+
+        # Scénario 1 : une connexion par requête (ancien comportement)
+        per_query: float = measure(connect_per_query, iterations)
+
+        # Scénario 2 : connexion persistante partagée
+        shared_insert: float = measure(lambda: insert_into_database(TASK), iterations)
+        shared_select: float = measure(lambda: select_from_database({"id": 1}), iterations)
+
+        connection_manager.close_connections()
+
+    typer.echo(f"Insertion, connexion par requête : {per_query:10.1f} µs/op")
+    typer.echo(f"Insertion, connexion persistante : {shared_insert:10.1f} µs/op")
+    typer.echo(f"Sélection, connexion persistante : {shared_select:10.1f} µs/op")
+
+# Bloc principal d'exécution du script
+if __name__ == "__main__":
+    app()
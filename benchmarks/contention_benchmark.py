@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+from typing_extensions import Annotated
+import typer
+
+
+# Création de l'application Typer du benchmark
+app: typer.Typer = typer.Typer()
+
+def writer(args: Tuple[str, int, int]) -> Dict[str, float]:
+    """
+    Processus d'écriture : crée des tâches une par une, puis termine chacune d'elles (une transaction par écriture).
+
+    Args:
+        args (Tuple[str, int, int]): Le fichier de la base, le numéro du processus et le nombre de tâches.
+
+    Returns:
+        Dict[str, float]: Les compteurs de contention du processus et le nombre d'écritures en échec.
+    """
+    # Import dans le processus fils : la configuration (variables d'environnement) est lue à l'import
+    from manager import connection_manager
+    from manager.database_manager import contention, insert_into_database, update_from_database
+
+    database, number, writes = args
+    connection_manager.configure(database=database)
+
+    # Chaque écriture en échec est comptée au lieu d'interrompre le processus
+    lost: int = 0
+    for index in range(writes):
+        try:
+            insert_into_database((f"tâche {number}-{index}", f"writer-{number}", "moyenne", "à faire"))
+            update_from_database({"status": "terminée"}, {"label": f"tâche {number}-{index}"})
+        except Exception:
+            lost += 1
+
+    connection_manager.close_connections()
+    return {**contention, "lost": lost}
+
+def stress(database: str, writers: int, writes: int) -> Dict[str, Any]:
+    """
+    Lance des processus d'écriture concurrents et vérifie qu'aucune écriture n'a été perdue.
+
+    Args:
+        database (str): Le fichier de la base de données (déjà migrée).
+        writers (int): Le nombre de processus d'écriture.
+        writes (int): Le nombre de tâches créées (puis terminées) par processus.
+
+    Returns:
+        Dict[str, Any]: Le débit, les compteurs cumulés et les écritures manquantes constatées en base.
+    """
+    from manager.database_manager import Database
+
+    # Processus démarrés à neuf ("spawn") : aucune connexion héritée du parent
+    context = multiprocessing.get_context("spawn")
+    start: float = time.perf_counter()
+    with context.Pool(writers) as pool:
+        counters: List[Dict[str, float]] = pool.map(writer, [(database, number, writes) for number in range(writers)])
+    elapsed: float = time.perf_counter() - start
+
+    # Vérification en base : chaque tâche créée doit exister et être terminée
+    with Database() as cur:
+        created: int = cur.execute("SELECT COUNT(*) FROM task WHERE collection LIKE 'writer-%'").fetchone()[0]
+        done: int = cur.execute("SELECT COUNT(*) FROM task WHERE collection LIKE 'writer-%' AND status = 2").fetchone()[0]
+        cur.execute("DELETE FROM task WHERE collection LIKE 'writer-%'")
+
+    totals: Dict[str, float] = {name: sum(counter[name] for counter in counters) for name in counters[0]}
+    expected: int = writers * writes
+    return {
+        "writes_per_s": 2 * expected / elapsed,
+        "missing": (expected - created) + (expected - done),
+        **totals,
+    }
+
+@app.command()
+def run(
+    writers: Annotated[List[int], typer.Option(help="Nombre de processus d'écriture (répétable)")] = [1, 2, 4, 8],
+    writes: Annotated[int, typer.Option(help="Nombre de tâches créées puis terminées par processus")] = 200,
+    retries: Annotated[int, typer.Option(help="Nombre de nouvelles tentatives (0 pour observer les écritures perdues)")] = 5,
+    busy_timeout: Annotated[int, typer.Option(help="Attente maximale d'un verrou, en ms")] = 5000,
+    profile: Annotated[str, typer.Option(help="Profil de performance SQLite")] = "balanced",
+    ) -> None:
+    """
+    Mesure le débit d'écriture de processus concurrents et vérifie qu'aucune écriture n'est perdue.
+
+    Args:
+        writers (List[int]): Les nombres de processus d'écriture à tester.
+        writes (int): Le nombre de tâches créées puis terminées par processus.
+        retries (int): Le nombre de nouvelles tentatives des transactions d'écriture.
+        busy_timeout (int): L'attente maximale d'un verrou, en millisecondes.
+        profile (str): Le profil de performance SQLite.
+
+    Returns:
+        None: La fonction affiche les résultats et se termine en erreur si des écritures ont été perdues.
+    """
+    # Configuration transmise aux processus fils par l'environnement
+    os.environ.update({
+        "TASK_MANAGER_WRITE_RETRIES": str(retries),
+        "TASK_MANAGER_BUSY_TIMEOUT": str(busy_timeout),
+        "TASK_MANAGER_PROFILE": profile,
+        "TASK_MANAGER_LOG_LEVEL": "OFF",
+    })
+    from manager import connection_manager
+    from manager.migration_manager import reset_schema
+
+    missing: int = 0
+    with tempfile.TemporaryDirectory() as directory:
+        database: str = os.path.join(directory, "contention.sqlite3")
+        connection_manager.configure(database=database, profile=profile)
+        reset_schema()
+
+        typer.echo(f"{'processus':>9} {'écritures/s':>12} {'attentes':>9} {'attente ms':>11} {'tentatives':>11} {'échecs':>7} {'manquantes':>11}")
+        for count in writers:
+            result: Dict[str, Any] = stress(database, count, writes)
+            missing += result["missing"]
+            typer.echo(f"{count:>9} {result['writes_per_s']:>12.0f} {result['lock_waits']:>9.0f} {result['lock_wait_ms']:>11.1f} "
+                       f"{result['retries']:>11.0f} {result['failures']:>7.0f} {result['missing']:>11}")
+
+        connection_manager.close_connections()
+
+    # Code d'erreur si une écriture a été perdue
+    if missing:
+        raise typer.Exit(code=1)
+
+# Bloc principal d'exécution du script
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,234 @@
+import io
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from typing_extensions import Annotated
+import typer
+from rich.console import Console
+
+from benchmarks.dataset import collection_names, generate_tasks
+from commands.crud.read import build_table
+from manager import connection_manager
+from manager.connection_manager import DEFAULT_PROFILE, PROFILES
+from manager.constant_manager import PRIORITY, STATUS
+from manager.database_manager import (
+    delete_from_database,
+    insert_into_database,
+    insert_many_into_database,
+    iter_select_from_database,
+    next_from_database,
+    select_from_database,
+    update_from_database,
+)
+from manager.migration_manager import reset_schema
+
+
+# Création de l'application Typer du benchmark
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Définit le type d'un résultat de mesure : nom de l'opération -> statistiques
+Measures = Dict[str, Dict[str, float]]
+
+def measure(operation: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Chronomètre plusieurs exécutions d'une opération.
+
+    Args:
+        operation (Callable[[], Any]): L'opération à chronométrer.
+        repeat (int): Le nombre d'exécutions.
+
+    Returns:
+        Dict[str, float]: Les durées minimale, médiane et moyenne, en millisecondes.
+    """
+    durations: List[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        operation()
+        durations.append((time.perf_counter() - start) * 1000)
+    durations.sort()
+    return {
+        "min_ms": durations[0],
+        "median_ms": durations[len(durations) // 2],
+        "mean_ms": sum(durations) / len(durations),
+    }
+
+def render_first_page(page_size: int) -> None:
+    """
+    Reproduit l'étape d'affichage de 'read task' pour une page, sans écrire sur le terminal.
+
+    Args:
+        page_size (int): Le nombre de tâches de la page.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    console: Console = Console(file=io.StringIO(), width=120)
+    for page in iter_select_from_database({}, limit=page_size, page_size=page_size):
+        console.print(build_table(page, "Liste des tâches"))
+
+def run_size(rows: int, repeat: int, seed: int, profile: str) -> Measures:
+    """
+    Construit une base de `rows` tâches synthétiques puis chronomètre chaque opération CRUD.
+
+    Args:
+        rows (int): La taille du jeu de données.
+        repeat (int): Le nombre d'exécutions par opération.
+        seed (int): La graine du jeu de données.
+        profile (str): Le profil de performance SQLite.
+
+    Returns:
+        Measures: Les statistiques de chaque opération.
+    """
+    # Valeurs de filtre présentes dans le jeu de données
+    collection: str = collection_names(rows)[0]
+    sample: Dict[str, Any] = {"collection": collection, "priority": PRIORITY[3], "status": STATUS[0]}
+
+    results: Measures = {}
+    with tempfile.TemporaryDirectory() as directory:
+        connection_manager.configure(database=os.path.join(directory, "benchmark.sqlite3"), profile=profile)
+        reset_schema()
+
+        # Chargement initial (mesuré une seule fois)
+        results["load"] = measure(lambda: insert_many_into_database(generate_tasks(rows, seed)), 1)
+        results["load"]["rows_per_s"] = rows / (results["load"]["min_ms"] / 1000)
+
+        # Insertion unitaire
+        results["insert"] = measure(lambda: insert_into_database(("tâche de benchmark", collection, PRIORITY[2], STATUS[0])), repeat)
+
+        # Sélections : identifiant, filtres combinés, première page non filtrée, table complète
+        results["select_by_id"] = measure(lambda: select_from_database({"id": rows // 2}), repeat)
+        results["select_filtered"] = measure(lambda: select_from_database(sample), repeat)
+        results["select_first_page"] = measure(lambda: next(iter_select_from_database({}, limit=100, page_size=100)), repeat)
+        results["select_all"] = measure(lambda: sum(len(page) for page in iter_select_from_database({})), 1)
+        results["select_top_priority"] = measure(lambda: next(iter_select_from_database(
+            {"status": STATUS[0]}, limit=20, page_size=20, sort="priority", descending=True)), repeat)
+        results["next_urgent"] = measure(lambda: next_from_database(20), repeat)
+
+        # Mise à jour et suppression ciblées
+        results["update_by_id"] = measure(lambda: update_from_database({"status": STATUS[1]}, {"id": rows // 3}), repeat)
+        results["update_filtered"] = measure(lambda: update_from_database({"status": STATUS[1]}, sample), repeat)
+        results["update_many_ids"] = measure(lambda: update_from_database({"status": STATUS[2]}, {"id": list(range(1, rows, 5))[:2000]}), repeat)
+        results["delete_by_id"] = measure(lambda: delete_from_database({"id": rows // 4}), repeat)
+
+        # Rendu Rich d'une page de 'read task'
+        results["read_render_page"] = measure(lambda: render_first_page(100), repeat)
+
+        connection_manager.close_connections()
+
+    return results
+
+def git_commit() -> str:
+    """
+    Retourne le commit courant du dépôt, pour rattacher les résultats à une version du code.
+
+    Returns:
+        str: L'identifiant court du commit, ou "inconnu" hors d'un dépôt git.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "inconnu"
+
+@app.command(name="run", help="Chronométrer les opérations CRUD sur des jeux de données synthétiques")
+def run(
+    rows: Annotated[List[int], typer.Option(
+        help="Taille(s) du jeu de données (option répétable, ex: 10000, 100000, 1000000, 10000000)")
+        ] = [10_000, 100_000],
+
+    repeat: Annotated[int, typer.Option(
+        help="Nombre d'exécutions par opération",
+        min=1)
+        ] = 20,
+
+    seed: Annotated[int, typer.Option(
+        help="Graine du générateur de données")
+        ] = 42,
+
+    profile: Annotated[str, typer.Option(
+        help=f"Profil de performance SQLite ({', '.join(PROFILES)})")
+        ] = DEFAULT_PROFILE,
+
+    output: Annotated[str, typer.Option(
+        help="Fichier JSON de résultats")
+        ] = "bench_output.json",
+    ) -> None:
+    """
+    Exécute le benchmark pour chaque taille demandée et écrit les résultats au format JSON.
+
+    Args:
+        rows (List[int]): Les tailles de jeu de données.
+        repeat (int): Le nombre d'exécutions par opération.
+        seed (int): La graine du jeu de données.
+        profile (str): Le profil de performance SQLite.
+        output (str): Le fichier de résultats.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    report: Dict[str, Any] = {
+        "commit": git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "repeat": repeat,
+        "seed": seed,
+        "profile": profile,
+        "results": {},
+    }
+
+    for size in rows:
+        typer.echo(f"Jeu de données : {size} tâches")
+        report["results"][str(size)] = run_size(size, repeat, seed, profile)
+        for name, stats in report["results"][str(size)].items():
+            typer.echo(f"  {name:<20} {stats['median_ms']:12.3f} ms")
+
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    typer.echo(f"Résultats écrits dans {output}")
+
+@app.command(name="compare", help="Comparer deux fichiers de résultats et signaler les régressions")
+def compare(
+    baseline: Annotated[str, typer.Argument(help="Fichier JSON de référence")],
+    candidate: Annotated[str, typer.Argument(help="Fichier JSON à comparer")],
+    threshold: Annotated[float, typer.Option(help="Ralentissement toléré, en pourcentage")] = 10.0,
+    ) -> None:
+    """
+    Compare les durées médianes de deux exécutions et échoue si l'une d'elles régresse au-delà du seuil.
+
+    Args:
+        baseline (str): Le fichier de résultats de référence.
+        candidate (str): Le fichier de résultats à comparer.
+        threshold (float): Le ralentissement toléré, en pourcentage.
+
+    Returns:
+        None: La fonction lève typer.Exit(1) en cas de régression.
+    """
+    with open(baseline, encoding="utf-8") as file:
+        before: Dict[str, Any] = json.load(file)
+    with open(candidate, encoding="utf-8") as file:
+        after: Dict[str, Any] = json.load(file)
+
+    regressions: int = 0
+    for size, operations in after["results"].items():
+        for name, stats in operations.items():
+            reference: Dict[str, float] = before["results"].get(size, {}).get(name, {})
+            if not reference:
+                continue
+            change: float = (stats["median_ms"] / reference["median_ms"] - 1) * 100
+            marker: str = "RÉGRESSION" if change > threshold else ""
+            regressions += bool(marker)
+            typer.echo(f"{size:>10} {name:<20} {reference['median_ms']:12.3f} -> {stats['median_ms']:12.3f} ms ({change:+6.1f} %) {marker}")
+
+    if regressions:
+        raise typer.Exit(code=1)
+
+# Bloc principal d'exécution du script
+if __name__ == "__main__":
+    app()
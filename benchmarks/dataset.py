@@ -0,0 +1,61 @@
+import random
+from typing import Iterator, List, Tuple
+
+from manager.constant_manager import PRIORITY, STATUS
+
+
+# Vocabulaire utilisé pour composer des libellés réalistes
+VERBS: List[str] = ["corriger", "déployer", "documenter", "tester", "migrer", "relire", "optimiser", "planifier", "livrer", "analyser"]
+SUBJECTS: List[str] = ["api", "base de données", "facturation", "interface", "authentification", "rapport", "serveur", "client", "export", "tableau de bord"]
+
+# Répartition des priorités (de "optionnelle" à "urgente") : la majorité des tâches sont de priorité moyenne ou basse
+PRIORITY_WEIGHTS: List[float] = [0.10, 0.30, 0.35, 0.18, 0.07]
+
+# Répartition des statuts (de "à faire" à "annulée") : les tâches terminées s'accumulent
+STATUS_WEIGHTS: List[float] = [0.30, 0.15, 0.45, 0.10]
+
+def collection_names(rows: int) -> List[str]:
+    """
+    Génère les noms de collections, leur nombre croissant avec la taille du jeu de données.
+
+    Args:
+        rows (int): Le nombre de tâches du jeu de données.
+
+    Returns:
+        List[str]: Les noms de collections.
+    """
+    # Environ une collection pour mille tâches, entre 10 et 1000 collections
+    count: int = min(max(rows // 1000, 10), 1000)
+    return [f"projet-{number:04d}" for number in range(count)]
+
+def generate_tasks(rows: int, seed: int = 42) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Génère un flux déterministe de tâches synthétiques.
+
+    Les collections suivent une loi de Zipf (quelques collections très volumineuses, beaucoup de petites),
+    les priorités et statuts suivent les répartitions PRIORITY_WEIGHTS et STATUS_WEIGHTS.
+
+    Args:
+        rows (int): Le nombre de tâches à générer.
+        seed (int): La graine du générateur pseudo-aléatoire (même graine = même jeu de données).
+
+    Yields:
+        Tuple[str, str, str, str]: Les tuples (label, collection, priority, status).
+    """
+    generator: random.Random = random.Random(seed)
+    collections: List[str] = collection_names(rows)
+
+    # Poids de Zipf : la collection de rang k pèse 1 / (k + 1)
+    collection_weights: List[float] = [1 / (rank + 1) for rank in range(len(collections))]
+
+    # Génération par lots pour amortir le coût des tirages pondérés
+    batch: int = 10_000
+    for start in range(0, rows, batch):
+        size: int = min(batch, rows - start)
+        for number, collection, priority, status in zip(
+                range(start, start + size),
+                generator.choices(collections, collection_weights, k=size),
+                generator.choices(PRIORITY, PRIORITY_WEIGHTS, k=size),
+                generator.choices(STATUS, STATUS_WEIGHTS, k=size)):
+            label: str = f"{generator.choice(VERBS)} {generator.choice(SUBJECTS)} #{number}"
+            yield (label, collection, priority, status)
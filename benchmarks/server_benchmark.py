@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from typing_extensions import Annotated
+import typer
+
+from manager.client_manager import TaskClient
+
+
+# Création de l'application Typer du benchmark
+app: typer.Typer = typer.Typer()
+
+# Racine du dépôt (dossier contenant main.py)
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def client_load(path: str, requests: int, number: int) -> None:
+    """
+    Envoie une série de requêtes au serveur : trois écritures pour une lecture.
+
+    Args:
+        path (str): Le chemin du socket Unix.
+        requests (int): Le nombre de requêtes à envoyer.
+        number (int): Le numéro du client (utilisé dans les libellés).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    client: TaskClient = TaskClient(path)
+    for index in range(requests):
+        if index % 4 == 3:
+            client.call("select", options={"collection": f"client-{number}"}, limit=20)
+        else:
+            client.call("insert", values=[f"tâche {index}", f"client-{number}", "moyenne", "à faire"])
+    client.close()
+
+def fork_per_call(environment: Dict[str, str], calls: int) -> None:
+    """
+    Crée des tâches en lançant un processus 'main.py create task' par appel (approche sans serveur).
+
+    Args:
+        environment (Dict[str, str]): Les variables d'environnement des processus.
+        calls (int): Le nombre de processus lancés.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    for index in range(calls):
+        subprocess.run([sys.executable, "main.py", "create", "task", f"tâche {index}", "fork"],
+                       cwd=ROOT, env=environment, check=True, capture_output=True)
+
+@app.command()
+def run(
+    clients: Annotated[int, typer.Option(help="Nombre de clients concurrents")] = 8,
+    requests: Annotated[int, typer.Option(help="Nombre de requêtes par client")] = 500,
+    calls: Annotated[int, typer.Option(help="Nombre de processus pour l'approche 'un processus par appel'")] = 20,
+    ) -> None:
+    """
+    Mesure le débit du serveur (requêtes/s) et le compare à l'approche 'un processus par appel'.
+
+    Args:
+        clients (int): Le nombre de clients concurrents.
+        requests (int): Le nombre de requêtes par client.
+        calls (int): Le nombre de processus lancés pour l'approche sans serveur.
+
+    Returns:
+        None: La fonction affiche les résultats.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Base de données et socket temporaires, journalisation désactivée
+        environment: Dict[str, str] = {
+            **os.environ,
+            "TASK_MANAGER_DATABASE": os.path.join(directory, "benchmark.sqlite3"),
+            "TASK_MANAGER_LOG_LEVEL": "OFF",
+            "TASK_MANAGER_SERVER": "",
+        }
+        path: str = os.path.join(directory, "server.sock")
+        subprocess.run([sys.executable, "main.py", "reset", "table", "--reset"], cwd=ROOT, env=environment, check=True, capture_output=True)
+
+        # Démarrage du serveur et attente de son socket
+        server: subprocess.Popen = subprocess.Popen([sys.executable, "main.py", "server", "start", "--socket", path],
+                                                    cwd=ROOT, env=environment, stdout=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.05)
+
+            # Charge concurrente sur le serveur
+            start: float = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=clients) as pool:
+                futures: List = [pool.submit(client_load, path, requests, number) for number in range(clients)]
+                for future in futures:
+                    future.result()
+            server_rate: float = clients * requests / (time.perf_counter() - start)
+        finally:
+            server.terminate()
+            server.wait()
+
+        # Approche sans serveur : un processus par appel
+        start = time.perf_counter()
+        fork_per_call(environment, calls)
+        fork_rate: float = calls / (time.perf_counter() - start)
+
+    typer.echo(f"Serveur ({clients} clients)       : {server_rate:10.1f} requêtes/s")
+    typer.echo(f"Un processus par appel           : {fork_rate:10.1f} requêtes/s")
+    typer.echo(f"Accélération                     : {server_rate / fork_rate:10.1f} x")
+
+# Bloc principal d'exécution du script
+if __name__ == "__main__":
+    app()
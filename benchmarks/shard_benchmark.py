@@ -0,0 +1,82 @@
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from typing_extensions import Annotated
+import typer
+
+
+# Création de l'application Typer du benchmark
+app: typer.Typer = typer.Typer()
+
+def measure(shards: int, database: str, rows: int) -> Dict[str, float]:
+    """
+    Processus de mesure : importe un jeu de données puis chronomètre les lectures et les agrégations.
+
+    Args:
+        shards (int): Le nombre de fragments (0 pour une base unique).
+        database (str): Le fichier de la base de données (les fragments en sont dérivés).
+        rows (int): Le nombre de tâches importées.
+
+    Returns:
+        Dict[str, float]: La durée de chaque opération, en millisecondes.
+    """
+    # Configuration lue à l'import des modules : définie avant tout import de manager
+    os.environ.update({"TASK_MANAGER_SHARDS": str(shards), "TASK_MANAGER_DATABASE": database, "TASK_MANAGER_LOG_LEVEL": "OFF",
+                       "TASK_MANAGER_SLOW_QUERY_MS": "OFF"})
+    from benchmarks.dataset import generate_tasks
+    from manager import client_manager
+    from manager.shard_manager import reset_databases
+
+    reset_databases()
+
+    # Opérations chronométrées, dans l'ordre d'exécution
+    operations: List[Tuple[str, Callable[[], Any]]] = [
+        ("insert_many", lambda: client_manager.insert_many_into_database(generate_tasks(rows))),
+        ("read_all", lambda: sum(len(page) for page in client_manager.iter_select_from_database({}))),
+        ("read_top_priority", lambda: list(client_manager.iter_select_from_database({}, limit=100, sort="priority", descending=True))),
+        ("read_collection", lambda: list(client_manager.iter_select_from_database({"collection": ["projet-0000"]}))),
+        ("next_urgent", lambda: client_manager.next_from_database(20)),
+        ("stats", lambda: [list(client_manager.count_by(columns)) for columns in (("status",), ("priority",), ("collection", "status"))]),
+    ]
+
+    timings: Dict[str, float] = {}
+    for name, operation in operations:
+        start: float = time.perf_counter()
+        operation()
+        timings[name] = (time.perf_counter() - start) * 1000
+    return timings
+
+@app.command()
+def run(
+    shards: Annotated[List[int], typer.Option(help="Nombre de fragments (répétable, 0 pour une base unique)")] = [0, 2, 4],
+    rows: Annotated[int, typer.Option(help="Nombre de tâches importées")] = 200_000,
+    ) -> None:
+    """
+    Compare une base unique et des bases réparties entre plusieurs fragments (import, lectures fusionnées, agrégations).
+
+    Args:
+        shards (List[int]): Les nombres de fragments à tester.
+        rows (int): Le nombre de tâches importées.
+
+    Returns:
+        None: La fonction affiche une ligne par opération et une colonne par configuration.
+    """
+    # Chaque configuration dans un processus neuf ("spawn") : le nombre de fragments est lu à l'import
+    context = multiprocessing.get_context("spawn")
+    results: Dict[int, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for count in shards:
+            with context.Pool(1) as pool:
+                results[count] = pool.apply(measure, (count, os.path.join(directory, f"shards{count}.sqlite3"), rows))
+
+    # Tableau des durées (ms) : une colonne par nombre de fragments
+    typer.echo(f"{'opération':<20}" + "".join(f"{f'{count} fragment(s)':>16}" for count in shards))
+    for name in results[shards[0]]:
+        typer.echo(f"{name:<20}" + "".join(f"{results[count][name]:>16.1f}" for count in shards))
+
+# Bloc principal d'exécution du script
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+from typing_extensions import Annotated
+import typer
+
+
+# Création de l'application Typer du benchmark
+app: typer.Typer = typer.Typer()
+
+# Racine du dépôt (dossier contenant main.py)
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules qui ne doivent pas être importés au démarrage (chargés à la demande par les commandes)
+FORBIDDEN: List[str] = ["rich", "commands", "manager", "sqlite3"]
+
+# Budget maximal d'import de main.py, en millisecondes
+BUDGET: float = 150.0
+
+def import_times() -> Dict[str, int]:
+    """
+    Importe main.py dans un nouvel interpréteur avec -X importtime et relève le temps cumulé par module.
+
+    Returns:
+        Dict[str, int]: Le temps d'import cumulé de chaque module, en microsecondes.
+    """
+    # Exécution dans un processus séparé pour partir d'un interpréteur vierge
+    process: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+
+    # Lignes au format "import time: <self> | <cumulé> | <module>"
+    times: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        parts: List[str] = line.removeprefix("import time:").split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            times[parts[2].strip()] = int(parts[1])
+    return times
+
+@app.command()
+def run(budget: Annotated[float, typer.Option(help="Budget maximal d'import de main.py, en millisecondes")] = BUDGET) -> None:
+    """
+    Vérifie que le démarrage de la CLI reste dans le budget et n'importe aucun module de commande.
+
+    Args:
+        budget (float): Le temps d'import maximal accepté pour main.py, en millisecondes.
+
+    Returns:
+        None: La fonction lève typer.Exit(1) si le budget est dépassé ou si un module interdit est importé.
+    """
+    times: Dict[str, int] = import_times()
+
+    # Temps cumulé de l'import de main.py
+    total: float = times.get("main", 0) / 1000
+    typer.echo(f"Import de main.py : {total:.1f} ms (budget : {budget:.1f} ms)")
+
+    # Modules importés à tort au démarrage
+    eager: List[str] = sorted(name for name in times if name.split(".")[0] in FORBIDDEN)
+    if eager:
+        typer.echo(f"Modules importés au démarrage : {', '.join(eager)}", err=True)
+
+    # Échec si le budget est dépassé ou si des modules interdits ont été importés
+    if total > budget or eager:
+        raise typer.Exit(code=1)
+
+# Bloc principal d'exécution du script
+if __name__ == "__main__":
+    app()
@@ -1,8 +1,14 @@
 from typing_extensions import Annotated
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
+import csv
+import json
+import sys
+import time
+
 import typer
 
 from manager.constant_manager import *
-from manager.database_manager import insert_into_database
+from manager.client_manager import insert_into_database, insert_many_into_database
 
 
 # Création de l'application Typer principale
@@ -44,14 +50,14 @@ def create_task(
         None: La fonction ne retourne rien explicitement, elle utilise typer.echo pour l'affichage.
     """
 
-    # Normalisation du libellé de la tâche (minuscules et suppression des espaces blancs aux extrémités)
-    label: str = label.lower().strip()
-
-    # Normalisation du nom de la collection (minuscules et suppression des espaces blancs aux extrémités)
-    collection: str = collection.lower().strip()
+    # Vérification de la priorité et du statut (valeurs des constantes), avant toute lecture ou écriture
+    if priority and priority not in PRIORITY:
+        raise typer.BadParameter(f"Priorité inconnue : {priority} (valeurs possibles : {', '.join(PRIORITY)})", param_hint="PRIORITY")
+    if status and status not in STATUS:
+        raise typer.BadParameter(f"Statut inconnu : {status} (valeurs possibles : {', '.join(STATUS)})", param_hint="STATUS")
 
-    # Assemblage des données de la tâche dans un tuple pour l'insertion
-    data: tuple[str, str, str, str, str] = (label, collection, priority, status)
+    # Normalisation du libellé et de la collection, puis assemblage des données dans un tuple pour l'insertion
+    data: Tuple[str, str, str, str] = normalize_task(label, collection, priority, status)
 
     # Appel de la fonction pour insérer le tuple de données dans la base de données
     insert_into_database(data)
@@ -62,6 +68,150 @@ def create_task(
     # Retourne explicitement None car la fonction ne doit pas retourner de valeur
     return None
 
+# Format des fichiers d'import acceptés
+IMPORT_FORMATS: List[str] = ["csv", "ndjson"]
+
+def normalize_task(label: str, collection: str, priority: str, status: str) -> Tuple[str, str, str, str]:
+    """
+    Normalise les champs d'une tâche avant son insertion.
+
+    Args:
+        label (str): Le libellé de la tâche.
+        collection (str): Le nom de la collection.
+        priority (str): Le niveau de priorité.
+        status (str): Le statut.
+
+    Returns:
+        Tuple[str, str, str, str]: Le tuple (label, collection, priority, status) prêt à être inséré.
+    """
+    # Normalisation du libellé et de la collection (minuscules et suppression des espaces blancs aux extrémités)
+    return (label.lower().strip(), collection.lower().strip(), priority, status)
+
+def read_records(stream: TextIO, file_format: str) -> Iterator[Any]:
+    """
+    Lit un flux CSV ou NDJSON enregistrement par enregistrement.
+
+    Args:
+        stream (TextIO): Le flux texte à lire (fichier ou entrée standard).
+        file_format (str): Le format du flux ("csv" ou "ndjson").
+
+    Yields:
+        Any: Un enregistrement par ligne de données (None pour une ligne JSON mal formée, rejetée à la validation).
+    """
+    # CSV : la première ligne contient les noms de colonnes
+    if file_format == "csv":
+        yield from csv.DictReader(stream)
+        return
+
+    # NDJSON : un objet JSON par ligne (les lignes vides sont ignorées)
+    for line in stream:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield None
+
+def validate_records(records: Iterator[Any], rejected: Dict[str, Any]) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Normalise et valide un flux d'enregistrements, en écartant les lignes invalides.
+
+    Une ligne invalide est comptée puis ignorée, sans interrompre l'import : les paquets déjà insérés
+    ne laissent donc jamais un import partiel arrêté au milieu du fichier.
+
+    Args:
+        records (Iterator[Any]): Les enregistrements bruts (dictionnaires, ou autre valeur pour une ligne mal formée).
+        rejected (Dict[str, Any]): Compteur des enregistrements rejetés ("count") et numéros des premiers ("samples").
+
+    Yields:
+        Tuple[str, str, str, str]: Les tuples (label, collection, priority, status) valides.
+    """
+    for number, record in enumerate(records, start=1):
+        try:
+            # Valeurs par défaut identiques à celles de la commande "create task"
+            label: str = (record.get("label") or "").strip()
+            collection: str = record.get("collection") or "divers"
+            priority: str = (record.get("priority") or PRIORITY[0]).lower().strip()
+            status: str = (record.get("status") or STATUS[0]).lower().strip()
+            task: Tuple[str, str, str, str] = normalize_task(label, collection, priority, status)
+        except AttributeError:
+            # Ligne mal formée, valeur JSON qui n'est pas un objet, ou champ qui n'est pas une chaîne
+            task = ("", "", "", "")
+
+        # Rejet des lignes invalides, sans libellé ou avec une priorité / un statut inconnus
+        if not task[0] or task[2] not in PRIORITY or task[3] not in STATUS:
+            rejected["count"] += 1
+            if len(rejected["samples"]) < 10:
+                rejected["samples"].append(number)
+            continue
+
+        yield task
+
+# Définition de la commande "tasks" pour l'application Typer, utilisée pour importer des tâches en masse
+@app.command(name="tasks", help="Importer des tâches depuis un fichier CSV ou NDJSON")
+def create_tasks(
+    from_file: Annotated[str, typer.Option(
+        "--from-file",
+        help="Fichier à importer ('-' pour l'entrée standard)")
+        ],
+
+    file_format: Annotated[str, typer.Option(
+        "--format",
+        help="Format du fichier (csv ou ndjson), déduit de l'extension si vide",
+        show_default="Vide")
+        ] = "",
+
+    chunk_size: Annotated[int, typer.Option(
+        help="Nombre de lignes insérées par transaction",
+        min=1)
+        ] = 10_000,
+    ) -> None:
+    """
+    Importe en masse des tâches depuis un fichier CSV ou NDJSON (ou l'entrée standard).
+
+    Les colonnes attendues sont label, collection, priority et status. Le fichier est lu en flux
+    et inséré par paquets : la mémoire utilisée ne dépend pas de la taille du fichier.
+
+    Args:
+        from_file (Annotated[str, typer.Option]): Le chemin du fichier, ou '-' pour l'entrée standard.
+        file_format (Annotated[str, typer.Option]): Le format du fichier ("csv" ou "ndjson").
+        chunk_size (Annotated[int, typer.Option]): Le nombre de lignes par transaction.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle utilise typer.echo pour l'affichage.
+    """
+    # Déduction du format à partir de l'extension du fichier si nécessaire
+    file_format = (file_format or from_file.rsplit(".", 1)[-1]).lower()
+    if file_format == "jsonl":
+        file_format = "ndjson"
+    if file_format not in IMPORT_FORMATS:
+        raise typer.BadParameter(f"Format inconnu, formats acceptés : {', '.join(IMPORT_FORMATS)}", param_hint="--format")
+
+    # Ouverture du flux (l'entrée standard n'est pas refermée)
+    stream: TextIO = sys.stdin if from_file == "-" else open(from_file, newline="", encoding="utf-8")
+
+    # Nombre d'enregistrements rejetés et numéros des premiers d'entre eux (mémoire bornée)
+    rejected: Dict[str, Any] = {"count": 0, "samples": []}
+
+    # Import chronométré
+    start: float = time.perf_counter()
+    try:
+        total: int = insert_many_into_database(validate_records(read_records(stream, file_format), rejected), chunk_size)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    elapsed: float = time.perf_counter() - start
+
+    # Signalement des lignes rejetées sur la sortie d'erreur
+    if rejected["count"]:
+        typer.echo(f"{rejected['count']} ligne(s) rejetée(s) (ligne mal formée, libellé vide, priorité ou statut invalide) : {rejected['samples']}", err=True)
+
+    # Affichage d'un message de confirmation avec le débit obtenu
+    rate: float = total / elapsed if elapsed else 0.0
+    typer.echo(f"Import effectué : {total} tâche(s) en {elapsed:.2f} s ({rate:.0f} lignes/s)")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
 # Bloc principal d'exécution du script
 # Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
 if __name__ == "__main__":
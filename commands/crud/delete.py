@@ -1,8 +1,10 @@
 from typing_extensions import Annotated
+from typing import Any, List
 import typer
 
-from manager.database_manager import delete_from_database
+from manager.client_manager import ServerError, delete_from_database
 from manager.constant_manager import *
+from manager.query_manager import parse_expression, parse_ids
 
 
 # Création de l'application Typer principale
@@ -11,68 +13,94 @@ app: typer.Typer = typer.Typer(no_args_is_help=True)
 # Définition de la commande "task" pour l'application Typer, utilisée pour supprimer des tâches
 @app.command(name="task", help="Supprimer une ou plusieurs tâches")
 def delete_task(
-    # Paramètre pour filtrer par l'identifiant unique de la tâche
-    id: Annotated[int, typer.Option(
-        help="Suppression par l'identifiant unique", 
+    # Paramètre pour filtrer par identifiants : liste d'identifiants et d'intervalles (ex: 3,8,100-2000)
+    id: Annotated[str, typer.Option(
+        help="Suppression par l'identifiant unique (liste et intervalles, ex: 3,8,100-2000)", 
         show_default="Vide")
-        ] = 0,
+        ] = "",
 
-    # Paramètre pour filtrer par le libellé de la tâche
-    label: Annotated[str, typer.Option(
-        help="Suppression par le libellé", 
+    # Paramètre pour filtrer par le libellé de la tâche (option répétable)
+    label: Annotated[List[str], typer.Option(
+        help="Suppression par le libellé (répétable)", 
         show_default="Vide")
-        ] = "",
+        ] = [],
 
-    # Paramètre pour filtrer par la collection de la tâche
-    collection: Annotated[str, typer.Option(
-        help="Suppression par la collection", 
+    # Paramètre pour filtrer par la collection de la tâche (option répétable)
+    collection: Annotated[List[str], typer.Option(
+        help="Suppression par la collection (répétable)", 
         show_default="Vide")
-        ] = "",
+        ] = [],
 
-    # Paramètre pour filtrer par la priorité de la tâche, avec formatage basé sur les constantes
-    priority: Annotated[str, typer.Option(
-        help="Suppression par la priorité",
+    # Paramètre pour filtrer par la priorité de la tâche, avec formatage basé sur les constantes (option répétable)
+    priority: Annotated[List[str], typer.Option(
+        help="Suppression par la priorité (répétable)",
         show_default="Vide", 
         formats=PRIORITY)
-        ] = "",
+        ] = [],
 
-    # Paramètre pour filtrer par le statut de la tâche, avec formatage basé sur les constantes
-    status: Annotated[str, typer.Option(
-        help="Suppression par le statut",
+    # Paramètre pour filtrer par le statut de la tâche, avec formatage basé sur les constantes (option répétable)
+    status: Annotated[List[str], typer.Option(
+        help="Suppression par le statut (répétable)",
         show_default="Vide", 
         formats=STATUS)
+        ] = [],
+
+    # Expression de filtre combinée aux autres critères (comparaisons, in, between, ^=, like, not, and, or)
+    where: Annotated[str, typer.Option(
+        help="Expression de filtre (ex: \"priority >= haute and status != terminée\")",
+        show_default="Vide")
         ] = "",
     ) -> None:
     """
     Supprime une ou plusieurs tâches de la base de données en fonction des options de filtrage fournies.
 
-    La suppression est basée sur l'ensemble des options non vides passées.
+    La suppression est basée sur l'ensemble des options non vides passées. Chaque option accepte plusieurs valeurs :
+    toutes les tâches ciblées sont supprimées par une seule requête, dans une seule transaction.
 
     Args:
-        id (Annotated[int, typer.Option]): L'identifiant unique de la tâche à supprimer (par défaut: 0, ignoré si non spécifié).
-        label (Annotated[str, typer.Option]): Le libellé de la tâche à supprimer (supporte la suppression de plusieurs tâches si non unique).
-        collection (Annotated[str, typer.Option]): Le nom de la collection à supprimer.
-        priority (Annotated[str, typer.Option]): Le niveau de priorité pour le filtre de suppression.
-        status (Annotated[str, typer.Option]): Le statut pour le filtre de suppression.
+        id (Annotated[str, typer.Option]): Les identifiants et intervalles d'identifiants des tâches à supprimer (ignoré si vide).
+        label (Annotated[List[str], typer.Option]): Les libellés des tâches à supprimer (supporte la suppression de plusieurs tâches si non unique).
+        collection (Annotated[List[str], typer.Option]): Les noms des collections à supprimer.
+        priority (Annotated[List[str], typer.Option]): Les niveaux de priorité pour le filtre de suppression.
+        status (Annotated[List[str], typer.Option]): Les statuts pour le filtre de suppression.
+        where (Annotated[str, typer.Option]): L'expression de filtre, évaluée par SQLite.
 
     Returns:
         None: La fonction ne retourne rien explicitement.
     """
     
-    # Construction du dictionnaire d'options de filtrage
-    options: dict[str, int | str] = {
-        "id": id,
+    # Analyse de la liste d'identifiants et d'intervalles
+    try:
+        ids: List[Any] = parse_ids(id)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--id")
+
+    # Vérification de l'expression de filtre, avant toute lecture ou écriture
+    try:
+        if where:
+            parse_expression(where)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--where")
+
+    # Construction du dictionnaire d'options de filtrage, chaque critère pouvant avoir plusieurs valeurs
+    options: dict[str, Any] = {
+        "id": ids,
         "label": label,
         "collection": collection,
         "priority": priority,
         "status": status,
+        "where": where,
         }
 
     # Appel de la fonction pour supprimer les tâches correspondantes dans la base de données
-    delete_from_database(options)
+    # (aucun critère ou valeur inconnue, y compris refusée par le serveur : erreur d'usage)
+    try:
+        count: int = delete_from_database(options)
+    except (ValueError, ServerError) as error:
+        raise typer.BadParameter(str(error))
 
-    # Affichage d'un message de confirmation à l'utilisateur
-    typer.echo(f"Suppression effectuée !")
+    # Affichage d'un message de confirmation avec le nombre de tâches supprimées
+    typer.echo(f"Suppression effectuée : {count} tâche(s) supprimée(s)")
 
     # Retourne explicitement None car la fonction ne doit pas retourner de valeur
     return None
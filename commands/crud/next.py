@@ -0,0 +1,69 @@
+from typing_extensions import Annotated
+import os
+import sys
+
+import typer
+from rich.console import Console
+
+from commands.crud.read import READ_FORMATS, build_table, write_rows
+from manager.client_manager import next_from_database
+from manager.database_manager import Result
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Définition de la commande "task" pour l'application Typer, utilisée pour afficher les tâches les plus urgentes
+@app.command(name="task", help="Afficher les tâches ouvertes les plus urgentes")
+def next_task(
+    # Nombre de tâches affichées
+    limit: Annotated[int, typer.Option(
+        help="Nombre de tâches affichées",
+        min=1)
+        ] = 20,
+
+    # Format de sortie : tableau Rich, ou flux lisible par d'autres programmes
+    output_format: Annotated[str, typer.Option(
+        "--format",
+        help="Format de sortie (rich, json, ndjson, csv ou tsv)")
+        ] = "rich",
+    ) -> None:
+    """
+    Affiche les tâches ouvertes (à faire, en cours) les plus urgentes : priorité décroissante, puis les plus récentes.
+
+    Les tâches sont lues dans l'ordre de l'index (statut, priorité) : la durée dépend du nombre de tâches
+    demandées, et non de la taille de la table.
+
+    Args:
+        limit (Annotated[int, typer.Option]): Le nombre de tâches affichées.
+        output_format (Annotated[str, typer.Option]): Le format de sortie ("rich", "json", "ndjson", "csv" ou "tsv").
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle affiche les résultats via Rich.
+    """
+    # Vérification du format demandé
+    if output_format not in READ_FORMATS:
+        raise typer.BadParameter(f"Format inconnu, formats acceptés : {', '.join(READ_FORMATS)}", param_hint="--format")
+
+    # Lecture des tâches les plus urgentes (une seule requête, k tâches par statut ouvert)
+    tasks: Result = next_from_database(limit)
+
+    # Formats lisibles par d'autres programmes : écriture en flux sur la sortie standard
+    if output_format != "rich":
+        try:
+            write_rows(iter([tasks] if tasks else []), output_format, sys.stdout)
+        except BrokenPipeError:
+            # Lecteur refermé avant la fin (ex: 'head') : fin silencieuse, sans erreur à la fermeture de stdout
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return None
+
+    # Affichage du tableau des tâches
+    Console().print(build_table(tasks, "Tâches les plus urgentes"))
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
@@ -1,17 +1,134 @@
 from typing_extensions import Annotated
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+import csv
+import json
+import os
+import sys
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from manager.database_manager import select_from_database
+from manager.client_manager import iter_select_from_database
+from manager.database_manager import Result
 from manager.constant_manager import *
+from manager.query_manager import COLUMNS, SORTS, parse_expression
 
 
 # Création de l'application Typer principale
 app: typer.Typer = typer.Typer(no_args_is_help=True)
 
+# Style de la colonne "priorité", indexé par le code stocké en base (ordre de PRIORITY)
+PRIORITY_STYLE: List[str] = [
+    ":white_circle: optionnelle",
+    ":blue_circle: basse",
+    ":yellow_circle: moyenne",
+    ":orange_circle: haute",
+    ":red_circle: urgente"
+]
+
+# Style de la colonne "statut", indexé par le code stocké en base (ordre de STATUS)
+STATUS_STYLE: List[str] = [
+    ":exclamation: à faire",
+    ":hourglass_flowing_sand: en cours",
+    ":white_check_mark: terminée",
+    ":x: annulée"
+]
+
+# Formats de sortie acceptés (tous sauf "rich" sont écrits en flux sur la sortie standard)
+READ_FORMATS: List[str] = ["rich", "json", "ndjson", "csv", "tsv"]
+
+def write_rows(pages: Iterator[Result], output_format: str, stream: TextIO) -> Tuple[int, int]:
+    """
+    Écrit les tâches en flux, page par page, dans un format lisible par d'autres programmes.
+
+    Aucune page n'est conservée : la mémoire utilisée ne dépend pas du nombre de tâches.
+    La priorité et le statut sont décodés en libellés.
+
+    Args:
+        pages (Iterator[Result]): Les pages de tâches, dans l'ordre de lecture.
+        output_format (str): Le format ("json", "ndjson", "csv" ou "tsv").
+        stream (TextIO): Le flux de sortie.
+
+    Returns:
+        Tuple[int, int]: Le nombre de tâches écrites et l'identifiant de la dernière d'entre elles (0 si aucune).
+    """
+    count: int = 0
+    last_id: int = 0
+
+    # CSV / TSV : ligne d'en-tête puis une ligne par tâche
+    if output_format in ("csv", "tsv"):
+        writer = csv.writer(stream, delimiter="," if output_format == "csv" else "\t", lineterminator="\n")
+        writer.writerow(COLUMNS)
+        for page in pages:
+            writer.writerows((task[0], task[1], task[2], PRIORITY[task[3]], STATUS[task[4]]) for task in page)
+            count += len(page)
+            last_id = page[-1][0]
+            stream.flush()
+        return count, last_id
+
+    # JSON / NDJSON : un objet par tâche, sérialisé par un encodeur unique (le tableau JSON est ouvert et fermé autour du flux)
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    separator: str = ",\n" if output_format == "json" else "\n"
+    if output_format == "json":
+        stream.write("[\n")
+    for page in pages:
+        lines: str = separator.join(
+            encode({"id": task[0], "label": task[1], "collection": task[2], "priority": PRIORITY[task[3]], "status": STATUS[task[4]]})
+            for task in page)
+        stream.write(f"{separator if count and output_format == 'json' else ''}{lines}{separator if output_format == 'ndjson' else ''}")
+        count += len(page)
+        last_id = page[-1][0]
+        stream.flush()
+    if output_format == "json":
+        stream.write("\n]\n" if count else "]\n")
+
+    return count, last_id
+
+def build_table(tasks: Result, title: Optional[str]) -> Table:
+    """
+    Construit le tableau Rich d'une page de tâches.
+
+    Args:
+        tasks (Result): Les tâches de la page.
+        title (Optional[str]): Le titre du tableau (None pour les pages suivantes).
+
+    Returns:
+        Table: Le tableau prêt à être affiché.
+    """
+    # Création de l'objet Table de Rich pour la présentation des données
+    table: Table = Table(
+        # Titre du tableau
+        title=title, 
+        # Affichage des lignes de séparation
+        show_lines=True, 
+        # Espacement intérieur
+        padding=1,
+        # Style du titre (en gras)
+        title_style="bold"
+        )
+    
+    # Ajout des en-têtes de colonnes au tableau Rich
+    table.add_column("ID")
+    table.add_column("Libellé")
+    table.add_column("Collection")
+    table.add_column("Priorité")
+    table.add_column("Statut")
+
+    # Itération sur chaque tâche de la page
+    for task in tasks:
+        # Ajout d'une ligne au tableau, convertissant les types non-string si nécessaire (ID)
+        table.add_row(
+        str(task[0]),               # ID (converti en str)
+        task[1],                    # Libellé
+        task[2],                    # Collection
+        PRIORITY_STYLE[task[3]],    # Priorité (décodée)
+        STATUS_STYLE[task[4]]       # Statut (décodé)
+        )
+
+    # Retourne le tableau
+    return table
+
 # Définition de la commande "task" pour l'application Typer, utilisée pour rechercher des tâches
 @app.command(name="task", help="Rechercher une ou plusieurs tâches")
 def read_task(
@@ -47,11 +164,66 @@ def read_task(
         formats=STATUS)
         ] = "",
 
+    # Expression de filtre combinée aux autres critères (comparaisons, in, between, ^=, like, not, and, or)
+    where: Annotated[str, typer.Option(
+        help="Expression de filtre (ex: \"priority >= haute and status != terminée\")",
+        show_default="Vide")
+        ] = "",
+
+    # Nombre maximal de tâches affichées
+    limit: Annotated[int, typer.Option(
+        help="Nombre maximal de tâches affichées",
+        show_default="Aucune limite",
+        min=0)
+        ] = 0,
+
+    # Nombre de tâches lues et affichées par page
+    page_size: Annotated[int, typer.Option(
+        help="Nombre de tâches par page",
+        min=1)
+        ] = 100,
+
+    # Colonne de tri (servie par un index), l'identifiant départageant les égalités
+    sort: Annotated[str, typer.Option(
+        help=f"Colonne de tri ({', '.join(SORTS)})",
+        formats=SORTS)
+        ] = "collection",
+
+    # Sens du tri
+    descending: Annotated[bool, typer.Option(
+        "--desc",
+        help="Trier par ordre décroissant")
+        ] = False,
+
+    # Curseur de pagination : identifiant de la dernière tâche déjà affichée
+    after_id: Annotated[int, typer.Option(
+        help="Reprendre l'affichage après la tâche portant cet identifiant",
+        show_default="Vide")
+        ] = 0,
+
+    # Format de sortie : tableaux Rich, ou flux lisible par d'autres programmes
+    output_format: Annotated[str, typer.Option(
+        "--format",
+        help="Format de sortie (rich, json, ndjson, csv ou tsv)")
+        ] = "rich",
+
+    # Inclusion des tâches archivées (archive task)
+    archived: Annotated[bool, typer.Option(
+        "--archived",
+        help="Inclure les tâches archivées")
+        ] = False,
+
     ) -> None:
     """
     Recherche et affiche des tâches de la base de données en fonction des options de filtrage fournies.
 
-    Affiche les résultats dans un tableau formaté par Rich.
+    Les résultats sont lus et affichés page par page dans des tableaux formatés par Rich :
+    la première page s'affiche immédiatement et la mémoire utilisée ne dépend pas du nombre de tâches.
+    Les formats json, ndjson, csv et tsv écrivent les tâches en flux sur la sortie standard, sans tableau Rich,
+    pour être enchaînés à d'autres programmes (jq, tableurs...).
+    Les tâches sont triées par collection (ou par priorité, ou par identifiant avec --sort), puis par identifiant ;
+    --desc inverse l'ordre et --after-id reprend après une tâche dans ce même ordre.
+    Avec --archived, les tâches archivées sont fusionnées dans le même ordre avec les tâches actives.
 
     Args:
         id (Annotated[int, typer.Option]): L'identifiant unique de la tâche (0 par défaut, ignoré si non spécifié).
@@ -59,11 +231,39 @@ def read_task(
         collection (Annotated[str, typer.Option]): La collection de la tâche.
         priority (Annotated[str, typer.Option]): Le niveau de priorité de la tâche.
         status (Annotated[str, typer.Option]): Le statut actuel de la tâche.
+        where (Annotated[str, typer.Option]): L'expression de filtre, évaluée par SQLite.
+        limit (Annotated[int, typer.Option]): Le nombre maximal de tâches affichées (0 pour aucune limite).
+        page_size (Annotated[int, typer.Option]): Le nombre de tâches par page.
+        sort (Annotated[str, typer.Option]): La colonne de tri ("collection", "priority" ou "id").
+        descending (Annotated[bool, typer.Option]): Trie par ordre décroissant.
+        after_id (Annotated[int, typer.Option]): L'identifiant de la dernière tâche déjà affichée.
+        output_format (Annotated[str, typer.Option]): Le format de sortie ("rich", "json", "ndjson", "csv" ou "tsv").
+        archived (Annotated[bool, typer.Option]): Inclut les tâches archivées.
 
     Returns:
         None: La fonction ne retourne rien explicitement, elle affiche les résultats via Rich.
     """
-    
+    # Vérification du format demandé
+    if output_format not in READ_FORMATS:
+        raise typer.BadParameter(f"Format inconnu, formats acceptés : {', '.join(READ_FORMATS)}", param_hint="--format")
+
+    # Vérification de la colonne de tri
+    if sort not in SORTS:
+        raise typer.BadParameter(f"Tri inconnu, tris acceptés : {', '.join(SORTS)}", param_hint="--sort")
+
+    # Vérification de la priorité et du statut (valeurs des constantes), avant toute lecture ou écriture
+    if priority and priority not in PRIORITY:
+        raise typer.BadParameter(f"Priorité inconnue : {priority} (valeurs possibles : {', '.join(PRIORITY)})", param_hint="--priority")
+    if status and status not in STATUS:
+        raise typer.BadParameter(f"Statut inconnu : {status} (valeurs possibles : {', '.join(STATUS)})", param_hint="--status")
+
+    # Vérification de l'expression de filtre, avant toute lecture ou écriture
+    try:
+        if where:
+            parse_expression(where)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--where")
+
     # Construction du dictionnaire des critères de recherche
     options: Dict[str, int | str] = {
         "id": id,
@@ -71,66 +271,47 @@ def read_task(
         "collection": collection,
         "priority": priority,
         "status": status,
+        "where": where,
         }
 
-    # Appel de la fonction pour récupérer la liste des tâches (Row = Tuple[Any, ...])
-    tasks: List[Tuple[Any, ...]] = select_from_database(options)
-
-    # Création de l'objet Table de Rich pour la présentation des données
-    table: Table = Table(
-        # Titre du tableau
-        title="Liste des tâches", 
-        # Affichage des lignes de séparation
-        show_lines=True, 
-        # Espacement intérieur
-        padding=1,
-        # Style du titre (en gras)
-        title_style="bold"
-        )
-    
-    # Ajout des en-têtes de colonnes au tableau Rich
-    table.add_column("ID")
-    table.add_column("Libellé")
-    table.add_column("Collection")
-    table.add_column("Priorité")
-    table.add_column("Statut")
+    # Formats lisibles par d'autres programmes : écriture en flux directement depuis le curseur
+    if output_format != "rich":
+        try:
+            count, last_id = write_rows(
+                iter_select_from_database(options, after_id=after_id, limit=limit, page_size=page_size, sort=sort, descending=descending,
+                                          archived=archived),
+                output_format, sys.stdout)
+        except BrokenPipeError:
+            # Lecteur refermé avant la fin (ex: 'head') : fin silencieuse, sans erreur à la fermeture de stdout
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return None
 
-    # Style de la colonne "priorité"
-    priority_style: Dict[str, str] = {
-        "optionnelle": ":white_circle: optionnelle",
-        "basse": ":blue_circle: basse",
-        "moyenne": ":yellow_circle: moyenne",
-        "haute": ":orange_circle: haute",
-        "urgente": ":red_circle: urgente"
-    }
-
-    # Style de la colonne "statut"
-    status_style: Dict[str, str] = {
-        "à faire": ":exclamation: à faire",
-        "en cours": ":hourglass_flowing_sand: en cours",
-        "terminée": ":white_check_mark: terminée",
-        "annulée": ":x: annulée"
-    }
-
-    # Itération sur chaque tâche récupérée depuis la base de données
-    for task in tasks:
-        # Ajout d'une ligne au tableau, convertissant les types non-string si nécessaire (ID)
-        table.add_row(
-        str(task[0]),               # ID (converti en str)
-        task[1],                    # Libellé
-        task[2],                    # Collection
-        priority_style[task[3]],    # Priorité
-        status_style[task[4]]       # Statut
-        )
+        # Indication de la suite sur la sortie d'erreur, pour ne pas polluer le flux de données
+        if limit and count == limit:
+            typer.echo(f"Suite : --after-id {last_id}", err=True)
+        return None
 
-    # Création de l'objet Console Rich
+    # Création de l'objet Console Rich (la console n'est pas effacée : l'historique du terminal et du shell est conservé)
     console: Console = Console()
 
-    # Efface le contenu de la console avant l'affichage du tableau
-    console.clear()
+    # Nombre de tâches affichées et identifiant de la dernière d'entre elles
+    count: int = 0
+    last_id: int = after_id
+
+    # Affichage de chaque page dès sa lecture (le titre n'apparaît que sur la première)
+    for page in iter_select_from_database(options, after_id=after_id, limit=limit, page_size=page_size, sort=sort, descending=descending,
+                                          archived=archived):
+        console.print(build_table(page, "Liste des tâches" if not count else None))
+        count += len(page)
+        last_id = page[-1][0]
+
+    # Tableau vide si aucune tâche ne correspond
+    if not count:
+        console.print(build_table([], "Liste des tâches"))
 
-    # Affiche le tableau Rich formaté dans la console
-    console.print(table)
+    # Indique comment afficher la suite lorsque la limite a été atteinte
+    if limit and count == limit:
+        console.print(f"Suite : --after-id {last_id}")
     
     # Retourne explicitement None car la fonction ne doit pas retourner de valeur
     return None
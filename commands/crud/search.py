@@ -0,0 +1,115 @@
+from typing_extensions import Annotated
+from typing import Dict
+import sqlite3
+
+import typer
+from rich.console import Console
+
+from commands.crud.read import build_table
+from manager.client_manager import ServerError, search_database
+from manager.constant_manager import *
+from manager.query_manager import parse_expression
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Définition de la commande "task" pour l'application Typer, utilisée pour rechercher des tâches en plein texte
+@app.command(name="task", help="Rechercher des tâches en plein texte (libellé et collection)")
+def search_task(
+    # Requête plein texte (syntaxe FTS5)
+    text: Annotated[str, typer.Argument(
+        help="Texte recherché : mots, \"expression exacte\", préfixe*, OR, NOT")
+        ],
+
+    # Paramètre pour filtrer par la collection de la tâche
+    collection: Annotated[str, typer.Option(
+        help="Recherche par la collection",
+        show_default="Vide")
+        ] = "",
+
+    # Paramètre pour filtrer par la priorité, avec formatage basé sur les constantes
+    priority: Annotated[str, typer.Option(
+        help="Recherche par la priorité",
+        show_default="Vide",
+        formats=PRIORITY)
+        ] = "",
+
+    # Paramètre pour filtrer par le statut, avec formatage basé sur les constantes
+    status: Annotated[str, typer.Option(
+        help="Recherche par le statut",
+        show_default="Vide",
+        formats=STATUS)
+        ] = "",
+
+    # Expression de filtre combinée aux autres critères (comparaisons, in, between, ^=, like, not, and, or)
+    where: Annotated[str, typer.Option(
+        help="Expression de filtre (ex: \"priority >= haute and status != terminée\")",
+        show_default="Vide")
+        ] = "",
+
+    # Nombre maximal de tâches affichées
+    limit: Annotated[int, typer.Option(
+        help="Nombre maximal de tâches affichées",
+        min=1)
+        ] = 50,
+    ) -> None:
+    """
+    Recherche des tâches dans l'index plein texte et les affiche de la plus pertinente à la moins pertinente.
+
+    Args:
+        text (Annotated[str, typer.Argument]): La requête plein texte (syntaxe FTS5).
+        collection (Annotated[str, typer.Option]): La collection de la tâche.
+        priority (Annotated[str, typer.Option]): Le niveau de priorité de la tâche.
+        status (Annotated[str, typer.Option]): Le statut actuel de la tâche.
+        where (Annotated[str, typer.Option]): L'expression de filtre, évaluée par SQLite.
+        limit (Annotated[int, typer.Option]): Le nombre maximal de tâches affichées.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle affiche les résultats via Rich.
+    """
+    # Vérification de la priorité et du statut (valeurs des constantes), avant toute lecture ou écriture
+    if priority and priority not in PRIORITY:
+        raise typer.BadParameter(f"Priorité inconnue : {priority} (valeurs possibles : {', '.join(PRIORITY)})", param_hint="--priority")
+    if status and status not in STATUS:
+        raise typer.BadParameter(f"Statut inconnu : {status} (valeurs possibles : {', '.join(STATUS)})", param_hint="--status")
+
+    # Vérification de l'expression de filtre, avant toute lecture ou écriture
+    try:
+        if where:
+            parse_expression(where)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--where")
+
+    # Construction du dictionnaire des critères de filtrage complémentaires
+    options: Dict[str, str] = {
+        "collection": collection.lower().strip(),
+        "priority": priority,
+        "status": status,
+        "where": where,
+        }
+
+    # Création de l'objet Console Rich
+    console: Console = Console()
+
+    try:
+        # Affichage de chaque page dès sa lecture (le titre n'apparaît que sur la première)
+        count: int = 0
+        for page in search_database(text, options, limit=limit, page_size=limit):
+            console.print(build_table(page, f"Résultats pour « {text} »" if not count else None))
+            count += len(page)
+    except (sqlite3.OperationalError, ServerError) as error:
+        # Requête plein texte mal formée (guillemet non fermé, opérateur isolé...)
+        raise typer.BadParameter(str(error), param_hint="TEXT")
+
+    # Message explicite si aucune tâche ne correspond
+    if not count:
+        typer.echo("Aucune tâche ne correspond à la recherche")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
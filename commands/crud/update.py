@@ -1,10 +1,11 @@
 from typing_extensions import Annotated
-from typing import Dict, Tuple, Any
+from typing import Dict, List, Tuple, Any
 
 import typer
 
-from manager.database_manager import update_from_database
+from manager.client_manager import ServerError, update_from_database
 from manager.constant_manager import *
+from manager.query_manager import parse_expression, parse_ids
 
 
 # Création de l'application Typer principale
@@ -15,41 +16,47 @@ app: typer.Typer = typer.Typer(no_args_is_help=True)
 def update_task(
     # --- Critères de sélection (Clause WHERE) ---
 
-    # Critère de sélection par ID
-    expr_id: Annotated[int, typer.Option(
+    # Critère de sélection par ID : liste d'identifiants et d'intervalles (ex: 3,8,100-2000)
+    expr_id: Annotated[str, typer.Option(
         "--where-id",
-        help="Condition sur l'id",
+        help="Condition sur l'id (liste et intervalles, ex: 3,8,100-2000)",
         show_default="Vide")
-        ] = 0,
+        ] = "",
 
-    # Critère de sélection par libellé
-    expr_label: Annotated[str, typer.Option(
+    # Critère de sélection par libellé (option répétable)
+    expr_label: Annotated[List[str], typer.Option(
         "--where-label",
-        help="Condition sur le libellé",
+        help="Condition sur le libellé (répétable)",
         show_default="Vide")
-        ] = "",
+        ] = [],
 
-    # Critère de sélection par collection
-    expr_collection: Annotated[str, typer.Option(
+    # Critère de sélection par collection (option répétable)
+    expr_collection: Annotated[List[str], typer.Option(
         "--where-collection",
-        help="Condition sur la collection",
+        help="Condition sur la collection (répétable)",
         show_default="Vide",)
-        ] = "",
+        ] = [],
 
-    # Critère de sélection par priorité, avec formatage basé sur les constantes
-    expr_priority: Annotated[str, typer.Option(
+    # Critère de sélection par priorité, avec formatage basé sur les constantes (option répétable)
+    expr_priority: Annotated[List[str], typer.Option(
         "--where-priority",
-        help="Condition sur la priorité",
+        help="Condition sur la priorité (répétable)",
         show_default="Vide",
         formats=PRIORITY)
-        ] = "",
+        ] = [],
 
-    # Critère de sélection par statut, avec formatage basé sur les constantes
-    expr_status: Annotated[str, typer.Option(
+    # Critère de sélection par statut, avec formatage basé sur les constantes (option répétable)
+    expr_status: Annotated[List[str], typer.Option(
         "--where-status",
-        help="Condition sur le statut",
+        help="Condition sur le statut (répétable)",
         show_default="Vide",
         formats=STATUS)
+        ] = [],
+
+    # Expression de filtre combinée aux autres critères (comparaisons, in, between, ^=, like, not, and, or)
+    where: Annotated[str, typer.Option(
+        help="Expression de filtre (ex: \"priority >= haute and status != terminée\")",
+        show_default="Vide")
         ] = "",
 
     # --- Colonnes à mettre à jour (Clause SET) ---
@@ -88,13 +95,16 @@ def update_task(
     Met à jour une ou plusieurs tâches dans la base de données.
 
     Nécessite à la fois des critères de sélection (WHERE) et des valeurs à modifier (SET).
+    Chaque critère accepte plusieurs valeurs : toutes les tâches ciblées sont modifiées par une seule requête,
+    dans une seule transaction.
 
     Args:
-        expr_id (Annotated[int, typer.Option]): Critère WHERE sur l'ID de la tâche.
-        expr_label (Annotated[str, typer.Option]): Critère WHERE sur le libellé.
-        expr_collection (Annotated[str, typer.Option]): Critère WHERE sur la collection.
-        expr_priority (Annotated[str, typer.Option]): Critère WHERE sur la priorité.
-        expr_status (Annotated[str, typer.Option]): Critère WHERE sur le statut.
+        expr_id (Annotated[str, typer.Option]): Critère WHERE sur l'ID de la tâche (identifiants et intervalles).
+        expr_label (Annotated[List[str], typer.Option]): Critère WHERE sur le libellé.
+        expr_collection (Annotated[List[str], typer.Option]): Critère WHERE sur la collection.
+        expr_priority (Annotated[List[str], typer.Option]): Critère WHERE sur la priorité.
+        expr_status (Annotated[List[str], typer.Option]): Critère WHERE sur le statut.
+        where (Annotated[str, typer.Option]): L'expression de filtre WHERE, évaluée par SQLite.
         column_label (Annotated[str, typer.Option]): Nouvelle valeur SET pour le libellé.
         column_collection (Annotated[str, typer.Option]): Nouvelle valeur SET pour la collection.
         column_priority (Annotated[str, typer.Option]): Nouvelle valeur SET pour la priorité.
@@ -112,13 +122,27 @@ def update_task(
         "status": column_status,
     }
 
-    # Création du dictionnaire des critères de sélection (Clause WHERE)
-    options: Dict[str, int | str] = {
-        "id": expr_id,
+    # Analyse de la liste d'identifiants et d'intervalles
+    try:
+        ids: List[Any] = parse_ids(expr_id)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--where-id")
+
+    # Vérification de l'expression de filtre, avant toute lecture ou écriture
+    try:
+        if where:
+            parse_expression(where)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--where")
+
+    # Création du dictionnaire des critères de sélection (Clause WHERE), chaque critère pouvant avoir plusieurs valeurs
+    options: Dict[str, Any] = {
+        "id": ids,
         "label": expr_label,
         "collection": expr_collection,
         "priority": expr_priority,
         "status": expr_status,
+        "where": where,
     }
 
     # Vérifie si au moins une colonne à mettre à jour a été renseignée
@@ -146,11 +170,14 @@ def update_task(
 
     # Cas 4 : Tout est correct (colonnes SET et critères WHERE sont présents)
     else:
-        # Exécute la mise à jour des tâches dans la base de données
-        update_from_database(columns, options)
-
-        # Affichage d'un message de confirmation à l'utilisateur
-        typer.echo(f"Modification effectuée !")
+        # Exécute la mise à jour des tâches dans la base de données (valeur inconnue, y compris refusée par le serveur : erreur d'usage)
+        try:
+            count: int = update_from_database(columns, options)
+        except (ValueError, ServerError) as error:
+            raise typer.BadParameter(str(error))
+
+        # Affichage d'un message de confirmation avec le nombre de tâches modifiées
+        typer.echo(f"Modification effectuée : {count} tâche(s) modifiée(s)")
         
     # Retourne explicitement None car la fonction ne doit pas retourner de valeur
     return None
@@ -0,0 +1,74 @@
+from typing_extensions import Annotated
+from typing import List
+
+import typer
+
+from manager.archive_manager import INCREMENTAL, archive_tasks, enable_incremental_vacuum, get_auto_vacuum, reclaim_space
+from manager.connection_manager import ConnectionManager
+from manager.shard_manager import databases
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Définition de la commande "task" pour l'application Typer, utilisée pour archiver les tâches achevées
+@app.command(name="task", help="Archiver les tâches terminées ou annulées depuis plusieurs jours")
+def archive_task(
+    # Ancienneté minimale de la fin des tâches archivées
+    older_than: Annotated[float, typer.Option(
+        help="Ancienneté minimale de la fin de la tâche, en jours",
+        min=0)
+        ] = 30,
+
+    # Nombre de tâches déplacées par transaction
+    batch_size: Annotated[int, typer.Option(
+        help="Nombre de tâches déplacées par transaction",
+        min=1)
+        ] = 1000,
+
+    # Conversion d'une base existante au mode auto_vacuum incrémental
+    vacuum: Annotated[bool, typer.Option(
+        "--vacuum",
+        help="Convertir la base au mode auto_vacuum incrémental (reconstruction complète, une seule fois)")
+        ] = False,
+    ) -> None:
+    """
+    Déplace les tâches terminées ou annulées depuis plus de `older_than` jours dans la table d'archive, par lots,
+    puis rend au système de fichiers les pages libérées.
+
+    Les tâches archivées ne sont plus lues, modifiées ni recherchées par les autres commandes ; read task --archived
+    les affiche avec les tâches actives.
+
+    Args:
+        older_than (Annotated[float, typer.Option]): L'ancienneté minimale de la fin de la tâche, en jours.
+        batch_size (Annotated[int, typer.Option]): Le nombre de tâches déplacées par transaction.
+        vacuum (Annotated[bool, typer.Option]): Convertit la base au mode auto_vacuum incrémental si nécessaire.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle utilise typer.echo pour l'affichage.
+    """
+    # Chaque base (ou fragment) archive ses propres tâches
+    managers: List[ConnectionManager] = databases()
+    archived: int = 0
+    freed: int = 0
+    for manager in managers:
+        archived += archive_tasks(older_than, batch_size, manager)
+
+        # Base créée avant le mode incrémental : conversion sur demande seulement (réécriture complète du fichier)
+        if get_auto_vacuum(manager) != INCREMENTAL:
+            if not vacuum:
+                typer.echo(f"⚠️ Mode auto_vacuum incrémental inactif ({manager.database}) : "
+                           "l'espace libéré n'est pas rendu, relancer avec --vacuum pour convertir la base")
+                continue
+            enable_incremental_vacuum(manager)
+        freed += reclaim_space(manager)
+
+    typer.echo(f"Archivage effectué : {archived} tâche(s) archivée(s), {freed} page(s) libérée(s)")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,162 @@
+from typing_extensions import Annotated
+from typing import Iterator, List
+import json
+import os
+import sys
+
+import typer
+
+from manager.constant_manager import *
+from manager.change_manager import compact_changes, iter_changes, last_change
+from manager.connection_manager import ConnectionManager
+from manager.database_manager import Result
+from manager.shard_manager import databases
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+def parse_cursor(cursor: str, count: int) -> List[int]:
+    """
+    Analyse un curseur de reprise : une séquence par base, séparées par des virgules (une seule sans fragments).
+
+    Args:
+        cursor (str): Le curseur (vide pour lire tout le journal).
+        count (int): Le nombre de bases (fragments).
+
+    Returns:
+        List[int]: La dernière séquence déjà lue de chaque base.
+
+    Raises:
+        typer.BadParameter: Si le curseur n'est pas une liste d'entiers d'une séquence par base.
+    """
+    if not cursor:
+        return [0] * count
+    try:
+        sequences: List[int] = [int(value) for value in cursor.split(",")]
+    except ValueError:
+        raise typer.BadParameter(f"Curseur invalide : {cursor}", param_hint="--since")
+    if len(sequences) != count:
+        raise typer.BadParameter(f"Curseur invalide : {count} séquence(s) attendue(s), une par base", param_hint="--since")
+    return sequences
+
+def write_changes(pages: Iterator[Result], shard: int, sharded: bool) -> int:
+    """
+    Écrit les changements en flux sur la sortie standard, un objet JSON par ligne.
+
+    Args:
+        pages (Iterator[Result]): Les pages de changements, dans l'ordre du journal.
+        shard (int): Le numéro de la base lue.
+        sharded (bool): Ajoute le numéro du fragment à chaque changement.
+
+    Returns:
+        int: La séquence du dernier changement écrit (0 si aucun).
+    """
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    last: int = 0
+    for page in pages:
+        lines: str = "".join(
+            encode({
+                "seq": seq,
+                "op": operation,
+                "id": task_id,
+                "label": label,
+                "collection": collection,
+                "priority": None if priority is None else PRIORITY[priority],
+                "status": None if status is None else STATUS[status],
+                **({"shard": shard} if sharded else {}),
+            }) + "\n"
+            for seq, operation, task_id, label, collection, priority, status in page)
+        sys.stdout.write(lines)
+        sys.stdout.flush()
+        last = page[-1][0]
+    return last
+
+# Définition de la commande "task" pour l'application Typer, utilisée pour exporter les changements
+@app.command(name="task", help="Exporter en NDJSON les changements des tâches depuis un curseur")
+def changes_task(
+    # Curseur de reprise : dernière séquence déjà lue (une par fragment, séparées par des virgules)
+    since: Annotated[str, typer.Option(
+        help="Dernière séquence déjà lue (une par fragment, séparées par des virgules)",
+        show_default="Début du journal")
+        ] = "",
+
+    # Limite du nombre de changements
+    limit: Annotated[int, typer.Option(
+        help="Nombre maximal de changements (par fragment)",
+        show_default="Aucune",
+        min=0)
+        ] = 0,
+    ) -> None:
+    """
+    Écrit sur la sortie standard les changements (insert, update, delete) postérieurs au curseur, un objet JSON par ligne.
+
+    Chaque changement porte sa séquence, l'opération, l'identifiant de la tâche et ses nouvelles valeurs (nulles pour
+    une suppression). Le curseur à passer à l'appel suivant est affiché sur la sortie d'erreur.
+
+    Args:
+        since (Annotated[str, typer.Option]): La dernière séquence déjà lue de chaque base.
+        limit (Annotated[int, typer.Option]): Le nombre maximal de changements par base.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle écrit les changements sur la sortie standard.
+    """
+    # Une séquence par base : les fragments ont chacun leur journal
+    managers: List[ConnectionManager] = databases()
+    sequences: List[int] = parse_cursor(since, len(managers))
+
+    # Lecture des journaux l'un après l'autre (chaque journal est ordonné, les fragments sont indépendants)
+    try:
+        for shard, manager in enumerate(managers):
+            sequences[shard] = write_changes(iter_changes(sequences[shard], limit, manager=manager), shard, len(managers) > 1) or sequences[shard]
+    except BrokenPipeError:
+        # Lecteur refermé avant la fin (ex: 'head') : fin silencieuse, sans erreur à la fermeture de stdout
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return None
+
+    # Curseur de reprise sur la sortie d'erreur (la sortie standard ne contient que les changements)
+    typer.echo(f"Suite : --since {','.join(map(str, sequences))}", err=True)
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Définition de la commande "compact" pour l'application Typer, utilisée pour compacter le journal des changements
+@app.command(name="compact", help="Compacter le journal : ne garder que le dernier changement de chaque tâche")
+def changes_compact(
+    # Dernière séquence compactée (une par fragment, séparées par des virgules)
+    before: Annotated[str, typer.Option(
+        help="Dernière séquence compactée (une par fragment, séparées par des virgules)",
+        show_default="Tout le journal")
+        ] = "",
+
+    # Suppression des marques de suppression
+    drop_deletes: Annotated[bool, typer.Option(
+        "--drop-deletes",
+        help="Supprimer aussi les marques de suppression (les consommateurs en retard ne les verront pas)")
+        ] = False,
+    ) -> None:
+    """
+    Compacte le journal des changements : jusqu'au curseur, seul le dernier changement de chaque tâche est conservé.
+
+    Args:
+        before (Annotated[str, typer.Option]): La dernière séquence compactée de chaque base.
+        drop_deletes (Annotated[bool, typer.Option]): Supprime aussi les marques de suppression.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle utilise typer.echo pour l'affichage.
+    """
+    managers: List[ConnectionManager] = databases()
+    sequences: List[int] = parse_cursor(before, len(managers))
+
+    # Compaction de chaque journal jusqu'à sa séquence (tout le journal si elle vaut 0)
+    removed: int = sum(compact_changes(sequence, drop_deletes, manager) for sequence, manager in zip(sequences, managers))
+    typer.echo(f"{removed} changement(s) supprimé(s) du journal")
+    typer.echo(f"Dernière séquence : {','.join(str(last_change(manager)) for manager in managers)}")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,92 @@
+from typing_extensions import Annotated
+from typing import Any, Dict
+
+import typer
+
+from manager.cache_manager import cache
+from manager.connection_manager import PROFILES, get_manager
+from manager.database_manager import get_pragmas
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Définition de la commande "profile" pour l'application Typer
+@app.command(name="profile", help="Afficher le profil de performance SQLite appliqué")
+def diagnostic_profile() -> None:
+    """
+    Affiche le profil de performance configuré et la valeur effective de chacun de ses PRAGMA.
+
+    Le profil se choisit via la variable d'environnement TASK_MANAGER_PROFILE ou la clé "profile"
+    de la section [database] du fichier task_manager.toml.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle utilise typer.echo pour l'affichage.
+    """
+    # Gestionnaire de connexions partagé et PRAGMA attendus
+    manager = get_manager()
+    expected: Dict[str, Any] = manager.pragmas
+
+    # Lecture des valeurs effectivement appliquées par SQLite
+    actual: Dict[str, Any] = get_pragmas(expected)
+
+    # Affichage du profil et de la base de données concernée
+    typer.echo(f"Base de données : {manager.database}")
+    typer.echo(f"Profil : {manager.profile} (disponibles : {', '.join(PROFILES)})")
+
+    # Affichage de chaque PRAGMA : valeur configurée et valeur effective
+    for pragma, value in expected.items():
+        typer.echo(f"  {pragma:<13} configuré = {value!s:<12} effectif = {actual[pragma]}")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Définition de la commande "cache" pour l'application Typer
+@app.command(name="cache", help="Afficher la configuration et les statistiques du cache des lectures")
+def diagnostic_cache(
+    clear: Annotated[bool, typer.Option(
+        "--clear",
+        help="Vider le cache (mémoire et disque) après l'affichage")
+        ] = False,
+    ) -> None:
+    """
+    Affiche la configuration du cache des lectures et ses statistiques.
+
+    Les statistiques du processus couvrent toutes les lectures du shell ou du serveur ; celles du cache sur disque
+    sont cumulées par toutes les exécutions de la CLI depuis le dernier vidage. Le détail de chaque lecture servie
+    par le cache figure dans les logs (opération "SELECT CACHED", avec le temps économisé).
+
+    Args:
+        clear (Annotated[bool, typer.Option]): Vide le cache après l'affichage.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle utilise typer.echo pour l'affichage.
+    """
+    # Configuration du cache
+    typer.echo(f"Cache en mémoire : {cache.size} lecture(s){'' if cache.size else ' (désactivé)'}")
+    typer.echo(f"Cache sur disque : {cache.directory or '(désactivé)'}")
+    typer.echo(f"Résultats conservés jusqu'à {cache.max_rows} ligne(s)")
+
+    # Statistiques du processus
+    typer.echo("Processus courant :")
+    for name, value in cache.stats().items():
+        typer.echo(f"  {name:<9} = {value}")
+
+    # Statistiques partagées du cache sur disque
+    if cache.directory:
+        typer.echo(f"Cache sur disque (toutes les exécutions, limite de {cache.max_bytes} octets) :")
+        for name, value in cache.disk_stats().items():
+            typer.echo(f"  {name:<9} = {value}")
+
+    # Vidage éventuel
+    if clear:
+        cache.clear()
+        typer.echo("Cache vidé !")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
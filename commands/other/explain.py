@@ -0,0 +1,241 @@
+from typing_extensions import Annotated
+from typing import Any, Dict, List
+
+import typer
+
+from manager.constant_manager import *
+from manager.database_manager import (
+    PlanStep,
+    build_delete_query,
+    build_next_query,
+    build_search_query,
+    build_select_query,
+    build_update_query,
+    explain_query,
+)
+from manager.query_manager import SORTS, parse_ids
+from manager.shard_manager import databases
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Opérations dont le plan d'exécution peut être affiché
+EXPLAIN_OPERATIONS: List[str] = ["read", "next", "search", "update", "delete"]
+
+def is_full_scan(detail: str) -> bool:
+    """
+    Indique si une étape du plan parcourt toute la table 'task', directement ou dans l'ordre d'un index.
+
+    Args:
+        detail (str): La description de l'étape (ex: "SCAN task", "SCAN task USING INDEX ...", "SEARCH task USING INDEX ...").
+
+    Returns:
+        bool: True pour un parcours complet (aucun index ne restreint les lignes lues).
+    """
+    return detail == "SCAN task" or detail.startswith("SCAN task USING")
+
+def parse_assignments(assignments: List[str]) -> Dict[str, str]:
+    """
+    Analyse les colonnes à modifier d'une mise à jour (ex: "status=terminée").
+
+    Args:
+        assignments (List[str]): Les affectations "colonne=valeur".
+
+    Returns:
+        Dict[str, str]: Les nouvelles valeurs indexées par nom de colonne.
+
+    Raises:
+        typer.BadParameter: Si une affectation ne contient pas de signe '='.
+    """
+    columns: Dict[str, str] = {}
+    for assignment in assignments:
+        column, separator, value = assignment.partition("=")
+        if not separator:
+            raise typer.BadParameter(f"Affectation invalide : {assignment} (attendu : colonne=valeur)", param_hint="--set")
+        columns[column.strip()] = value
+    return columns
+
+# Définition de la commande "task" pour l'application Typer, utilisée pour afficher le plan d'une requête
+@app.command(name="task", help="Afficher le plan d'exécution (EXPLAIN QUERY PLAN) d'une lecture, recherche, modification ou suppression")
+def explain_task(
+    # Opération dont le plan est affiché
+    operation: Annotated[str, typer.Option(
+        help=f"Opération ({', '.join(EXPLAIN_OPERATIONS)})",
+        formats=EXPLAIN_OPERATIONS)
+        ] = "read",
+
+    # Critère sur l'identifiant : liste d'identifiants et d'intervalles (ex: 3,8,100-2000)
+    id: Annotated[str, typer.Option(
+        help="Critère sur l'identifiant (liste et intervalles, ex: 3,8,100-2000)",
+        show_default="Vide")
+        ] = "",
+
+    # Critère sur le libellé (option répétable)
+    label: Annotated[List[str], typer.Option(
+        help="Critère sur le libellé (répétable)",
+        show_default="Vide")
+        ] = [],
+
+    # Critère sur la collection (option répétable)
+    collection: Annotated[List[str], typer.Option(
+        help="Critère sur la collection (répétable)",
+        show_default="Vide")
+        ] = [],
+
+    # Critère sur la priorité, avec formatage basé sur les constantes (option répétable)
+    priority: Annotated[List[str], typer.Option(
+        help="Critère sur la priorité (répétable)",
+        show_default="Vide",
+        formats=PRIORITY)
+        ] = [],
+
+    # Critère sur le statut, avec formatage basé sur les constantes (option répétable)
+    status: Annotated[List[str], typer.Option(
+        help="Critère sur le statut (répétable)",
+        show_default="Vide",
+        formats=STATUS)
+        ] = [],
+
+    # Expression de filtre combinée aux autres critères (comparaisons, in, between, ^=, like, not, and, or)
+    where: Annotated[str, typer.Option(
+        help="Expression de filtre (ex: \"priority >= haute and status != terminée\")",
+        show_default="Vide")
+        ] = "",
+
+    # Texte recherché (opération "search")
+    text: Annotated[str, typer.Option(
+        help="Requête plein texte (opération search)",
+        show_default="Vide")
+        ] = "",
+
+    # Colonnes modifiées (opération "update")
+    assignments: Annotated[List[str], typer.Option(
+        "--set",
+        help="Colonne modifiée, sous la forme colonne=valeur (opération update, répétable)",
+        show_default="Vide")
+        ] = [],
+
+    # Reprise après une tâche (opération "read")
+    after_id: Annotated[int, typer.Option(
+        help="Reprise après l'identifiant (opération read)",
+        show_default="Aucune")
+        ] = 0,
+
+    # Limite du nombre de tâches (opérations "read", "next" et "search")
+    limit: Annotated[int, typer.Option(
+        help="Nombre maximal de tâches (opérations read, next et search)",
+        show_default="Aucune")
+        ] = 0,
+
+    # Colonne et sens du tri (opération "read")
+    sort: Annotated[str, typer.Option(
+        help=f"Colonne de tri ({', '.join(SORTS)}) (opération read)",
+        formats=SORTS)
+        ] = "collection",
+    descending: Annotated[bool, typer.Option(
+        "--desc",
+        help="Tri décroissant (opération read)")
+        ] = False,
+
+    # Inclusion des tâches archivées (opération "read")
+    archived: Annotated[bool, typer.Option(
+        "--archived",
+        help="Inclure les tâches archivées (opération read)")
+        ] = False,
+    ) -> None:
+    """
+    Affiche le plan d'exécution de la requête construite pour une opération et une combinaison de critères.
+
+    La requête est celle que construit la couche de données pour ces critères : le plan indique si un index
+    est utilisé ou si toute la table est parcourue. Une modification ou une suppression n'est jamais appliquée.
+
+    Args:
+        operation (Annotated[str, typer.Option]): L'opération ("read", "next", "search", "update" ou "delete").
+        id (Annotated[str, typer.Option]): Les identifiants et intervalles d'identifiants.
+        label (Annotated[List[str], typer.Option]): Les libellés.
+        collection (Annotated[List[str], typer.Option]): Les collections.
+        priority (Annotated[List[str], typer.Option]): Les niveaux de priorité.
+        status (Annotated[List[str], typer.Option]): Les statuts.
+        where (Annotated[str, typer.Option]): L'expression de filtre.
+        text (Annotated[str, typer.Option]): La requête plein texte (search).
+        assignments (Annotated[List[str], typer.Option]): Les colonnes modifiées "colonne=valeur" (update).
+        after_id (Annotated[int, typer.Option]): L'identifiant de reprise (read).
+        limit (Annotated[int, typer.Option]): Le nombre maximal de tâches (read, next et search).
+        sort (Annotated[str, typer.Option]): La colonne de tri (read).
+        descending (Annotated[bool, typer.Option]): Trie par ordre décroissant (read).
+        archived (Annotated[bool, typer.Option]): Inclut les tâches archivées (read).
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle utilise typer.echo pour l'affichage.
+    """
+    # Vérification de l'opération
+    if operation not in EXPLAIN_OPERATIONS:
+        raise typer.BadParameter(f"Opération inconnue : {operation} (valeurs possibles : {', '.join(EXPLAIN_OPERATIONS)})", param_hint="--operation")
+
+    # Analyse de la liste d'identifiants et d'intervalles
+    try:
+        ids: List[Any] = parse_ids(id)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--id")
+
+    # Construction du dictionnaire des critères, chaque critère pouvant avoir plusieurs valeurs
+    options: Dict[str, Any] = {
+        "id": ids,
+        "label": label,
+        "collection": collection,
+        "priority": priority,
+        "status": status,
+        "where": where,
+    }
+
+    # Requête construite par la couche de données pour cette opération (critère ou valeur invalide : erreur d'usage)
+    try:
+        if operation == "read":
+            query, data = build_select_query(options, after_id, limit, sort, descending, archived=archived)
+        elif operation == "next":
+            query, data = build_next_query(limit or 20)
+        elif operation == "search":
+            if not text:
+                raise typer.BadParameter("Requête plein texte requise pour l'opération search", param_hint="--text")
+            query, data = build_search_query(text, options, limit)
+        elif operation == "update":
+            query, data = build_update_query(parse_assignments(assignments), options)
+        else:
+            query, data = build_delete_query(options)
+    except ValueError as error:
+        raise typer.BadParameter(str(error))
+
+    # Plan d'exécution calculé par SQLite (la requête elle-même n'est pas exécutée) ; les fragments partagent
+    # le même schéma, le plan du premier vaut pour tous
+    plan: List[PlanStep] = explain_query(query, data, databases()[0])
+
+    # Affichage de la requête et du plan, chaque étape étant indentée sous son étape parente
+    typer.echo(f"Requête : {query}")
+    typer.echo(f"Paramètres : {len(data)}")
+    typer.echo("Plan d'exécution :")
+    depths: Dict[int, int] = {0: 0}
+    for step, parent, detail in plan:
+        depths[step] = depths.get(parent, 0) + 1
+        typer.echo(f"{'  ' * depths[step]}{detail}")
+
+    # Diagnostic : parcours complet de la table et tri sans index
+    scans: List[str] = [detail for _, _, detail in plan if is_full_scan(detail)]
+    sorts: List[str] = [detail for _, _, detail in plan if detail.startswith("USE TEMP B-TREE")]
+    if any("INDEX" not in detail for detail in scans):
+        typer.echo("⚠️ Parcours complet de la table 'task' : aucun index ne couvre ces critères")
+    elif scans:
+        typer.echo("⚠️ Parcours complet de la table 'task' dans l'ordre d'un index : l'index fournit le tri, "
+                   "mais les critères sont vérifiés ligne par ligne (rapide seulement avec une limite)")
+    else:
+        typer.echo("✅ Index utilisé : la table n'est pas parcourue entièrement")
+    if sorts:
+        typer.echo("⚠️ Tri en mémoire (B-tree temporaire) : aucun index ne fournit l'ordre demandé")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,55 @@
+from typing_extensions import Annotated
+from typing import List, Tuple
+
+import typer
+
+from manager.connection_manager import ConnectionManager
+from manager.migration_manager import Migration, get_schema_version, pending_migrations
+from manager.shard_manager import SHARDS, databases, migrate_databases
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Définition de la commande "schema" pour l'application Typer
+@app.command(name="schema", help="Appliquer les migrations du schéma sans perte de données")
+def migrate_schema(dry_run: Annotated[bool, typer.Option(help="Lister les migrations en attente sans les appliquer")] = False) -> None:
+    """
+    Met à jour le schéma de la base de données en appliquant les migrations en attente.
+
+    Contrairement à 'reset table', les données existantes sont conservées. Avec TASK_MANAGER_SHARDS,
+    chaque fragment est migré.
+
+    Args:
+        dry_run (Annotated[bool, typer.Option]): Affiche les migrations en attente sans les appliquer.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle utilise typer.echo pour l'affichage.
+    """
+    # Sélection des migrations à afficher pour chaque base : en attente (simulation) ou appliquées
+    try:
+        results: List[Tuple[ConnectionManager, List[Migration]]] = (
+            [(manager, pending_migrations(manager)) for manager in databases()] if dry_run else migrate_databases())
+    except ValueError as error:
+        # Données existantes incompatibles : aucune valeur n'est réécrite en silence
+        typer.echo(f"Erreur : {error}", err=True)
+        raise typer.Exit(code=1)
+
+    for manager, migrations in results:
+        # Nom du fragment, lorsque les tâches sont réparties entre plusieurs fichiers
+        suffix: str = f" ({manager.database})" if SHARDS else ""
+
+        # Affichage de chaque migration concernée
+        for version, description, _ in migrations:
+            typer.echo(f"{'En attente' if dry_run else 'Appliquée'} : {version} - {description}{suffix}")
+
+        # Affiche la version courante du schéma
+        typer.echo(f"Version du schéma : {get_schema_version(manager)}{suffix}")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
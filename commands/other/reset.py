@@ -1,7 +1,7 @@
 from typing_extensions import Annotated
 import typer
 
-from manager.database_manager import drop_create_table
+from manager.shard_manager import reset_databases
 
 
 # Création de l'application Typer principale
@@ -22,8 +22,8 @@ def reset_table(reset: Annotated[bool, typer.Option(show_default="Réinitialisat
     """
     # Vérifie si l'utilisateur a confirmé la réinitialisation (passé --reset)
     if reset:
-        # Appelle la fonction pour supprimer et recréer la table de la base de données
-        drop_create_table()
+        # Appelle la fonction pour supprimer les tables et reconstruire le schéma par les migrations (chaque fragment le cas échéant)
+        reset_databases()
         # Affiche un message de succès
         return typer.echo("Réinitialisation accomplie !")
     # Si la réinitialisation n'est pas confirmée
@@ -0,0 +1,64 @@
+from typing_extensions import Annotated
+import asyncio
+
+import typer
+
+from manager.server_manager import DEFAULT_SOCKET, TaskServer
+from manager.shard_manager import SHARDS
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Définition de la commande "start" pour l'application Typer
+@app.command(name="start", help="Démarrer le serveur de tâches (JSON sur socket Unix)")
+def server_start(
+    socket: Annotated[str, typer.Option(
+        help="Chemin du socket Unix")
+        ] = DEFAULT_SOCKET,
+
+    readers: Annotated[int, typer.Option(
+        help="Nombre de threads de lecture",
+        min=1)
+        ] = 4,
+
+    batch_size: Annotated[int, typer.Option(
+        help="Nombre maximal d'écritures validées par un même commit",
+        min=1)
+        ] = 256,
+    ) -> None:
+    """
+    Démarre le serveur de tâches jusqu'à son interruption (Ctrl+C).
+
+    Les lectures sont servies en parallèle par un pool de threads ; les écritures passent par une tâche
+    unique qui les regroupe dans une même transaction. La CLI utilise ce serveur lorsque la variable
+    d'environnement TASK_MANAGER_SERVER contient le chemin du socket.
+
+    Args:
+        socket (Annotated[str, typer.Option]): Le chemin du socket Unix.
+        readers (Annotated[int, typer.Option]): Le nombre de threads de lecture.
+        batch_size (Annotated[int, typer.Option]): Le nombre maximal d'écritures par commit.
+
+    Returns:
+        None: La fonction ne retourne rien explicitement.
+    """
+    # Les écritures groupées du serveur forment une seule transaction, impossible sur plusieurs fragments
+    if SHARDS:
+        typer.echo("Le serveur ne prend pas en charge les tâches réparties entre fragments (TASK_MANAGER_SHARDS)", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(f"Serveur à l'écoute sur {socket}")
+
+    # Exécution de la boucle d'événements jusqu'à l'interruption
+    try:
+        asyncio.run(TaskServer(socket, readers, batch_size).serve())
+    except KeyboardInterrupt:
+        typer.echo("Serveur arrêté")
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
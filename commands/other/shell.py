@@ -0,0 +1,100 @@
+import os
+import shlex
+import time
+from typing import List
+
+import click
+import typer
+
+try:
+    # Historique et édition de ligne (indisponible sur certaines plateformes, ex: Windows)
+    import readline
+except ImportError:
+    readline = None
+
+
+# Fichier d'historique des commandes du shell
+HISTORY_FILE: str = os.path.expanduser("~/.task_manager_history")
+
+# Nombre maximal de commandes conservées dans l'historique
+HISTORY_LENGTH: int = 1000
+
+# Commandes mettant fin à la session
+EXIT_COMMANDS: List[str] = ["exit", "quit"]
+
+def run_shell(command: click.Command) -> None:
+    """
+    Exécute les commandes de l'application en boucle dans un seul processus.
+
+    L'interpréteur, les modules de commande déjà chargés, la connexion SQLite, les requêtes compilées
+    et Rich restent en mémoire d'une commande à l'autre ; la durée de chaque commande est affichée.
+
+    Args:
+        command (click.Command): Le groupe de commandes racine de l'application.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    # Chargement de l'historique des sessions précédentes
+    if readline is not None:
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+        readline.set_history_length(HISTORY_LENGTH)
+
+    typer.echo("Shell du gestionnaire de tâches : 'help' pour l'aide, 'exit' pour quitter.")
+
+    try:
+        while True:
+            # Lecture de la commande (Ctrl+D termine la session, Ctrl+C annule la ligne)
+            try:
+                line: str = input("tâches> ").strip()
+            except EOFError:
+                typer.echo()
+                break
+            except KeyboardInterrupt:
+                typer.echo()
+                continue
+
+            # Lignes vides et commandes de sortie
+            if not line:
+                continue
+            if line in EXIT_COMMANDS:
+                break
+
+            # Découpage de la ligne comme le ferait le shell système
+            try:
+                args: List[str] = shlex.split(line)
+            except ValueError as error:
+                typer.echo(f"Commande invalide : {error}", err=True)
+                continue
+            if args[0] == "help":
+                args = ["--help"]
+            if args[0] == "shell":
+                typer.echo("Le shell est déjà actif", err=True)
+                continue
+
+            # Exécution chronométrée de la commande dans le processus courant
+            start: float = time.perf_counter()
+            try:
+                command.main(args, prog_name="", standalone_mode=False)
+            except click.exceptions.Exit:
+                pass
+            except click.ClickException as error:
+                error.show()
+            except click.Abort:
+                typer.echo("Commande interrompue", err=True)
+            except Exception as error:
+                typer.echo(f"Erreur : {error}", err=True)
+            typer.secho(f"({(time.perf_counter() - start) * 1000:.1f} ms)", dim=True)
+    finally:
+        # Sauvegarde de l'historique
+        if readline is not None:
+            try:
+                readline.write_history_file(HISTORY_FILE)
+            except OSError:
+                pass
+
+    # Retourne explicitement None
+    return None
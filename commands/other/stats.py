@@ -0,0 +1,122 @@
+from typing_extensions import Annotated
+from typing import Any, Dict, List
+import json
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from manager.constant_manager import *
+from manager.client_manager import count_by
+
+
+# Création de l'application Typer principale
+app: typer.Typer = typer.Typer(no_args_is_help=True)
+
+# Formats de sortie acceptés
+STATS_FORMATS: List[str] = ["rich", "json"]
+
+def collect_stats() -> Dict[str, Any]:
+    """
+    Calcule les statistiques des tâches à partir d'agrégations SQLite.
+
+    Returns:
+        Dict[str, Any]: Le total, les répartitions par statut et par priorité, et le tableau croisé collection x statut
+                        avec le taux d'achèvement de chaque collection.
+    """
+    # Répartitions simples, dans l'ordre des constantes (codes décodés)
+    by_status: Dict[str, int] = {STATUS[code]: count for code, count in count_by(("status",))}
+    by_priority: Dict[str, int] = {PRIORITY[code]: count for code, count in count_by(("priority",))}
+
+    # Tableau croisé collection x statut, lu groupe par groupe dans l'ordre des collections
+    collections: Dict[str, Dict[str, Any]] = {}
+    for collection, status, count in count_by(("collection", "status")):
+        entry: Dict[str, Any] = collections.setdefault(collection, {"total": 0, **{value: 0 for value in STATUS}})
+        entry[STATUS[status]] = count
+        entry["total"] += count
+
+    # Taux d'achèvement : part des tâches terminées dans chaque collection (par nom de statut, pas par position)
+    for entry in collections.values():
+        entry["completion"] = round(entry[DONE_STATUS] / entry["total"], 4)
+
+    return {
+        "total": sum(by_status.values()),
+        "status": {value: by_status.get(value, 0) for value in STATUS},
+        "priority": {value: by_priority.get(value, 0) for value in PRIORITY},
+        "collections": collections,
+    }
+
+def print_stats(stats: Dict[str, Any]) -> None:
+    """
+    Affiche les statistiques dans des tableaux Rich.
+
+    Args:
+        stats (Dict[str, Any]): Les statistiques calculées par collect_stats().
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    console: Console = Console()
+
+    # Répartition par priorité et par statut
+    for title, key in (("Répartition par priorité", "priority"), ("Répartition par statut", "status")):
+        table: Table = Table(title=title, title_style="bold")
+        table.add_column("Valeur")
+        table.add_column("Tâches", justify="right")
+        for value, count in stats[key].items():
+            table.add_row(value, str(count))
+        console.print(table)
+
+    # Tableau croisé collection x statut avec taux d'achèvement
+    table = Table(title=f"Tâches par collection ({stats['total']} au total)", title_style="bold")
+    table.add_column("Collection")
+    for value in STATUS:
+        table.add_column(value, justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Achèvement", justify="right")
+    for collection, entry in stats["collections"].items():
+        table.add_row(collection, *(str(entry[value]) for value in STATUS), str(entry["total"]), f"{entry['completion']:.0%}")
+    console.print(table)
+
+    # Retourne explicitement None
+    return None
+
+# Définition de la commande "task" pour l'application Typer, utilisée pour calculer les statistiques
+@app.command(name="task", help="Afficher les statistiques des tâches")
+def stats_task(
+    output_format: Annotated[str, typer.Option(
+        "--format",
+        help="Format de sortie (rich ou json)")
+        ] = "rich",
+    ) -> None:
+    """
+    Affiche le nombre de tâches par statut, par priorité et par collection, ainsi que le taux d'achèvement de chaque collection.
+
+    Les comptages sont réalisés par SQLite (GROUP BY) à l'aide des index : aucune tâche n'est chargée en mémoire.
+
+    Args:
+        output_format (Annotated[str, typer.Option]): Le format de sortie ("rich" ou "json").
+
+    Returns:
+        None: La fonction ne retourne rien explicitement, elle affiche les statistiques.
+    """
+    # Vérification du format demandé
+    if output_format not in STATS_FORMATS:
+        raise typer.BadParameter(f"Format inconnu, formats acceptés : {', '.join(STATS_FORMATS)}", param_hint="--format")
+
+    # Calcul des statistiques
+    stats: Dict[str, Any] = collect_stats()
+
+    # Affichage au format demandé
+    if output_format == "json":
+        typer.echo(json.dumps(stats, ensure_ascii=False, indent=2))
+    else:
+        print_stats(stats)
+
+    # Retourne explicitement None car la fonction ne doit pas retourner de valeur
+    return None
+
+# Bloc principal d'exécution du script
+# Exécute l'application Typer, ce qui analyse les arguments de la ligne de commande
+if __name__ == "__main__":
+    app()
@@ -1,77 +1,238 @@
+from time import perf_counter
+
+# Instant de démarrage du module principal (mesure de la phase d'import pour --profile)
+START: float = perf_counter()
+
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Dict, List, Optional, Tuple
+
+from typing_extensions import Annotated
+import click
 import typer
+from typer.core import TyperGroup
+
+
+# Définit le type d'une commande chargée à la demande : (module, description courte, panel d'aide Rich)
+LazyCommand = Tuple[str, str, str]
+
+# Registre des groupes de commandes : les modules ne sont importés que lorsque leur commande est exécutée
+COMMANDS: Dict[str, LazyCommand] = {
+    # Groupe 'create' (ex: create task ...)
+    "create": ("commands.crud.create", "Créer une tâche", "Opérations CRUD"),
+    # Groupe 'read' (ex: read task ...)
+    "read": ("commands.crud.read", "Rechercher une ou plusieurs tâches", "Opérations CRUD"),
+    # Groupe 'search' (ex: search task ...)
+    "search": ("commands.crud.search", "Rechercher des tâches en plein texte", "Opérations CRUD"),
+    # Groupe 'next' (ex: next task ...)
+    "next": ("commands.crud.next", "Afficher les tâches ouvertes les plus urgentes", "Opérations CRUD"),
+    # Groupe 'update' (ex: update task ...)
+    "update": ("commands.crud.update", "Modifier une ou plusieurs tâches", "Opérations CRUD"),
+    # Groupe 'delete' (ex: delete task ...)
+    "delete": ("commands.crud.delete", "Supprimer une ou plusieurs tâches", "Opérations CRUD"),
+    # Groupe 'reset' (ex: reset table ...)
+    "reset": ("commands.other.reset", "Réinitialiser la table de données", "Opérations autres"),
+    # Groupe 'stats' (ex: stats task ...)
+    "stats": ("commands.other.stats", "Afficher les statistiques des tâches", "Opérations autres"),
+    # Groupe 'server' (ex: server start ...)
+    "server": ("commands.other.server", "Démarrer le serveur de tâches", "Opérations autres"),
+    # Groupe 'migrate' (ex: migrate schema ...)
+    "migrate": ("commands.other.migrate", "Mettre à jour le schéma de la base de données", "Opérations autres"),
+    # Groupe 'explain' (ex: explain task ...)
+    "explain": ("commands.other.explain", "Afficher le plan d'exécution d'une requête", "Opérations autres"),
+    # Groupe 'changes' (ex: changes task --since ...)
+    "changes": ("commands.other.changes", "Exporter les changements des tâches", "Opérations autres"),
+    # Groupe 'archive' (ex: archive task --older-than 30)
+    "archive": ("commands.other.archive", "Archiver les tâches achevées", "Opérations autres"),
+    # Groupe 'diagnostic' (ex: diagnostic profile ...)
+    "diagnostic": ("commands.other.diagnostic", "Afficher les réglages de la base de données", "Opérations autres"),
+}
+
+
+# Durée des phases précédant l'exécution d'une commande, en secondes (affichées par --profile)
+timings: Dict[str, float] = {}
+
+
+class LazyGroup(TyperGroup):
+    """Définition du groupe Typer racine, qui charge les modules de commande uniquement à l'exécution."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """
+        Liste les commandes disponibles sans importer leur module.
+
+        Args:
+            ctx (click.Context): Le contexte Click courant.
+
+        Returns:
+            List[str]: Les noms des commandes du registre, puis celles enregistrées directement sur l'application.
+        """
+        return [*COMMANDS, *super().list_commands(ctx)]
+
+    def make_context(self, info_name: Optional[str], args: List[str], parent: Optional[click.Context] = None, **extra: Any) -> click.Context:
+        """
+        Analyse les arguments de la ligne de commande en mesurant la durée de l'analyse.
+
+        Args:
+            info_name (Optional[str]): Le nom du programme.
+            args (List[str]): Les arguments de la ligne de commande.
+            parent (Optional[click.Context]): Le contexte parent (None pour le groupe racine).
+            **extra (Any): Les paramètres supplémentaires du contexte.
+
+        Returns:
+            click.Context: Le contexte de la commande.
+        """
+        start: float = perf_counter()
+        ctx: click.Context = super().make_context(info_name, args, parent, **extra)
+        timings["analyse des arguments"] = perf_counter() - start
+        timings["chargement de la commande"] = 0.0
+        return ctx
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """
+        Retourne une commande légère (nom, aide, panel) suffisante pour l'affichage de l'aide.
+
+        Args:
+            ctx (click.Context): Le contexte Click courant.
+            cmd_name (str): Le nom de la commande recherchée.
+
+        Returns:
+            Optional[click.Command]: La commande, ou None si elle est inconnue.
+        """
+        # Commandes enregistrées directement sur l'application
+        if cmd_name not in COMMANDS:
+            return super().get_command(ctx, cmd_name)
+
+        # Substitut sans import du module de commande
+        _, help, panel = COMMANDS[cmd_name]
+        return TyperGroup(name=cmd_name, help=help, rich_help_panel=panel)
+
+    def resolve_command(self, ctx: click.Context, args: List[str]) -> Tuple[Optional[str], Optional[click.Command], List[str]]:
+        """
+        Résout la commande à exécuter en important son module à ce moment seulement.
+
+        Args:
+            ctx (click.Context): Le contexte Click courant.
+            args (List[str]): Les arguments restants de la ligne de commande.
+
+        Returns:
+            Tuple[Optional[str], Optional[click.Command], List[str]]: Le nom, la commande réelle et les arguments restants.
+        """
+        cmd_name, cmd, args = super().resolve_command(ctx, args)
+
+        # Remplace le substitut par le groupe réel du module (durée d'import mesurée)
+        if cmd_name in COMMANDS:
+            start: float = perf_counter()
+            cmd = load_command(cmd_name)
+            timings["chargement de la commande"] = perf_counter() - start
+
+        return cmd_name, cmd, args
+
+@lru_cache(maxsize=None)
+def load_command(cmd_name: str) -> TyperGroup:
+    """
+    Importe le module d'un groupe de commandes et construit son groupe Click (une seule fois par processus).
 
-import commands.crud.create as create
-import commands.crud.read as read
-import commands.crud.update as update
-import commands.crud.delete as delete
-import commands.other.reset as reset
+    Args:
+        cmd_name (str): Le nom du groupe dans le registre COMMANDS.
+
+    Returns:
+        TyperGroup: Le groupe de commandes prêt à être exécuté.
+    """
+    module_name, help, panel = COMMANDS[cmd_name]
+
+    # Import différé du module et conversion de son application Typer en groupe Click
+    group: TyperGroup = typer.main.get_group(import_module(module_name).app)
+    group.name = cmd_name
+    group.help = help
+    group.rich_help_panel = panel
+
+    # Retourne le groupe
+    return group
 
 
 # Création de l'application Typer principale
-app: typer.Typer = typer.Typer(no_args_is_help=True)
-
-# Ajout du groupe de commandes 'create' à l'application principale
-app.add_typer(
-    # L'objet Typer importé du module 'create'
-    create.app,
-    # Nom de la sous-commande (ex: create ...)
-    name="create",
-    # Description courte dans l'aide
-    help="Créer une tâche",
-    # Regroupe la commande dans un panel d'aide Rich spécifique
-    rich_help_panel="Opérations CRUD")
-
-# Ajout du groupe de commandes 'read' à l'application principale
-app.add_typer(
-    # L'objet Typer importé du module 'read'
-    read.app,
-    # Nom de la sous-commande (ex: read ...)
-    name="read",
-    # Description courte dans l'aide
-    help="Rechercher une ou plusieurs tâches",
-    # Regroupe la commande dans le panel d'aide Rich 'Opérations CRUD'
-    rich_help_panel="Opérations CRUD")
-
-# Ajout du groupe de commandes 'update' à l'application principale
-app.add_typer(
-    # L'objet Typer importé du module 'update'
-    update.app,
-    # Nom de la sous-commande (ex: update ...)
-    name="update",
-    # Description courte dans l'aide
-    help="Modifier une ou plusieurs tâches",
-    # Regroupe la commande dans le panel d'aide Rich 'Opérations CRUD'
-    rich_help_panel="Opérations CRUD")
-
-# Ajout du groupe de commandes 'delete' à l'application principale
-app.add_typer(
-    # L'objet Typer importé du module 'delete'
-    delete.app,
-    # Nom de la sous-commande (ex: delete ...)
-    name="delete",
-    # Description courte dans l'aide
-    help="Supprimer une ou plusieurs tâches",
-    # Regroupe la commande dans le panel d'aide Rich 'Opérations CRUD'
-    rich_help_panel="Opérations CRUD")
-
-# Ajout du groupe de commandes 'reset' à l'application principale
-app.add_typer(
-    # L'objet Typer importé du module 'reset'
-    reset.app,
-    # Nom de la sous-commande (ex: reset ...)
-    name="reset",
-    # Description courte dans l'aide
-    help="Réinitialiser la table de données",
-    # Regroupe la commande dans le panel d'aide Rich 'Opérations autres'
-    rich_help_panel="Opérations autres")
+app: typer.Typer = typer.Typer(cls=LazyGroup, no_args_is_help=True)
+
+# Définition du callback principal (requis pour que Typer construise un groupe de commandes) et des options globales
+@app.callback(help="Gestionnaire de tâches en ligne de commande")
+def main(
+    ctx: typer.Context,
+
+    # Profilage de la commande : durée de chaque phase, affichée sur la sortie d'erreur
+    profile: Annotated[bool, typer.Option(
+        "--profile",
+        help="Afficher la durée de chaque phase de la commande (sur la sortie d'erreur)")
+        ] = False,
+
+    # Trace de chaque instruction SQL (avec --profile)
+    trace_sql: Annotated[bool, typer.Option(
+        "--trace-sql",
+        help="Avec --profile : détailler chaque instruction SQL exécutée")
+        ] = False,
+
+    # Profil cProfile des fonctions Python (avec --profile)
+    profile_output: Annotated[str, typer.Option(
+        "--profile-output",
+        help="Avec --profile : écrire un profil cProfile (pstats) dans ce fichier",
+        show_default="Vide")
+        ] = "",
+    ) -> None:
+    """
+    Gestionnaire de tâches en ligne de commande.
+
+    Avec --profile, mesure les phases de la commande (import, analyse des arguments, chargement du module,
+    connexions, requêtes SQL, exécution et rendu) et affiche le résumé à la fin, sans modifier la sortie de la commande.
+
+    Args:
+        ctx (typer.Context): Le contexte de la commande racine.
+        profile (bool): Active le profilage de la commande.
+        trace_sql (bool): Détaille chaque instruction SQL exécutée.
+        profile_output (str): Le fichier pstats du profil cProfile (vide pour ne pas en écrire).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    if profile:
+        # Import différé : le profileur et la couche de données ne sont chargés qu'avec --profile
+        from manager.profile_manager import Profiler
+
+        # Phases déjà écoulées (l'import du module principal n'est compté qu'une fois par processus)
+        phases: Dict[str, float] = {"import (main.py)": timings.pop("import", 0.0), **timings}
+        profiler: Profiler = Profiler(phases, trace_sql=trace_sql, output=profile_output).start()
+
+        # Résumé affiché à la fin de la commande, y compris en cas d'erreur
+        ctx.call_on_close(profiler.report)
+
+    return None
+
+# Définition de la commande "shell", qui exécute les autres commandes en boucle dans un seul processus
+@app.command(name="shell", help="Ouvrir un shell interactif (une connexion, un processus)", rich_help_panel="Opérations autres")
+def shell() -> None:
+    """
+    Ouvre un shell interactif exécutant les commandes de l'application sans relancer l'interpréteur.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    # Import différé : le module du shell n'est chargé que pour cette commande
+    from commands.other.shell import run_shell
+
+    # Boucle de lecture et d'exécution sur le groupe de commandes racine
+    run_shell(typer.main.get_command(app))
+
+    # Retourne explicitement None
+    return None
+
+# Durée d'import du module principal (Typer, Click et registre des commandes)
+timings["import"] = perf_counter() - START
 
 # Bloc principal d'exécution du script
 if __name__ == "__main__":
     """
     Point d'entrée de l'application.
     Exécute l'application Typer pour analyser les arguments de la ligne de commande et dispatcher les commandes.
-    
+
     Returns:
         None: Le bloc principal ne retourne rien.
     """
-    app()
\ No newline at end of file
+    app()
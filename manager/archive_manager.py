@@ -0,0 +1,120 @@
+import json
+from sqlite3 import Cursor
+from time import perf_counter, time
+from typing import List, Optional
+
+from .connection_manager import ConnectionManager
+from .database_manager import Database, note_write, run_write
+from .logging_manager import logs
+
+
+# Tâches achevées avant une date, les plus anciennes d'abord (parcours de l'index sur la date de fin)
+BATCH_QUERY: str = "SELECT task_id FROM task_finished WHERE finished_at <= ? ORDER BY finished_at LIMIT ?"
+
+# Copie d'un lot de tâches dans l'archive, avec leur date de fin et la date d'archivage
+ARCHIVE_QUERY: str = ("INSERT INTO task_archive (id, label, collection, priority, status, finished_at, archived_at) "
+                      "SELECT task.id, label, collection, priority, status, finished_at, ? FROM task "
+                      "JOIN task_finished ON task_finished.task_id = task.id WHERE task.id IN (SELECT value FROM json_each(?))")
+
+# Suppression du lot dans la table 'task' (les déclencheurs mettent à jour l'index plein texte, les dates de fin et le journal)
+REMOVE_QUERY: str = "DELETE FROM task WHERE id IN (SELECT value FROM json_each(?))"
+
+# Valeur de PRAGMA auto_vacuum en mode incrémental
+INCREMENTAL: int = 2
+
+def archive_tasks(older_than: float = 30, batch_size: int = 1000, manager: Optional[ConnectionManager] = None) -> int:
+    """
+    Déplace dans la table d'archive les tâches terminées ou annulées depuis plus de `older_than` jours.
+
+    Les tâches sont déplacées par lots, chacun dans sa propre transaction d'écriture : le verrou n'est jamais
+    gardé longtemps, et une interruption conserve les lots déjà validés. Les identifiants sont conservés.
+
+    Args:
+        older_than (float): L'ancienneté minimale de la fin de la tâche, en jours.
+        batch_size (int): Le nombre de tâches déplacées par transaction.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        int: Le nombre de tâches archivées.
+    """
+    cutoff: int = int(time() - older_than * 86400)
+
+    def move(cur: Cursor) -> int:
+        ids: List[int] = [row[0] for row in cur.execute(BATCH_QUERY, (cutoff, batch_size))]
+        if not ids:
+            return 0
+        payload: str = json.dumps(ids)
+        cur.execute(ARCHIVE_QUERY, (int(time()), payload))
+        cur.execute(REMOVE_QUERY, (payload,))
+        note_write()
+        return len(ids)
+
+    # Un lot par transaction, jusqu'à épuisement des tâches à archiver
+    total: int = 0
+    while True:
+        start: float = perf_counter()
+        moved: int = run_write(move, manager)
+        if not moved:
+            return total
+        total += moved
+
+        # Enregistrement de chaque lot dans les logs
+        logs("ARCHIVE", ARCHIVE_QUERY, (cutoff, batch_size), moved, perf_counter() - start, table="task_archive")
+
+def get_auto_vacuum(manager: Optional[ConnectionManager] = None) -> int:
+    """
+    Lit le mode de récupération de l'espace libéré de la base (PRAGMA auto_vacuum).
+
+    Args:
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        int: 0 (aucun), 1 (complet) ou 2 (incrémental).
+    """
+    with Database(manager) as cur:
+        return cur.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+def reclaim_space(manager: Optional[ConnectionManager] = None) -> int:
+    """
+    Rend au système de fichiers les pages libérées (PRAGMA incremental_vacuum), si le mode incrémental est actif.
+
+    Args:
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        int: Le nombre de pages rendues (0 si le mode incrémental n'est pas actif).
+    """
+    start: float = perf_counter()
+    with Database(manager) as cur:
+        if cur.execute("PRAGMA auto_vacuum").fetchone()[0] != INCREMENTAL:
+            return 0
+        free: int = cur.execute("PRAGMA freelist_count").fetchone()[0]
+        # Le curseur doit être épuisé : chaque page est rendue par une étape de l'instruction
+        cur.execute("PRAGMA incremental_vacuum").fetchall()
+        freed: int = free - cur.execute("PRAGMA freelist_count").fetchone()[0]
+
+    # Enregistrement de l'opération dans les logs
+    logs("VACUUM", "PRAGMA incremental_vacuum", (), freed, perf_counter() - start, table="task")
+    return freed
+
+def enable_incremental_vacuum(manager: Optional[ConnectionManager] = None) -> None:
+    """
+    Convertit une base existante au mode auto_vacuum incrémental, en la reconstruisant entièrement (VACUUM).
+
+    La reconstruction réécrit tout le fichier et demande temporairement autant d'espace disque que la base :
+    elle n'est nécessaire qu'une fois (les bases créées depuis sont déjà en mode incrémental).
+
+    Args:
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    start: float = perf_counter()
+    with Database(manager) as cur:
+        cur.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        cur.execute("VACUUM")
+
+    # Enregistrement de l'opération dans les logs
+    logs("VACUUM", "VACUUM", duration=perf_counter() - start, table="schema")
+    return None
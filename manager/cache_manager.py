@@ -0,0 +1,332 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config_manager import get_setting
+
+# Verrou de fichier entre processus (indisponible sous Windows : compteurs partagés mis à jour sans verrou)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+# Définit le type d'une clé de cache : forme normalisée de la lecture (base, filtres, paramètres, reprise, limite)
+CacheKey = Tuple[Any, ...]
+
+# Définit le type d'une entrée du cache : (version des données, lignes, durée de la requête d'origine en ms)
+CacheEntry = Tuple[int, List[Tuple[Any, ...]], float]
+
+# Nombre de lectures conservées en mémoire (0 = cache en mémoire désactivé)
+DEFAULT_CACHE_SIZE: int = int(get_setting("cache", "cache_size", 0))
+
+# Dossier du cache sur disque, partagé entre les exécutions de la CLI (vide = cache sur disque désactivé)
+DEFAULT_CACHE_DIR: str = get_setting("cache", "cache_dir", "")
+
+# Nombre maximal de lignes d'un résultat mis en cache (les lectures plus volumineuses ne sont jamais conservées)
+DEFAULT_CACHE_MAX_ROWS: int = int(get_setting("cache", "cache_max_rows", 10_000))
+
+# Taille maximale du cache sur disque, en octets (les fichiers les moins récemment utilisés sont supprimés au-delà)
+DEFAULT_CACHE_DIR_MAX_BYTES: int = int(float(get_setting("cache", "cache_dir_max_mb", 64)) * 1024 * 1024)
+
+# Fichier des statistiques du cache sur disque, cumulées par toutes les exécutions de la CLI
+STATS_FILE: str = "stats.json"
+
+
+class ResultCache:
+    """Définition du cache des résultats de lecture, validé par la version des données de la table 'task'."""
+
+    size: int
+    directory: str
+    max_rows: int
+    max_bytes: int
+    entries: "OrderedDict[CacheKey, CacheEntry]"
+    hits: int
+    misses: int
+    saved_ms: float
+    lock: threading.Lock
+
+    def __init__(
+            self,
+            size: int = DEFAULT_CACHE_SIZE,
+            directory: str = DEFAULT_CACHE_DIR,
+            max_rows: int = DEFAULT_CACHE_MAX_ROWS,
+            max_bytes: int = DEFAULT_CACHE_DIR_MAX_BYTES
+            ) -> None:
+        """
+        Initialise le cache.
+
+        Args:
+            size (int): Le nombre de lectures conservées en mémoire (LRU).
+            directory (str): Le dossier du cache sur disque (vide pour le désactiver).
+            max_rows (int): Le nombre maximal de lignes d'un résultat conservé.
+            max_bytes (int): La taille maximale du cache sur disque, en octets.
+        """
+        self.size = size
+        self.directory = directory
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
+        # Entrées en mémoire, de la moins récemment utilisée à la plus récente
+        self.entries = OrderedDict()
+
+        # Statistiques du processus : succès, échecs et temps de requête économisé
+        self.hits = 0
+        self.misses = 0
+        self.saved_ms = 0.0
+
+        # Verrou protégeant les entrées et les statistiques (lectures concurrentes du serveur)
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si au moins un niveau de cache (mémoire ou disque) est actif."""
+        return self.size > 0 or bool(self.directory)
+
+    def path(self, key: CacheKey) -> str:
+        """
+        Retourne le fichier du cache sur disque correspondant à une clé.
+
+        Args:
+            key (CacheKey): La clé de la lecture.
+
+        Returns:
+            str: Le chemin du fichier.
+        """
+        return os.path.join(self.directory, f"{hashlib.sha1(repr(key).encode()).hexdigest()}.json")
+
+    def get(self, key: CacheKey, version: int) -> Optional[Tuple[List[Tuple[Any, ...]], float]]:
+        """
+        Retourne le résultat conservé pour une lecture, s'il correspond à la version courante des données.
+
+        Args:
+            key (CacheKey): La clé de la lecture.
+            version (int): La version courante des données.
+
+        Returns:
+            Optional[Tuple[List[Tuple[Any, ...]], float]]: Les lignes conservées et la durée de la requête d'origine
+                                                           (temps économisé, en ms), ou None (absent ou périmé).
+        """
+        entry: Optional[CacheEntry] = None
+
+        # Niveau 1 : mémoire du processus
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                entry = self.entries[key]
+
+        # Niveau 2 : disque (une entrée illisible est traitée comme absente)
+        if entry is None and self.directory:
+            try:
+                with open(self.path(key), encoding="utf-8") as file:
+                    stored: Dict[str, Any] = json.load(file)
+                entry = (stored["version"], [tuple(row) for row in stored["rows"]], stored["duration_ms"])
+                # Fichier marqué comme récemment utilisé (éviction des plus anciens)
+                os.utime(self.path(key))
+            except (OSError, ValueError, KeyError):
+                entry = None
+
+        # Une entrée d'une autre version des données est périmée
+        hit: bool = entry is not None and entry[0] == version
+        with self.lock:
+            if not hit:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.saved_ms += entry[2]
+                if self.size > 0:
+                    self.store(key, entry)
+
+        # Statistiques partagées entre les exécutions de la CLI
+        if self.directory:
+            self.record(hit, entry[2] if hit else 0.0)
+        return (entry[1], entry[2]) if hit else None
+
+    def put(self, key: CacheKey, version: int, rows: List[Tuple[Any, ...]], duration_ms: float) -> None:
+        """
+        Conserve le résultat d'une lecture pour une version des données.
+
+        Args:
+            key (CacheKey): La clé de la lecture.
+            version (int): La version des données lue avant la requête.
+            rows (List[Tuple[Any, ...]]): Les lignes du résultat.
+            duration_ms (float): La durée de la requête, créditée à chaque succès ultérieur.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        if len(rows) > self.max_rows:
+            return None
+
+        # Niveau 1 : mémoire du processus
+        if self.size > 0:
+            with self.lock:
+                self.store(key, (version, rows, duration_ms))
+
+        # Niveau 2 : disque, écriture atomique (fichier temporaire puis renommage)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            path: str = self.path(key)
+            temporary: str = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump({"version": version, "rows": rows, "duration_ms": duration_ms}, file, ensure_ascii=False)
+            os.replace(temporary, path)
+            self.evict()
+
+        return None
+
+    def evict(self) -> None:
+        """
+        Supprime les fichiers du cache sur disque les moins récemment utilisés tant que sa taille dépasse `max_bytes`.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        files: List[Tuple[float, int, str]] = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json") and entry.name != STATS_FILE:
+                try:
+                    info: os.stat_result = entry.stat()
+                except OSError:
+                    continue
+                files.append((info.st_mtime, info.st_size, entry.path))
+
+        # Suppression des plus anciens (un fichier déjà supprimé par un autre processus est ignoré)
+        total: int = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        return None
+
+    def record(self, hit: bool, saved_ms: float) -> None:
+        """
+        Cumule une recherche dans le fichier de statistiques du cache sur disque, sous verrou entre processus.
+
+        Args:
+            hit (bool): La recherche a été servie par le cache.
+            saved_ms (float): La durée de la requête d'origine (temps économisé, en ms).
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Mode "a+" : le fichier est créé s'il n'existe pas, sans être vidé avant la prise du verrou
+            with open(os.path.join(self.directory, STATS_FILE), "a+", encoding="utf-8") as file:
+                if fcntl is not None:
+                    fcntl.flock(file, fcntl.LOCK_EX)
+                file.seek(0)
+                totals: Dict[str, Any] = self.parse_totals(file.read())
+                totals["hits" if hit else "misses"] += 1
+                totals["saved_ms"] += saved_ms
+                file.seek(0)
+                file.truncate()
+                json.dump(totals, file)
+        except OSError:
+            # Statistiques indisponibles (dossier en lecture seule...) : la lecture n'est pas affectée
+            pass
+        return None
+
+    @staticmethod
+    def parse_totals(text: str) -> Dict[str, Any]:
+        """
+        Analyse le contenu du fichier de statistiques (un contenu vide ou illisible repart de zéro).
+
+        Args:
+            text (str): Le contenu du fichier.
+
+        Returns:
+            Dict[str, Any]: Les succès, échecs et temps économisé cumulés.
+        """
+        totals: Dict[str, Any] = {"hits": 0, "misses": 0, "saved_ms": 0.0}
+        try:
+            totals.update({k: v for k, v in json.loads(text).items() if k in totals})
+        except (ValueError, AttributeError):
+            pass
+        return totals
+
+    def store(self, key: CacheKey, entry: CacheEntry) -> None:
+        """
+        Ajoute une entrée en mémoire en évinçant la moins récemment utilisée (appelée sous verrou).
+
+        Args:
+            key (CacheKey): La clé de la lecture.
+            entry (CacheEntry): L'entrée à conserver.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques du cache pour le processus courant.
+
+        Returns:
+            Dict[str, Any]: Les succès, échecs, taux de succès, temps économisé et nombre d'entrées en mémoire.
+        """
+        with self.lock:
+            lookups: int = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "saved_ms": round(self.saved_ms, 3),
+                "entries": len(self.entries),
+            }
+
+    def disk_stats(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques du cache sur disque, cumulées par toutes les exécutions depuis le dernier vidage.
+
+        Returns:
+            Dict[str, Any]: Les succès, échecs, taux de succès, temps économisé, nombre de fichiers et taille occupée.
+        """
+        try:
+            with open(os.path.join(self.directory, STATS_FILE), encoding="utf-8") as file:
+                totals: Dict[str, Any] = self.parse_totals(file.read())
+        except OSError:
+            totals = self.parse_totals("")
+        sizes: List[int] = [entry.stat().st_size for entry in os.scandir(self.directory)
+                            if entry.name.endswith(".json") and entry.name != STATS_FILE] if os.path.isdir(self.directory) else []
+        lookups: int = totals["hits"] + totals["misses"]
+        return {
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "hit_rate": round(totals["hits"] / lookups, 4) if lookups else 0.0,
+            "saved_ms": round(totals["saved_ms"], 3),
+            "files": len(sizes),
+            "bytes": sum(sizes),
+        }
+
+    def clear(self) -> None:
+        """
+        Vide le cache en mémoire et sur disque, et remet les statistiques à zéro (fichier de statistiques compris).
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+            self.saved_ms = 0.0
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+        return None
+
+
+# Cache partagé par l'ensemble des lectures du processus
+cache: ResultCache = ResultCache()
@@ -0,0 +1,97 @@
+from sqlite3 import Cursor
+from time import perf_counter
+from typing import Iterator, List, Optional
+
+from .connection_manager import ConnectionManager
+from .database_manager import Database, Result, fetch_pages, run_write
+from .logging_manager import logs
+
+
+# Lecture des changements postérieurs à une séquence, dans l'ordre (parcours de la clé primaire à partir de la séquence)
+CHANGES_QUERY: str = ("SELECT seq, operation, task_id, label, collection, priority, status FROM task_change "
+                      "WHERE seq > ? ORDER BY seq")
+
+# Compaction : seul le dernier changement de chaque tâche est conservé jusqu'à la séquence indiquée
+COMPACT_QUERY: str = ("DELETE FROM task_change WHERE seq <= ? AND seq NOT IN "
+                      "(SELECT MAX(seq) FROM task_change WHERE seq <= ? GROUP BY task_id)")
+
+# Suppression des marques de suppression jusqu'à la séquence indiquée
+PURGE_QUERY: str = "DELETE FROM task_change WHERE seq <= ? AND operation = 'delete'"
+
+def iter_changes(since: int = 0, limit: int = 0, page_size: int = 500, manager: Optional[ConnectionManager] = None) -> Iterator[Result]:
+    """
+    Lit les changements de la table 'task' postérieurs à une séquence, page par page.
+
+    La lecture démarre directement à la séquence demandée dans la clé primaire du journal : son coût dépend
+    du nombre de changements lus, pas de la taille de la table 'task'.
+
+    Args:
+        since (int): La dernière séquence déjà lue (0 pour lire tout le journal).
+        limit (int): Le nombre maximal de changements (0 pour aucune limite).
+        page_size (int): Le nombre de changements récupérés par appel à fetchmany.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Yields:
+        Result: Des pages de tuples (seq, operation, task_id, label, collection, priority, status) ; les valeurs
+                d'une suppression sont NULL, la priorité et le statut sont des codes entiers.
+    """
+    query: str = f"{CHANGES_QUERY}{' LIMIT ?' if limit else ''}"
+    data: tuple = (since, limit) if limit else (since,)
+
+    # Lecture du curseur par tranches (seul le travail de SQLite est chronométré)
+    rows: int = 0
+    elapsed: List[float] = [0.0]
+    with Database(manager) as cur:
+        for page in fetch_pages(cur, query, data, page_size, elapsed):
+            rows += len(page)
+            yield page
+
+    # Enregistrement de l'opération une fois le curseur épuisé
+    logs("CHANGES", query, data, rows, elapsed[0], table="task_change")
+
+def last_change(manager: Optional[ConnectionManager] = None) -> int:
+    """
+    Retourne la dernière séquence attribuée par le journal des changements.
+
+    Args:
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        int: La séquence du dernier changement (ou la séquence de départ si le journal n'a jamais été alimenté).
+    """
+    with Database(manager) as cur:
+        row: Optional[tuple] = cur.execute("SELECT seq FROM sqlite_sequence WHERE name = 'task_change'").fetchone()
+    return row[0] if row else 0
+
+def compact_changes(before: int = 0, purge_deletes: bool = False, manager: Optional[ConnectionManager] = None) -> int:
+    """
+    Compacte le journal : jusqu'à la séquence `before`, seul le dernier changement de chaque tâche est conservé.
+
+    Lire le journal depuis le début reconstruit toujours la table : une tâche y figure par son dernier état.
+    Les marques de suppression sont conservées, sauf avec `purge_deletes` ; elles ne manquent alors qu'aux
+    consommateurs qui n'ont pas encore lu jusqu'à `before`.
+
+    Args:
+        before (int): La dernière séquence compactée (0 pour tout le journal).
+        purge_deletes (bool): Supprime aussi les marques de suppression jusqu'à `before`.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        int: Le nombre de changements supprimés du journal.
+    """
+    # Par défaut, tout le journal jusqu'au dernier changement
+    limit: int = before or last_change(manager)
+
+    def compact(cur: Cursor) -> int:
+        removed: int = cur.execute(COMPACT_QUERY, (limit, limit)).rowcount
+        if purge_deletes:
+            removed += cur.execute(PURGE_QUERY, (limit,)).rowcount
+        return removed
+
+    # Une seule transaction d'écriture (rejouée si la base est verrouillée)
+    start: float = perf_counter()
+    removed: int = run_write(compact, manager)
+
+    # Enregistrement de l'opération dans les logs
+    logs("COMPACT", COMPACT_QUERY, (limit, limit), removed, perf_counter() - start, table="task_change")
+    return removed
@@ -0,0 +1,249 @@
+import itertools
+import json
+import os
+import socket
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from . import database_manager, shard_manager, stats_manager
+from .database_manager import FilterOptions, Result, Row
+
+
+# Socket du serveur utilisé par la CLI (vide = accès direct à la base de données)
+SERVER_SOCKET: str = os.environ.get("TASK_MANAGER_SERVER", "")
+
+# Accès direct : réparti entre les fragments si TASK_MANAGER_SHARDS est défini, sinon base unique
+direct: Any = shard_manager if shard_manager.SHARDS else database_manager
+
+
+class ServerError(Exception):
+    """Définition de l'exception levée lorsque le serveur répond par une erreur."""
+
+
+class TaskClient:
+    """Définition du client JSON du serveur de tâches (une connexion persistante au socket Unix)."""
+
+    path: str
+    sock: Optional[socket.socket]
+    stream: Any
+    counter: Iterator[int]
+    lock: threading.Lock
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialise le client (la connexion est ouverte au premier appel).
+
+        Args:
+            path (str): Le chemin du socket Unix du serveur.
+        """
+        self.path = path
+        self.sock = None
+        self.stream = None
+        self.counter = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def call(self, operation: str, **args: Any) -> Any:
+        """
+        Envoie une requête au serveur et attend sa réponse.
+
+        Args:
+            operation (str): Le nom de l'opération (insert, insert_many, select, search, next, update, delete).
+            **args (Any): Les arguments de l'opération.
+
+        Returns:
+            Any: Le résultat retourné par le serveur.
+
+        Raises:
+            ServerError: Si le serveur signale une erreur.
+        """
+        with self.lock:
+            # Connexion paresseuse au serveur
+            if self.sock is None:
+                self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.sock.connect(self.path)
+                self.stream = self.sock.makefile("rwb")
+
+            # Envoi de la requête (une ligne JSON) et lecture de la réponse
+            request: Dict[str, Any] = {"id": next(self.counter), "op": operation, "args": args}
+            self.stream.write(json.dumps(request, ensure_ascii=False).encode() + b"\n")
+            self.stream.flush()
+            response: Dict[str, Any] = json.loads(self.stream.readline())
+
+        if not response.get("ok"):
+            raise ServerError(response.get("error"))
+        return response.get("result")
+
+    def close(self) -> None:
+        """
+        Ferme la connexion au serveur.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        if self.sock is not None:
+            self.stream.close()
+            self.sock.close()
+            self.sock = None
+        return None
+
+
+# Client partagé du processus (None si la CLI accède directement à la base de données)
+client: Optional[TaskClient] = TaskClient(SERVER_SOCKET) if SERVER_SOCKET else None
+
+def insert_into_database(values: Tuple[Any, ...]) -> None:
+    """
+    Insère une tâche, via le serveur si TASK_MANAGER_SERVER est défini, sinon directement.
+
+    Args:
+        values (Tuple[Any, ...]): Les valeurs (label, collection, priority, status).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    if client is None:
+        return direct.insert_into_database(values)
+    return client.call("insert", values=list(values))
+
+def insert_many_into_database(rows: Iterable[Row], chunk_size: int = 10_000) -> int:
+    """
+    Insère un flux de tâches par paquets, via le serveur si TASK_MANAGER_SERVER est défini, sinon directement.
+
+    Args:
+        rows (Iterable[Row]): Les tuples (label, collection, priority, status).
+        chunk_size (int): Le nombre de lignes par paquet.
+
+    Returns:
+        int: Le nombre de lignes insérées.
+    """
+    if client is None:
+        return direct.insert_many_into_database(rows, chunk_size)
+
+    # Envoi paquet par paquet pour garder une mémoire bornée
+    total: int = 0
+    iterator: Iterator[Row] = iter(rows)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        total += client.call("insert_many", rows=[list(row) for row in chunk])
+    return total
+
+def iter_select_from_database(
+        options: FilterOptions,
+        after_id: int = 0,
+        limit: int = 0,
+        page_size: int = 500,
+        sort: str = "collection",
+        descending: bool = False,
+        archived: bool = False
+        ) -> Iterator[Result]:
+    """
+    Lit des tâches page par page, via le serveur si TASK_MANAGER_SERVER est défini, sinon directement.
+
+    À distance, chaque page est une requête distincte qui reprend après la dernière tâche reçue.
+
+    Args:
+        options (FilterOptions): Les critères de filtrage.
+        after_id (int): L'identifiant de la dernière tâche déjà lue.
+        limit (int): Le nombre maximal de tâches (0 pour aucune limite).
+        page_size (int): Le nombre de tâches par page.
+        sort (str): La colonne de tri ("collection", "priority" ou "id").
+        descending (bool): Trie par ordre décroissant.
+        archived (bool): Lit aussi les tâches archivées.
+
+    Yields:
+        Result: Des pages successives d'au plus `page_size` lignes.
+    """
+    if client is None:
+        yield from direct.iter_select_from_database(options, after_id, limit, page_size, sort, descending, archived=archived)
+        return
+
+    # Pagination par reprise : une requête par page
+    remaining: int = limit
+    while True:
+        size: int = min(page_size, remaining) if limit else page_size
+        page: Result = [tuple(row) for row in client.call(
+            "select", options=options, after_id=after_id, limit=size, sort=sort, descending=descending, archived=archived)]
+        if not page:
+            return
+        yield page
+        after_id = page[-1][0]
+        remaining -= len(page)
+        if len(page) < size or (limit and remaining <= 0):
+            return
+
+def search_database(text: str, options: FilterOptions, limit: int = 0, page_size: int = 500) -> Iterator[Result]:
+    """
+    Recherche des tâches en plein texte, via le serveur si TASK_MANAGER_SERVER est défini, sinon directement.
+
+    Args:
+        text (str): La requête plein texte.
+        options (FilterOptions): Les critères de filtrage supplémentaires.
+        limit (int): Le nombre maximal de tâches (0 pour aucune limite).
+        page_size (int): Le nombre de tâches par page.
+
+    Yields:
+        Result: Des pages successives d'au plus `page_size` lignes, de la plus pertinente à la moins pertinente.
+    """
+    if client is None:
+        yield from direct.search_database(text, options, limit, page_size)
+        return
+
+    # Le serveur retourne toutes les lignes en une réponse, redécoupées en pages
+    rows: Result = [tuple(row) for row in client.call("search", text=text, options=options, limit=limit)]
+    for index in range(0, len(rows), page_size):
+        yield rows[index:index + page_size]
+
+def next_from_database(limit: int = 20) -> Result:
+    """
+    Retourne les tâches ouvertes les plus urgentes, via le serveur si TASK_MANAGER_SERVER est défini, sinon directement.
+
+    Args:
+        limit (int): Le nombre de tâches à retourner.
+
+    Returns:
+        Result: Les tâches, de la plus urgente à la moins urgente.
+    """
+    if client is None:
+        return direct.next_from_database(limit)
+    return [tuple(row) for row in client.call("next", limit=limit)]
+
+def update_from_database(columns: FilterOptions, options: FilterOptions) -> int:
+    """
+    Met à jour des tâches, via le serveur si TASK_MANAGER_SERVER est défini, sinon directement.
+
+    Args:
+        columns (FilterOptions): Les colonnes à modifier et leurs nouvelles valeurs.
+        options (FilterOptions): Les critères de sélection.
+
+    Returns:
+        int: Le nombre de tâches modifiées.
+    """
+    if client is None:
+        return direct.update_from_database(columns, options)
+    return client.call("update", columns=columns, options=options)
+
+def delete_from_database(options: FilterOptions) -> int:
+    """
+    Supprime des tâches, via le serveur si TASK_MANAGER_SERVER est défini, sinon directement.
+
+    Args:
+        options (FilterOptions): Les critères de sélection.
+
+    Returns:
+        int: Le nombre de tâches supprimées.
+    """
+    if client is None:
+        return direct.delete_from_database(options)
+    return client.call("delete", options=options)
+
+def count_by(columns: Tuple[str, ...]) -> Iterator[Row]:
+    """
+    Compte les tâches par groupe, sur chaque fragment si TASK_MANAGER_SHARDS est défini, sinon dans la base unique.
+
+    Le serveur ne fournit pas d'agrégation : les comptages lisent toujours la base directement.
+
+    Args:
+        columns (Tuple[str, ...]): Les colonnes de regroupement (ex: ("collection", "status")).
+
+    Yields:
+        Row: Les valeurs des colonnes de regroupement suivies du nombre de tâches, triées par groupe.
+    """
+    yield from (shard_manager if shard_manager.SHARDS else stats_manager).count_by(columns)
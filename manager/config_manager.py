@@ -0,0 +1,50 @@
+import os
+import tomllib
+from typing import Any, Dict, Optional
+
+
+# Fichier de configuration (surchargeable via la variable d'environnement TASK_MANAGER_CONFIG)
+CONFIG_FILE: str = os.environ.get("TASK_MANAGER_CONFIG", "task_manager.toml")
+
+# Contenu du fichier de configuration, lu une seule fois (None tant qu'il n'a pas été lu)
+settings: Optional[Dict[str, Any]] = None
+
+def load_settings() -> Dict[str, Any]:
+    """
+    Lit le fichier de configuration TOML (une seule fois par processus).
+
+    Returns:
+        Dict[str, Any]: Le contenu du fichier, ou un dictionnaire vide s'il n'existe pas.
+    """
+    global settings
+
+    # Lecture différée et mise en cache du fichier
+    if settings is None:
+        try:
+            with open(CONFIG_FILE, "rb") as file:
+                settings = tomllib.load(file)
+        except FileNotFoundError:
+            settings = {}
+
+    # Retourne le contenu du fichier
+    return settings
+
+def get_setting(section: str, name: str, default: Any = None) -> Any:
+    """
+    Retourne un paramètre : variable d'environnement TASK_MANAGER_<NAME>, puis fichier de configuration, puis défaut.
+
+    Args:
+        section (str): La section du fichier de configuration (ex: "database").
+        name (str): Le nom du paramètre (ex: "profile").
+        default (Any): La valeur retournée si le paramètre n'est défini nulle part.
+
+    Returns:
+        Any: La valeur du paramètre.
+    """
+    # Priorité à la variable d'environnement
+    value: Optional[str] = os.environ.get(f"TASK_MANAGER_{name.upper()}")
+    if value is not None:
+        return value
+
+    # Puis au fichier de configuration
+    return load_settings().get(section, {}).get(name, default)
@@ -0,0 +1,288 @@
+import atexit
+import sqlite3
+import threading
+from queue import Queue, Empty
+from sqlite3 import Connection
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from .config_manager import get_setting, load_settings
+from .query_manager import CACHE_SIZE
+
+
+# Définit le type d'un profil de performance : PRAGMA SQLite -> valeur
+Profile = Dict[str, Any]
+
+# Profils de performance appliqués à chaque nouvelle connexion (auto_vacuum ne s'applique qu'à une base vierge :
+# une base existante est convertie par archive task --vacuum)
+PROFILES: Dict[str, Profile] = {
+    # Valeurs par défaut de SQLite (hors auto_vacuum) : journal d'annulation, double fsync à chaque commit
+    "durable": {
+        "auto_vacuum": "INCREMENTAL",
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -2000,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    # WAL : les lecteurs ne bloquent plus sur les écritures, un seul fsync aux checkpoints
+    "balanced": {
+        "auto_vacuum": "INCREMENTAL",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # Aucune synchronisation disque : les dernières transactions peuvent être perdues en cas de coupure
+    "fast": {
+        "auto_vacuum": "INCREMENTAL",
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "mmap_size": 1024 * 1024 * 1024,
+        "cache_size": -256 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+# Profil par défaut (surchargeable via TASK_MANAGER_PROFILE ou la clé "profile" de la section [database])
+DEFAULT_PROFILE: str = get_setting("database", "profile", "balanced")
+
+def resolve_profile(name: str) -> Profile:
+    """
+    Construit les PRAGMA d'un profil, complétés par la section [pragmas] du fichier de configuration.
+
+    Args:
+        name (str): Le nom du profil ("durable", "balanced" ou "fast").
+
+    Returns:
+        Profile: Les PRAGMA à appliquer et leurs valeurs.
+
+    Raises:
+        ValueError: Si le profil est inconnu.
+    """
+    if name not in PROFILES:
+        raise ValueError(f"Profil inconnu : {name} (profils disponibles : {', '.join(PROFILES)})")
+
+    # Seuls les PRAGMA connus peuvent être surchargés
+    overrides: Profile = {k: v for k, v in load_settings().get("pragmas", {}).items() if k in PROFILES[name]}
+
+    # Attente maximale d'un verrou (TASK_MANAGER_BUSY_TIMEOUT ou clé "busy_timeout" de la section [database], en ms)
+    busy_timeout: Optional[Any] = get_setting("database", "busy_timeout")
+    if busy_timeout is not None:
+        overrides["busy_timeout"] = int(busy_timeout)
+
+    return {**PROFILES[name], **overrides}
+
+
+# Fonctions appelées après l'ouverture de chaque connexion, avec sa durée d'ouverture en secondes (ex: profilage)
+connect_hooks: List[Callable[[Connection, float], None]] = []
+
+# Fichier de base de données utilisé par défaut (surchargeable via TASK_MANAGER_DATABASE ou la section [database])
+DEFAULT_DATABASE: str = get_setting("database", "database", "database.sqlite3")
+
+# Taille du pool par défaut (0 = une connexion persistante par thread, sans pool partagé)
+DEFAULT_POOL_SIZE: int = int(get_setting("database", "pool_size", 0))
+
+
+class ConnectionManager:
+    """Définition de la classe gérant des connexions SQLite longue durée, réutilisées entre les requêtes."""
+
+    database: str
+    pool_size: int
+    profile: str
+    pragmas: Profile
+    _local: threading.local
+    _pool: Optional["Queue[Connection]"]
+    _connections: List[Connection]
+    _lock: threading.Lock
+
+    def __init__(self, database: str = DEFAULT_DATABASE, pool_size: int = DEFAULT_POOL_SIZE, profile: str = DEFAULT_PROFILE) -> None:
+        """
+        Initialise le gestionnaire de connexions.
+
+        Args:
+            database (str): Le nom du fichier de la base de données SQLite.
+            pool_size (int): Le nombre maximal de connexions partagées entre threads.
+                             Avec 0, chaque thread conserve sa propre connexion persistante.
+            profile (str): Le profil de performance appliqué à chaque connexion.
+        """
+        # Stocke le nom du fichier et la taille du pool
+        self.database = database
+        self.pool_size = pool_size
+
+        # Stocke le profil de performance et ses PRAGMA
+        self.profile = profile
+        self.pragmas = resolve_profile(profile)
+
+        # Stockage local au thread pour le mode "une connexion par thread"
+        self._local = threading.local()
+
+        # File d'attente des connexions disponibles pour le mode "pool"
+        self._pool = Queue(maxsize=pool_size) if pool_size > 0 else None
+
+        # Liste de toutes les connexions ouvertes (pour pouvoir les fermer à la fin)
+        self._connections = []
+
+        # Verrou protégeant la liste des connexions ouvertes
+        self._lock = threading.Lock()
+
+    def connect(self) -> Connection:
+        """
+        Ouvre une nouvelle connexion vers la base de données et l'enregistre.
+
+        Returns:
+            sqlite3.Connection: La connexion nouvellement créée.
+        """
+        # Les connexions du pool peuvent passer d'un thread à l'autre ; le cache de requêtes préparées
+        # est dimensionné pour contenir toutes les formes compilées par query_manager
+        start: float = perf_counter()
+        con: Connection = sqlite3.connect(self.database, check_same_thread=self._pool is None, cached_statements=CACHE_SIZE)
+
+        # Application du profil de performance
+        for pragma, value in self.pragmas.items():
+            con.execute(f"PRAGMA {pragma} = {value}")
+
+        # Enregistre la connexion pour la fermeture ultérieure
+        with self._lock:
+            self._connections.append(con)
+
+        # Notification des observateurs (durée d'ouverture et d'application du profil)
+        for hook in connect_hooks:
+            hook(con, perf_counter() - start)
+
+        # Retourne la connexion
+        return con
+
+    def connections(self) -> List[Connection]:
+        """
+        Retourne les connexions actuellement ouvertes par le gestionnaire (ex: pour y installer une trace).
+
+        Returns:
+            List[sqlite3.Connection]: Une copie de la liste des connexions ouvertes.
+        """
+        with self._lock:
+            return list(self._connections)
+
+    def acquire(self) -> Connection:
+        """
+        Fournit une connexion prête à l'emploi, sans en ouvrir une nouvelle si possible.
+
+        Returns:
+            sqlite3.Connection: Une connexion persistante (thread courant ou pool).
+        """
+        # Mode "pool" : récupère une connexion libre, ou en ouvre une tant que la limite n'est pas atteinte
+        if self._pool is not None:
+            try:
+                return self._pool.get_nowait()
+            except Empty:
+                with self._lock:
+                    can_open: bool = len(self._connections) < self.pool_size
+                if can_open:
+                    return self.connect()
+                # Toutes les connexions sont occupées : attente bloquante
+                return self._pool.get()
+
+        # Mode "une connexion par thread" : réutilise la connexion du thread courant
+        con: Optional[Connection] = getattr(self._local, "con", None)
+        if con is None:
+            con = self.connect()
+            self._local.con = con
+
+        # Retourne la connexion
+        return con
+
+    def release(self, con: Connection) -> None:
+        """
+        Rend une connexion au gestionnaire après utilisation.
+
+        Args:
+            con (sqlite3.Connection): La connexion obtenue par acquire().
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        # Seul le mode "pool" nécessite de remettre la connexion en file d'attente
+        if self._pool is not None:
+            self._pool.put(con)
+
+        # Retourne explicitement None
+        return None
+
+    def close(self) -> None:
+        """
+        Ferme toutes les connexions ouvertes par le gestionnaire.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        # Récupère et vide la liste des connexions sous verrou
+        with self._lock:
+            connections: List[Connection] = self._connections
+            self._connections = []
+
+        # Ferme chaque connexion
+        for con in connections:
+            con.close()
+
+        # Réinitialise les états du thread courant et du pool
+        self._local = threading.local()
+        if self._pool is not None:
+            self._pool = Queue(maxsize=self.pool_size)
+
+        # Retourne explicitement None
+        return None
+
+
+# Gestionnaire partagé par l'ensemble des opérations du processus
+manager: ConnectionManager = ConnectionManager()
+
+def get_manager() -> ConnectionManager:
+    """
+    Retourne le gestionnaire de connexions partagé du processus.
+
+    Returns:
+        ConnectionManager: Le gestionnaire courant.
+    """
+    return manager
+
+def configure(database: Optional[str] = None, pool_size: Optional[int] = None, profile: Optional[str] = None) -> ConnectionManager:
+    """
+    Remplace le gestionnaire partagé (après fermeture des connexions de l'ancien).
+
+    Args:
+        database (Optional[str]): Le nouveau fichier de base de données (inchangé si None).
+        pool_size (Optional[int]): La nouvelle taille de pool (inchangée si None).
+        profile (Optional[str]): Le nouveau profil de performance (inchangé si None).
+
+    Returns:
+        ConnectionManager: Le nouveau gestionnaire partagé.
+    """
+    global manager
+
+    # Ferme les connexions de l'ancien gestionnaire
+    manager.close()
+
+    # Crée le nouveau gestionnaire en conservant les valeurs non précisées
+    manager = ConnectionManager(
+        database=database if database is not None else manager.database,
+        pool_size=pool_size if pool_size is not None else manager.pool_size,
+        profile=profile if profile is not None else manager.profile)
+
+    # Retourne le nouveau gestionnaire
+    return manager
+
+def close_connections() -> None:
+    """
+    Ferme les connexions du gestionnaire partagé (appelée automatiquement à la sortie du processus).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    manager.close()
+
+# Fermeture propre des connexions à la fin du processus
+atexit.register(close_connections)
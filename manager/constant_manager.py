@@ -7,3 +7,12 @@ PRIORITY: List[str] = ["optionnelle", "basse", "moyenne", "haute", "urgente"]
 # Définition d'une liste (constante) représentant tous les statuts possibles pour une tâche
 STATUS: List[str] = ["à faire", "en cours", "terminée", "annulée"]
 
+
+# Définition d'une liste (constante) des statuts d'une tâche encore ouverte (file des tâches à traiter)
+OPEN_STATUS: List[str] = ["à faire", "en cours"]
+
+# Définition d'une liste (constante) des statuts d'une tâche achevée (archivable)
+FINISHED_STATUS: List[str] = ["terminée", "annulée"]
+
+# Définition du statut (constante) d'une tâche menée à bien (taux d'achèvement des statistiques)
+DONE_STATUS: str = "terminée"
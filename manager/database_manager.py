@@ -1,41 +1,113 @@
-import sqlite3
-from sqlite3 import Connection, Cursor
-from typing import Tuple, Dict, Optional, Any, List
-
+import random
+import threading
+from sqlite3 import Connection, Cursor, OperationalError
+from itertools import islice
+from time import perf_counter, sleep
+from typing import Tuple, Dict, Optional, Any, List, Iterable, Iterator, Union, Callable, TypeVar
+
+from .cache_manager import CacheKey, cache
+from .config_manager import get_setting
+from .connection_manager import ConnectionManager, get_manager
 from .logging_manager import logs
+from .constant_manager import OPEN_STATUS
+from .query_manager import canonicalize, compile_next_query, compile_query, encode, encode_row
+
+
+# Transaction en cours dans chaque thread (connexion et profondeur d'imbrication)
+active: threading.local = threading.local()
+
+# Nombre d'écritures effectuées par le processus : PRAGMA data_version ne change pas
+# lorsque les écritures proviennent de la connexion qui le lit
+writes: int = 0
+
+# Nombre de nouvelles tentatives d'une transaction d'écriture refusée car la base est verrouillée
+WRITE_RETRIES: int = int(get_setting("database", "write_retries", 5))
+
+# Délai de base de l'attente entre deux tentatives, en secondes (doublé à chaque tentative, avec une part aléatoire)
+RETRY_BACKOFF: float = float(get_setting("database", "retry_backoff_ms", 50)) / 1000
+
+# Attente maximale entre deux tentatives, en secondes
+RETRY_BACKOFF_MAX: float = 2.0
+
+# Au-delà de cette durée, l'obtention du verrou d'écriture compte comme une attente (en secondes)
+LOCK_WAIT_THRESHOLD: float = 0.001
+
+# Compteurs de contention du processus : transactions d'écriture, attentes de verrou, nouvelles tentatives, échecs
+contention: Dict[str, float] = {"transactions": 0, "lock_waits": 0, "lock_wait_ms": 0.0, "retries": 0, "failures": 0}
 
 
 class Database:
-    """Définition de la classe pour la gestion de la connexion à la base de données."""
+    """Définition de la classe pour la gestion d'une transaction sur une connexion partagée."""
 
-    database: str
+    manager: Optional[ConnectionManager]
+    write: bool
     con: Optional[Connection]
     cur: Optional[Cursor]
+    savepoint: Optional[str]
     
-    def __init__(self, database: str = "database.sqlite3") -> None:
+    def __init__(self, manager: Optional[ConnectionManager] = None, write: bool = False) -> None:
         """
         Initialise l'objet Database.
 
         Args:
-            database (str): Le nom du fichier de la base de données SQLite. 
+            manager (Optional[ConnectionManager]): Le gestionnaire de connexions à utiliser.
+                                                   Par défaut, le gestionnaire partagé du processus.
+            write (bool): Ouvre la transaction par BEGIN IMMEDIATE : le verrou d'écriture est obtenu dès l'entrée
+                          (en attendant au plus busy_timeout), et non au milieu de la transaction.
         """
-        # Stocke le nom du fichier de la base de données
-        self.database = database
+        # Stocke le gestionnaire de connexions (résolu à l'entrée du bloc 'with' si None)
+        self.manager = manager
+        self.write = write
 
-        # Initialise la connexion et le curseur à None
+        # Initialise la connexion, le curseur et le point de sauvegarde à None
         self.con = None
         self.cur = None
+        self.savepoint = None
         
     def __enter__(self) -> Cursor:
         """
-        Ouvre la connexion et crée un curseur, puis retourne le curseur. 
+        Récupère une connexion persistante et crée un curseur, puis retourne le curseur. 
         Méthode appelée lors de l'entrée dans le bloc 'with'.
+
+        Un bloc ouvert à l'intérieur d'un autre bloc du même thread réutilise sa connexion
+        et devient un point de sauvegarde (SAVEPOINT) : seul le bloc le plus externe valide la transaction.
         
         Returns:
             sqlite3.Cursor: Le curseur de la connexion à la base de données.
         """
-        # Établit la connexion à la base de données SQLite
-        self.con = sqlite3.connect(self.database)
+        # Bloc imbriqué : même connexion, point de sauvegarde nommé selon la profondeur
+        depth: int = getattr(active, "depth", 0)
+        if depth:
+            self.manager = active.manager
+            self.con = active.con
+            self.savepoint = f"nested_{depth}"
+            self.con.execute(f"SAVEPOINT {self.savepoint}")
+        else:
+            # Résout le gestionnaire partagé au moment de l'utilisation (il peut avoir été reconfiguré)
+            if self.manager is None:
+                self.manager = get_manager()
+
+            # Récupère une connexion déjà ouverte (aucune ouverture de fichier si elle existe)
+            self.con = self.manager.acquire()
+
+            # Transaction d'écriture : prise du verrou d'écriture dès le début, attente mesurée
+            if self.write:
+                start: float = perf_counter()
+                try:
+                    self.con.execute("BEGIN IMMEDIATE")
+                except Exception:
+                    # Verrou non obtenu : la connexion est rendue, aucune transaction n'est ouverte
+                    self.manager.release(self.con)
+                    raise
+                wait: float = perf_counter() - start
+                contention["transactions"] += 1
+                if wait > LOCK_WAIT_THRESHOLD:
+                    contention["lock_waits"] += 1
+                    contention["lock_wait_ms"] += wait * 1000
+
+            active.manager = self.manager
+            active.con = self.con
+        active.depth = depth + 1
 
         # Crée un objet curseur pour exécuter les commandes SQL
         self.cur = self.con.cursor()
@@ -45,7 +117,7 @@ class Database:
         
     def __exit__(self, exc_type: Optional[type], exc_value: Optional[BaseException], traceback: Optional[Any]) -> None:
         """
-        Gère la fermeture de la connexion, le commit ou le rollback.
+        Gère le commit ou le rollback, puis rend la connexion au gestionnaire sans la fermer.
         Méthode appelée lors de la sortie du bloc 'with'.
         
         Args:
@@ -55,33 +127,159 @@ class Database:
         """
         # Vérifie si la connexion existe et n'est pas None
         if self.con:
-            # Si aucune exception n'est survenue dans le bloc 'with'
-            if exc_type is None:
-                # Valide les changements (commit)
-                self.con.commit()
-            # Si une exception est survenue
-            else:
-                # Annule les changements (rollback)
-                self.con.rollback()
-            # Ferme la connexion à la base de données
-            self.con.close()
-
-# Définit le type pour le résultat d'une ligne de base de données (Tuple d'éléments de type Any)
+            # Ferme le curseur, la connexion reste ouverte pour les requêtes suivantes
+            if self.cur:
+                self.cur.close()
+            active.depth -= 1
+
+            # Bloc imbriqué : annule uniquement ses propres changements en cas d'erreur
+            if self.savepoint:
+                if exc_type is not None:
+                    self.con.execute(f"ROLLBACK TO {self.savepoint}")
+                self.con.execute(f"RELEASE {self.savepoint}")
+                return None
+
+            try:
+                # Si aucune exception n'est survenue dans le bloc 'with'
+                if exc_type is None:
+                    try:
+                        # Valide les changements (commit)
+                        self.con.commit()
+                    except Exception:
+                        # Validation refusée (ex: base verrouillée) : la transaction est annulée pour pouvoir être rejouée
+                        self.con.rollback()
+                        raise
+                # Si une exception est survenue
+                else:
+                    # Annule les changements (rollback)
+                    self.con.rollback()
+            finally:
+                # Rend la connexion au gestionnaire
+                active.con = None
+                self.manager.release(self.con)
+
+# Définit le type pour le résultat d'une ligne de base de données (Tuple d'éléments de type Any) ;
+# la priorité et le statut y sont des codes entiers, décodés à l'affichage (PRIORITY[code], STATUS[code])
 Row = Tuple[Any, ...]
 
 # Définit le type pour le résultat d'une requête (Liste de lignes)
 Result = List[Row]
 
-def execute_query(query: str, data: Tuple[Any, ...]) -> Optional[Result]:
+def note_write() -> None:
+    """
+    Signale une écriture du processus, pour que la version des données soit relue à la lecture suivante.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    global writes
+    writes += 1
+
+def get_data_version(cur: Cursor) -> int:
+    """
+    Retourne la version des données de la table 'task' (compteur de modifications, incrémenté par déclencheurs).
+
+    Le compteur n'est relu que si PRAGMA data_version (validations d'autres connexions, sans accès à une table)
+    ou le nombre d'écritures du processus ont changé depuis la lecture précédente sur cette connexion.
+
+    Args:
+        cur (sqlite3.Cursor): Le curseur de la transaction en cours.
+
+    Returns:
+        int: La version courante des données.
     """
-    Exécute une requête SQL et retourne les résultats si c'est une requête SELECT.
+    # Empreinte des changements visibles par la connexion courante
+    fingerprint: Tuple[int, int, int] = (id(cur.connection), cur.execute("PRAGMA data_version").fetchone()[0], writes)
+
+    # Aucun changement depuis la dernière lecture du compteur
+    seen: Optional[Tuple[Tuple[int, int, int], int]] = getattr(active, "version", None)
+    if seen is not None and seen[0] == fingerprint:
+        return seen[1]
+
+    # Relecture du compteur de modifications
+    version: int = cur.execute("SELECT version FROM task_version").fetchone()[0]
+    active.version = (fingerprint, version)
+    return version
+
+# Type du résultat d'une opération exécutée dans une transaction
+T = TypeVar("T")
+
+def is_busy(error: Exception) -> bool:
+    """
+    Indique si une erreur SQLite signale une base verrouillée par une autre connexion.
+
+    Args:
+        error (Exception): L'erreur levée.
+
+    Returns:
+        bool: True pour "database is locked" / "database is busy".
+    """
+    return isinstance(error, OperationalError) and ("locked" in str(error) or "busy" in str(error))
+
+def run_write(operation: Callable[[Cursor], T], manager: Optional[ConnectionManager] = None) -> T:
+    """
+    Exécute une opération dans une transaction d'écriture, rejouée si la base est verrouillée.
+
+    La transaction est ouverte par BEGIN IMMEDIATE (attente du verrou jusqu'à busy_timeout). Si le verrou
+    n'est toujours pas obtenu, ou si la validation est refusée, la transaction entière est annulée puis rejouée
+    jusqu'à WRITE_RETRIES fois, après une attente exponentielle avec une part aléatoire (les processus en
+    concurrence ne réessaient pas au même instant). Après la dernière tentative, l'erreur est levée :
+    l'écriture n'est jamais perdue silencieusement.
+
+    Dans une transaction déjà ouverte (bloc imbriqué), l'opération est exécutée une seule fois : c'est la transaction
+    la plus externe qui peut être rejouée.
+
+    Args:
+        operation (Callable[[Cursor], T]): L'opération, qui reçoit le curseur de la transaction.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        T: Le résultat de l'opération.
+
+    Raises:
+        sqlite3.OperationalError: Si la base reste verrouillée après toutes les tentatives.
+    """
+    # Bloc imbriqué : la transaction englobante gère le verrou et les tentatives
+    if getattr(active, "depth", 0):
+        with Database() as cur:
+            return operation(cur)
+
+    for attempt in range(WRITE_RETRIES + 1):
+        try:
+            with Database(manager, write=True) as cur:
+                return operation(cur)
+        except OperationalError as error:
+            if not is_busy(error) or attempt == WRITE_RETRIES:
+                contention["failures"] += 1
+                raise
+
+            # Attente exponentielle bornée, avec une part aléatoire, avant de rejouer la transaction
+            delay: float = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2 ** attempt) * random.uniform(0.5, 1.5)
+            contention["retries"] += 1
+            logs("RETRY", data=(attempt + 1,), duration=delay)
+            sleep(delay)
+
+    # Jamais atteint : la dernière tentative retourne ou lève une erreur
+    raise AssertionError("unreachable")
+
+def execute_query(
+        query: str,
+        data: Tuple[Any, ...],
+        operation: str = "QUERY",
+        manager: Optional[ConnectionManager] = None
+        ) -> Union[Result, int]:
+    """
+    Exécute une requête SQL, la journalise et retourne les résultats (SELECT) ou le nombre de lignes modifiées.
 
     Args:
         query (str): La requête SQL à exécuter.
         data (Tuple[Any, ...]): Le tuple de données à substituer dans la requête.
+        operation (str): Le nom de l'opération pour la journalisation (INSERT, SELECT, UPDATE, DELETE).
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
 
     Returns:
-        Optional[Result]: Les résultats de la requête (liste de tuples) si c'est un SELECT, sinon None.
+        Union[Result, int]: Les résultats de la requête (liste de tuples) si c'est un SELECT,
+                            sinon le nombre de lignes insérées, modifiées ou supprimées (cursor.rowcount).
     """
     # Vérifie si la requête commence par "SELECT"
     is_select: bool = query.startswith("SELECT")
@@ -89,181 +287,455 @@ def execute_query(query: str, data: Tuple[Any, ...]) -> Optional[Result]:
     # Initialisation du résultat à None ou au type de retour attendu
     result: Optional[Result] = None
 
-    # Utilisation du context manager Database pour gérer la connexion et la fermeture
-    with Database() as cur:
-        # Exécute la requête avec les données fournies
-        cur.execute(query, data)
+    # Chronométrage de chaque requête (journal des opérations et journal des requêtes lentes)
+    start: float = perf_counter()
+
+    # Si c'est une requête de sélection (SELECT) : lecture simple sur la connexion partagée
+    if is_select:
+        with Database(manager) as cur:
+            # Exécute la requête avec les données fournies et récupère tous les résultats
+            result = cur.execute(query, data).fetchall()
+        rows: int = len(result)
+
+    # Sinon : transaction d'écriture, rejouée si la base est verrouillée par un autre processus
+    else:
+        def modify(cur: Cursor) -> int:
+            # Exécute la requête avec les données fournies
+            cur.execute(query, data)
+            count: int = cur.rowcount
 
-        # Si c'est une requête de sélection (SELECT)
-        if is_select:
-            # Récupère tous les résultats de la requête
-            result = cur.fetchall()
+            # Écriture du processus (la version des données est incrémentée par les déclencheurs de la table)
+            if count > 0:
+                note_write()
+            return count
+
+        rows = run_write(modify, manager)
+
+    # Enregistrement de l'opération dans les logs
+    logs(operation, query, data, rows, perf_counter() - start)
             
-    # Retourne le résultat (la liste des lignes ou None)
-    return result
+    # Retourne le résultat (la liste des lignes ou le nombre de lignes modifiées)
+    return result if is_select else rows
 
-def insert_into_database(values: Tuple[Any, ...]) -> None:
+def insert_into_database(values: Tuple[Any, ...], manager: Optional[ConnectionManager] = None) -> None:
     """
     Insère une nouvelle ligne dans la table 'task'.
 
     Args:
         values (Tuple[Any, ...]): Un tuple contenant les valeurs de la tâche à insérer.
-        
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
     Returns:
         None: La fonction ne retourne rien.
     """
     # Crée une chaîne de caractères pour les placeholders (?), correspondant au nombre de valeurs
-    placeholders: str = f"({", ".join(["?" for _ in range(len(values))])})"
+    placeholders: str = f"({', '.join(['?' for _ in range(len(values))])})"
 
     # Construction de la requête SQL d'insertion avec les placeholders
     query: str = f"INSERT INTO task (label, collection, priority, status) VALUES {placeholders}"
 
-    # Les données à insérer sont les valeurs passées en argument
-    data: Tuple[Any, ...] = values
+    # Les données à insérer sont les valeurs passées en argument (priorité et statut encodés)
+    data: Tuple[Any, ...] = encode_row(values)
 
-    # Enregistrement de l'opération dans les logs
-    logs(query, data)
-
-    # Exécution de la requête d'insertion
-    execute_query(query, data)
+    # Exécution et journalisation de la requête d'insertion
+    execute_query(query, data, "INSERT", manager)
 
     # Retourne explicitement None
     return None
 
+def insert_many_into_database(rows: Iterable[Row], chunk_size: int = 10_000, manager: Optional[ConnectionManager] = None) -> int:
+    """
+    Insère un flux de lignes dans la table 'task' par paquets, une transaction par paquet.
+
+    Le flux n'est jamais matérialisé entièrement : seule une tranche de `chunk_size` lignes est en mémoire.
+
+    Args:
+        rows (Iterable[Row]): Les tuples (label, collection, priority, status) à insérer.
+        chunk_size (int): Le nombre de lignes insérées par transaction.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        int: Le nombre total de lignes insérées.
+    """
+    # Requête d'insertion préparée une seule fois pour tout le flux
+    query: str = "INSERT INTO task (label, collection, priority, status) VALUES (?, ?, ?, ?)"
+
+    # Itérateur unique consommé tranche par tranche
+    iterator: Iterator[Row] = iter(rows)
+
+    # Compteur des lignes insérées
+    total: int = 0
+
+    while True:
+        # Extraction de la tranche suivante (priorité et statut encodés)
+        chunk: Result = list(map(encode_row, islice(iterator, chunk_size)))
+
+        # Fin du flux
+        if not chunk:
+            break
+
+        # Insertion de la tranche dans une seule transaction d'écriture (rejouée si la base est verrouillée)
+        start: float = perf_counter()
+        run_write(lambda cur: (cur.executemany(query, chunk), note_write()), manager)
+
+        # Enregistrement de l'opération (une entrée par tranche)
+        logs("INSERT", query, chunk[0], len(chunk), perf_counter() - start)
+
+        total += len(chunk)
+
+    # Retourne le nombre de lignes insérées
+    return total
+
 # Définit le type pour les options de filtrage (clés str, valeurs de type variable)
 FilterOptions = Dict[str, Any]
 
-def select_from_database(options: FilterOptions) -> Optional[Result]:
+def build_select_query(
+        options: FilterOptions,
+        after_id: int = 0,
+        limit: int = 0,
+        sort: str = "collection",
+        descending: bool = False,
+        anchor: Optional[Any] = None,
+        archived: bool = False
+        ) -> Tuple[str, Tuple[Any, ...]]:
     """
-    Sélectionne des tâches dans la table 'task' en fonction des options de filtre.
+    Construit la requête de lecture paginée et ses paramètres.
 
     Args:
         options (FilterOptions): Un dictionnaire de critères de filtrage.
+        after_id (int): L'identifiant de la dernière tâche déjà lue (0 pour partir du début).
+        limit (int): Le nombre maximal de tâches à retourner (0 pour aucune limite).
+        sort (str): La colonne de tri ("collection", "priority" ou "id"), départagée par l'identifiant.
+        descending (bool): Trie par ordre décroissant.
+        anchor (Optional[Any]): La valeur de tri de la tâche `after_id`, si elle est déjà connue
+                                (lecture répartie : la tâche n'est pas dans tous les fragments).
+        archived (bool): Lit aussi les tâches archivées.
 
     Returns:
-        Optional[Result]: Une liste des tâches (lignes de la DB) ou None.
+        Tuple[str, Tuple[Any, ...]]: La requête et ses paramètres.
+    """
+    # Colonnes de filtre renseignées (ordre canonique) et valeurs correspondantes
+    filters, data = canonicalize(options)
+
+    # Paramètres de la reprise (colonne de tri, id) puis de la limite éventuelle
+    anchored: bool = anchor is not None and sort != "id"
+    if after_id:
+        data += (after_id,) if sort == "id" else (anchor, after_id) if anchored else (after_id, after_id)
+    if limit:
+        data += (limit,)
+
+    # Requête compilée une seule fois par forme (filtres, reprise, limite, tri)
+    query: str = compile_query("SELECT", filters, keyset=bool(after_id), limited=bool(limit), sort=sort, descending=descending,
+                               anchored=anchored and bool(after_id), archived=archived)
+    return query, data
+
+def build_next_query(limit: int = 20) -> Tuple[str, Tuple[Any, ...]]:
     """
-    # Filtre les options pour ne garder que celles qui ont une valeur (non nulles/vides)
-    criteria: FilterOptions = {k: v for k, v in options.items() if v}
+    Construit la requête des tâches ouvertes les plus urgentes et ses paramètres.
 
-    # Crée la chaîne de caractères pour la clause WHERE (ex: "key1 = ? AND key2 = ?")
-    expression: str = " AND ".join([f"{k} = ?" for k, v in criteria.items()])
+    Args:
+        limit (int): Le nombre de tâches à retourner.
 
-    # Extrait les valeurs des critères pour les utiliser comme données dans la requête
-    data: Tuple[Any, ...] = tuple(criteria.values())
+    Returns:
+        Tuple[str, Tuple[Any, ...]]: La requête et ses paramètres.
+    """
+    # Le code de chaque statut ouvert (une branche par statut), puis la limite de la fusion
+    data: Tuple[Any, ...] = (*(encode("status", status) for status in OPEN_STATUS), limit)
+    return compile_next_query(len(OPEN_STATUS)), data
 
-    # Si aucune donnée de filtre n'est présente (sélectionner tout)
-    if not data:
-        # Requête pour sélectionner toutes les colonnes de toutes les tâches
-        # Le tri sera automatiquement appliqué sur le libellé de la collection de façon ascendante A -> Z
-        query: str = "SELECT * FROM task ORDER BY collection ASC"
-        # Enregistrement de l'opération (READ) sans les données (elles sont vides)
-        logs(query) 
-        # Exécution et retour des résultats
-        return execute_query(query, data)
-    
-    # Si des critères sont présents, construction de la requête avec la clause WHERE
-    # Le tri sera automatiquement appliqué sur le libellé de la collection de façon ascendante A -> Z
-    query: str = f"SELECT * FROM task WHERE {expression} ORDER BY collection ASC"
+def build_search_query(text: str, options: FilterOptions, limit: int = 0, ranked: bool = False) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Construit la requête de recherche plein texte et ses paramètres.
 
-    # Enregistrement de l'opération (READ) avec la requête et les données de filtrage
-    logs(query, data)
+    Args:
+        text (str): La requête plein texte.
+        options (FilterOptions): Un dictionnaire de critères de filtrage supplémentaires.
+        limit (int): Le nombre maximal de tâches à retourner (0 pour aucune limite).
+        ranked (bool): Ajoute le rang BM25 en dernière colonne de chaque ligne.
 
-    # Exécution et retour des résultats
-    return execute_query(query, data)
-    
-def update_from_database(columns: FilterOptions, options: FilterOptions) -> None:
+    Returns:
+        Tuple[str, Tuple[Any, ...]]: La requête et ses paramètres.
     """
-    Met à jour les colonnes de tâches sélectionnées par les options de critère.
+    # Colonnes de filtre renseignées (ordre canonique) et valeurs correspondantes
+    filters, criteria = canonicalize(options)
+
+    # Paramètres : requête plein texte, filtres, puis limite éventuelle
+    data: Tuple[Any, ...] = (text, *criteria, *((limit,) if limit else ()))
+
+    # Requête compilée une seule fois par forme (filtres, limite)
+    return compile_query("SEARCH", filters, limited=bool(limit), ranked=ranked), data
+
+def build_update_query(columns: FilterOptions, options: FilterOptions) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Construit la requête de mise à jour et ses paramètres.
 
     Args:
         columns (FilterOptions): Un dictionnaire de colonnes à mettre à jour et leurs nouvelles valeurs.
         options (FilterOptions): Un dictionnaire de critères pour sélectionner les tâches à mettre à jour.
-        
+
     Returns:
-        None: La fonction ne retourne rien.
+        Tuple[str, Tuple[Any, ...]]: La requête et ses paramètres (valeurs SET, puis critères).
+    """
+    # Colonnes à modifier et critères renseignés (ordre canonique), avec leurs valeurs
+    assignments, values = canonicalize(columns)
+    filters, criteria = canonicalize(options)
+
+    # Requête compilée une seule fois par forme (colonnes SET, colonnes WHERE)
+    return compile_query("UPDATE", filters, assignments), (*values, *criteria)
+
+def build_delete_query(options: FilterOptions) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Construit la requête de suppression et ses paramètres.
+
+    Args:
+        options (FilterOptions): Un dictionnaire de critères pour sélectionner les tâches à supprimer.
+
+    Returns:
+        Tuple[str, Tuple[Any, ...]]: La requête et ses paramètres.
+    """
+    # Critères renseignés (ordre canonique) et valeurs correspondantes
+    filters, data = canonicalize(options)
+
+    # Requête compilée une seule fois par forme (colonnes WHERE)
+    return compile_query("DELETE", filters), data
+
+def fetch_pages(cur: Cursor, query: str, data: Tuple[Any, ...], page_size: int, elapsed: List[float]) -> Iterator[Result]:
+    """
+    Exécute une requête et lit le curseur par tranches, en ne chronométrant que le travail de SQLite.
+
+    Le temps passé par l'appelant à traiter chaque page (rendu, écriture) n'est pas compté.
+
+    Args:
+        cur (sqlite3.Cursor): Le curseur de la transaction en cours.
+        query (str): La requête SQL.
+        data (Tuple[Any, ...]): Les paramètres de la requête.
+        page_size (int): Le nombre de lignes récupérées par appel à fetchmany.
+        elapsed (List[float]): Accumulateur (un seul élément) de la durée d'exécution, en secondes.
+
+    Yields:
+        Result: Des pages successives d'au plus `page_size` lignes.
+    """
+    start: float = perf_counter()
+    cur.execute(query, data)
+    while page := cur.fetchmany(page_size):
+        elapsed[0] += perf_counter() - start
+        yield page
+        start = perf_counter()
+    elapsed[0] += perf_counter() - start
+
+def iter_select_from_database(
+        options: FilterOptions,
+        after_id: int = 0,
+        limit: int = 0,
+        page_size: int = 500,
+        sort: str = "collection",
+        descending: bool = False,
+        anchor: Optional[Any] = None,
+        archived: bool = False,
+        manager: Optional[ConnectionManager] = None
+        ) -> Iterator[Result]:
+    """
+    Sélectionne des tâches page par page, sans jamais charger le résultat complet en mémoire.
+
+    Les tâches sont triées par la colonne `sort` (collection par défaut) puis par identifiant, dans le même sens.
+    La pagination est de type "keyset" : la page suivante démarre après la tâche `after_id` dans cet ordre,
+    sans OFFSET à parcourir.
+    Si le cache des lectures est actif, un résultat déjà lu pour la même version des données est servi sans requête.
+
+    Args:
+        options (FilterOptions): Un dictionnaire de critères de filtrage.
+        after_id (int): L'identifiant de la dernière tâche déjà lue (0 pour partir du début).
+        limit (int): Le nombre maximal de tâches à retourner (0 pour aucune limite).
+        page_size (int): Le nombre de tâches récupérées par appel à fetchmany.
+        sort (str): La colonne de tri ("collection", "priority" ou "id").
+        descending (bool): Trie par ordre décroissant.
+        anchor (Optional[Any]): La valeur de tri de la tâche `after_id`, si elle est déjà connue.
+        archived (bool): Lit aussi les tâches archivées (fusionnées dans l'ordre par la vue 'task_all').
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Yields:
+        Result: Des pages successives d'au plus `page_size` lignes.
+    """
+    # Requête compilée une seule fois par forme (filtres, reprise, limite, tri) et ses paramètres
+    query, data = build_select_query(options, after_id, limit, sort, descending, anchor, archived)
+
+    # Nombre de lignes lues et début du chronométrage
+    rows: int = 0
+    start: float = perf_counter()
+
+    with Database(manager) as cur:
+        # Cache des lectures : résultat conservé tant que la version des données n'a pas changé
+        key: CacheKey = ((manager or get_manager()).database, query, data)
+        version: int = get_data_version(cur) if cache.enabled else 0
+        entry: Optional[Tuple[Result, float]] = cache.get(key, version) if cache.enabled else None
+        if entry is not None:
+            # Durée de la recherche dans le cache, et durée de la requête d'origine évitée
+            cached, saved_ms = entry
+            logs("SELECT CACHED", query, data, len(cached), perf_counter() - start, saved=saved_ms / 1000)
+            for index in range(0, len(cached), page_size):
+                yield cached[index:index + page_size]
+            return
+
+        # Lecture du curseur par tranches (les lignes sont conservées pour le cache tant que le résultat reste petit)
+        kept: Optional[Result] = [] if cache.enabled else None
+        elapsed: List[float] = [perf_counter() - start]
+        for page in fetch_pages(cur, query, data, page_size, elapsed):
+            rows += len(page)
+            if kept is not None and rows <= cache.max_rows:
+                kept.extend(page)
+            else:
+                kept = None
+            yield page
+
+    # Mise en cache du résultat complet (durée passée dans SQLite uniquement)
+    duration: float = elapsed[0]
+    if kept is not None:
+        cache.put(key, version, kept, duration * 1000)
+
+    # Enregistrement de l'opération (SELECT) une fois le curseur épuisé
+    logs("SELECT", query, data, rows, duration)
+
+def search_database(
+        text: str,
+        options: FilterOptions,
+        limit: int = 0,
+        page_size: int = 500,
+        ranked: bool = False,
+        manager: Optional[ConnectionManager] = None
+        ) -> Iterator[Result]:
+    """
+    Recherche des tâches en plein texte (libellé et collection), triées par pertinence BM25.
+
+    La syntaxe de requête est celle de FTS5 : mots (tous requis), "expression exacte", préfixe*, OR, NOT,
+    ou restriction à une colonne (ex: "collection: projet").
+
+    Args:
+        text (str): La requête plein texte.
+        options (FilterOptions): Un dictionnaire de critères de filtrage supplémentaires (égalité).
+        limit (int): Le nombre maximal de tâches à retourner (0 pour aucune limite).
+        page_size (int): Le nombre de tâches récupérées par appel à fetchmany.
+        ranked (bool): Ajoute le rang BM25 en dernière colonne de chaque ligne (fusion de plusieurs fragments).
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Yields:
+        Result: Des pages successives d'au plus `page_size` lignes, de la plus pertinente à la moins pertinente.
+    """
+    # Requête compilée une seule fois par forme (filtres, limite) et ses paramètres (texte, filtres, limite)
+    query, data = build_search_query(text, options, limit, ranked)
+
+    # Nombre de lignes lues
+    rows: int = 0
+
+    # Lecture du curseur par tranches (seul le travail de SQLite est chronométré)
+    elapsed: List[float] = [0.0]
+    with Database(manager) as cur:
+        for page in fetch_pages(cur, query, data, page_size, elapsed):
+            rows += len(page)
+            yield page
+
+    # Enregistrement de l'opération (SEARCH) une fois le curseur épuisé
+    logs("SEARCH", query, data, rows, elapsed[0])
+
+def next_from_database(limit: int = 20, manager: Optional[ConnectionManager] = None) -> Result:
+    """
+    Retourne les tâches ouvertes (à faire, en cours) les plus urgentes : priorité décroissante, puis les plus récentes.
+
+    Chaque statut est lu dans l'ordre de l'index (status, priority) : le coût dépend de `limit`, pas de la taille de la table.
+
+    Args:
+        limit (int): Le nombre de tâches à retourner.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        Result: Les tâches, de la plus urgente à la moins urgente.
     """
-    # Filtre les colonnes à mettre à jour pour ne garder que celles qui ont une valeur
-    columns: FilterOptions = {k: v for k, v in columns.items() if v}
-    # Filtre les critères de sélection pour ne garder que ceux qui ont une valeur
-    criteria: FilterOptions = {k: v for k, v in options.items() if v}
+    # Requête compilée une seule fois par nombre de statuts ouverts
+    query, data = build_next_query(limit)
 
-    # Crée la chaîne de caractères pour la clause SET (colonnes à mettre à jour)
-    expression_column: str = ", ".join([f"{k} = ?" for k, v in columns.items()])
-    # Crée la chaîne de caractères pour la clause WHERE (critères de sélection)
-    expression_criteria: str = " AND ".join([f"{k} = ?" for k, v in criteria.items()])
+    # Exécution et journalisation de la lecture
+    return execute_query(query, data, "NEXT", manager)
 
-    # Construction de la requête SQL de mise à jour
-    query: str = f"UPDATE task SET {expression_column} WHERE {expression_criteria}"
+def select_from_database(options: FilterOptions) -> Optional[Result]:
+    """
+    Sélectionne des tâches dans la table 'task' en fonction des options de filtre.
+
+    Args:
+        options (FilterOptions): Un dictionnaire de critères de filtrage.
 
-    # Crée le tuple de données en combinant les valeurs des colonnes à mettre à jour et des critères
-    data: Tuple[Any, ...] = (*columns.values(), *criteria.values())
+    Returns:
+        Optional[Result]: Une liste des tâches (lignes de la DB) ou None.
+    """
+    # Rassemble toutes les pages dans une seule liste
+    return [row for page in iter_select_from_database(options) for row in page]
+    
+def update_from_database(columns: FilterOptions, options: FilterOptions, manager: Optional[ConnectionManager] = None) -> int:
+    """
+    Met à jour les colonnes de tâches sélectionnées par les options de critère, en une seule requête et une seule transaction.
+
+    Un critère peut être une valeur simple ou une liste de valeurs et d'intervalles {"from", "to"}.
+
+    Args:
+        columns (FilterOptions): Un dictionnaire de colonnes à mettre à jour et leurs nouvelles valeurs.
+        options (FilterOptions): Un dictionnaire de critères pour sélectionner les tâches à mettre à jour.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
         
-    # Enregistrement de l'opération (UPDATE) dans les logs (Note: l'appel à logs a été simplifié dans votre code)
-    logs(query, data)
+    Returns:
+        int: Le nombre de tâches modifiées.
+    """
+    # Requête compilée une seule fois par forme (colonnes SET, colonnes WHERE), valeurs SET puis critères
+    query, data = build_update_query(columns, options)
 
-    # Exécution de la requête de mise à jour
-    execute_query(query, data)
-    # Retourne explicitement None (conforme à l'annotation de type -> None)
-    return None
+    # Exécution et journalisation de la requête de mise à jour, qui retourne le nombre de tâches modifiées
+    return execute_query(query, data, "UPDATE", manager)
    
-def delete_from_database(options: FilterOptions) -> None:
+def delete_from_database(options: FilterOptions, manager: Optional[ConnectionManager] = None) -> int:
     """
-    Supprime des tâches dans la table 'task' en fonction des options de critère.
+    Supprime des tâches dans la table 'task' en fonction des options de critère, en une seule requête et une seule transaction.
+
+    Un critère peut être une valeur simple ou une liste de valeurs et d'intervalles {"from", "to"}.
 
     Args:
         options (FilterOptions): Un dictionnaire de critères pour sélectionner les tâches à supprimer.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
         
     Returns:
-        None: La fonction ne retourne rien.
+        int: Le nombre de tâches supprimées.
     """
-    # Filtre les critères de sélection pour ne garder que ceux qui ont une valeur
-    criteria: FilterOptions = {k: v for k, v in options.items() if v}
+    # Requête compilée une seule fois par forme (colonnes WHERE) et ses paramètres
+    query, data = build_delete_query(options)
 
-    # Crée la chaîne de caractères pour la clause WHERE (critères de sélection)
-    expression: str = " AND ".join([f"{k} = ?" for k, v in criteria.items()])
-    
-    # Construction de la requête SQL de suppression
-    query: str = f"DELETE FROM task WHERE {expression}"
+    # Exécution et journalisation de la requête de suppression, qui retourne le nombre de tâches supprimées
+    return execute_query(query, data, "DELETE", manager)
 
-    # Extrait les valeurs des critères pour les utiliser comme données dans la requête
-    data: Tuple[Any, ...] = tuple(criteria.values())
+# Définit le type d'une étape du plan d'exécution : (id, id du parent, description)
+PlanStep = Tuple[int, int, str]
 
-    # Enregistrement de l'opération (DELETE) dans les logs
-    logs(query, data)
+def explain_query(query: str, data: Tuple[Any, ...], manager: Optional[ConnectionManager] = None) -> List[PlanStep]:
+    """
+    Retourne le plan d'exécution d'une requête (EXPLAIN QUERY PLAN), sans l'exécuter.
 
-    # Exécution de la requête de suppression
-    execute_query(query, data)
+    Une requête de modification n'est pas appliquée : seul son plan est calculé, dans une transaction de lecture.
 
-    # Retourne explicitement None
-    return None
+    Args:
+        query (str): La requête SQL.
+        data (Tuple[Any, ...]): Les paramètres de la requête.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
 
-def drop_create_table() -> None:
+    Returns:
+        List[PlanStep]: Les étapes du plan, dans l'ordre de SQLite.
+    """
+    with Database(manager) as cur:
+        return [(step[0], step[1], step[3]) for step in cur.execute(f"EXPLAIN QUERY PLAN {query}", data)]
+
+def get_pragmas(names: Iterable[str]) -> Dict[str, Any]:
     """
-    Supprime la table 'task' si elle existe, puis la recrée avec la structure définie.
+    Lit la valeur effective de PRAGMA sur la connexion partagée.
+
+    Args:
+        names (Iterable[str]): Les noms des PRAGMA à lire.
 
     Returns:
-        None: La fonction ne retourne rien.
+        Dict[str, Any]: La valeur de chaque PRAGMA.
     """
-    # Définition de la requête SQL multiple (DROP et CREATE TABLE)
-    query: str = """
-    DROP TABLE IF EXISTS task;
-    
-    CREATE TABLE IF NOT EXISTS task(
-        id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-        label TEXT NOT NULL,
-        collection TEXT NOT NULL,
-        priority TEXT NOT NULL,
-        status TEXT NOT NULL
-    );
-    """
-    # Utilisation du context manager Database
     with Database() as cur:
-        # Exécute un script SQL (plusieurs commandes séparées par ;)
-        cur.executescript(query)
-    
-    # Enregistrement de l'opération (RESET) dans les logs
-    logs()
-    
-    # Retourne explicitement None
-    return None
\ No newline at end of file
+        return {name: cur.execute(f"PRAGMA {name}").fetchone()[0] for name in names}
@@ -1,51 +1,264 @@
+import atexit
+import json
 import logging
-from typing import Tuple, Optional, Any
+import os
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 # Récupération d'un logger nommé pour la gestion des messages de log
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Le logger de l'application n'hérite pas de la configuration du logger racine
+logger.propagate = False
+
+# Niveau spécial désactivant complètement la journalisation
+OFF: int = logging.CRITICAL + 10
+
+# Logger séparé des requêtes lentes, écrit dans son propre fichier
+slow_logger: logging.Logger = logging.getLogger(f"{__name__}.slow")
+slow_logger.propagate = False
+
+# Écouteur en arrière-plan qui écrit les enregistrements dans le fichier (None tant que non configuré)
+listener: Optional[QueueListener] = None
+
+# Écouteur du journal des requêtes lentes (None si ce journal est désactivé)
+slow_listener: Optional[QueueListener] = None
+
+# Seuil au-delà duquel une opération est enregistrée dans le journal des requêtes lentes, en ms (None = désactivé)
+slow_query_ms: Optional[float] = None
+
+# Fonctions recevant les champs de chaque opération, même si la journalisation est désactivée (ex: profilage)
+observers: List[Callable[[Dict[str, Any]], None]] = []
+
+# Proportion des opérations journalisées (1.0 = toutes, 0.1 = une sur dix en moyenne)
+sample_rate: float = 1.0
+
+# Verrou protégeant la configuration (threads du serveur ou des fragments journalisant leur première opération
+# en même temps) ; réentrant car configure_logging() appelle stop_logging()
+lock: threading.RLock = threading.RLock()
+
+
+class JsonFormatter(logging.Formatter):
+    """Définition du formateur qui produit un objet JSON par ligne de log."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Sérialise un enregistrement de log en JSON (exécuté dans le thread de l'écouteur).
+
+        Args:
+            record (logging.LogRecord): L'enregistrement à formater.
+
+        Returns:
+            str: La ligne JSON.
+        """
+        # Champs communs à tous les enregistrements
+        payload: Dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+
+        # Champs structurés transmis par logs()
+        payload.update(getattr(record, "fields", {}))
+
+        # Nettoyage de la requête (retours à la ligne et espaces inutiles) hors du chemin critique
+        if "query" in payload:
+            payload["query"] = " ".join(payload["query"].split())
+
+        return json.dumps(payload, ensure_ascii=False)
+
+def start_listener(target: logging.Logger, filename: str) -> QueueListener:
+    """
+    Relie un logger à un fichier JSON à rotation, écrit en arrière-plan par un écouteur.
+
+    Args:
+        target (logging.Logger): Le logger dont les enregistrements sont écrits dans le fichier.
+        filename (str): Le fichier de log.
+
+    Returns:
+        QueueListener: L'écouteur démarré.
+    """
+    # Écriture JSON dans un fichier à rotation, réalisée par le thread de l'écouteur
+    file_handler: RotatingFileHandler = RotatingFileHandler(
+        filename,
+        maxBytes=int(os.environ.get("TASK_MANAGER_LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+        backupCount=int(os.environ.get("TASK_MANAGER_LOG_BACKUPS", "5")),
+        encoding="utf-8",
+        delay=True)
+    file_handler.setFormatter(JsonFormatter())
+
+    # Le chemin critique se contente de déposer l'enregistrement dans la file
+    queue: SimpleQueue = SimpleQueue()
+    target.addHandler(QueueHandler(queue))
+    queue_listener: QueueListener = QueueListener(queue, file_handler)
+    queue_listener.start()
+    return queue_listener
+
+def configure_logging(
+        level: Optional[str] = None,
+        filename: Optional[str] = None,
+        sample: Optional[float] = None,
+        slow_ms: Optional[str] = None,
+        slow_filename: Optional[str] = None
+        ) -> None:
+    """
+    Configure une seule fois la journalisation : file d'attente en mémoire, écriture JSON en arrière-plan et rotation.
+
+    Les valeurs non précisées sont lues dans les variables d'environnement TASK_MANAGER_LOG_LEVEL
+    (DEBUG, INFO, WARNING, ... ou OFF), TASK_MANAGER_LOG_FILE, TASK_MANAGER_LOG_SAMPLE,
+    TASK_MANAGER_LOG_MAX_BYTES, TASK_MANAGER_LOG_BACKUPS, TASK_MANAGER_SLOW_QUERY_MS et TASK_MANAGER_SLOW_QUERY_FILE.
+
+    Le journal des requêtes lentes est indépendant du niveau de log : il reste actif lorsque la journalisation
+    des opérations est désactivée, et n'est pas échantillonné.
+
+    Args:
+        level (Optional[str]): Le niveau minimal journalisé, ou "OFF" pour tout désactiver.
+        filename (Optional[str]): Le fichier de log.
+        sample (Optional[float]): La proportion des opérations journalisées, entre 0 et 1.
+        slow_ms (Optional[str]): Le seuil des requêtes lentes en millisecondes, ou "OFF" pour désactiver leur journal.
+        slow_filename (Optional[str]): Le fichier du journal des requêtes lentes.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    global listener, slow_listener, sample_rate, slow_query_ms
+
+    with lock:
+        # Arrêt d'une éventuelle configuration précédente
+        stop_logging()
+
+        # Résolution des paramètres (argument, puis variable d'environnement, puis valeur par défaut)
+        level = (level or os.environ.get("TASK_MANAGER_LOG_LEVEL", "INFO")).upper()
+        filename = filename or os.environ.get("TASK_MANAGER_LOG_FILE", "task_manager.log")
+        sample_rate = sample if sample is not None else float(os.environ.get("TASK_MANAGER_LOG_SAMPLE", "1.0"))
+        slow_ms = (slow_ms or os.environ.get("TASK_MANAGER_SLOW_QUERY_MS", "100")).upper()
+        slow_filename = slow_filename or os.environ.get("TASK_MANAGER_SLOW_QUERY_FILE", "task_manager.slow.log")
+
+        # Journal des requêtes lentes, dans son propre fichier
+        slow_query_ms = None if slow_ms == "OFF" else float(slow_ms)
+        if slow_query_ms is not None:
+            slow_logger.setLevel(logging.WARNING)
+            slow_listener = start_listener(slow_logger, slow_filename)
+
+        # Niveau désactivé : aucun gestionnaire, logs() retourne immédiatement (hors requêtes lentes)
+        if level == "OFF":
+            logger.setLevel(OFF)
+            return None
+        # Écriture JSON en arrière-plan dans un fichier à rotation (niveau fixé ensuite : un thread qui voit le niveau
+        # configuré trouve l'écouteur déjà démarré)
+        listener = start_listener(logger, filename)
+        logger.setLevel(level)
+
+    # Retourne explicitement None
+    return None
+
+def stop_logging() -> None:
+    """
+    Vide la file d'attente, arrête l'écouteur et retire les gestionnaires (appelée automatiquement à la sortie).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    global listener, slow_listener
+
+    with lock:
+        # Arrêt des écouteurs (les enregistrements en attente sont écrits avant l'arrêt)
+        for queue_listener in (listener, slow_listener):
+            if queue_listener is not None:
+                queue_listener.stop()
+                for handler in queue_listener.handlers:
+                    handler.close()
+        listener = slow_listener = None
+
+        # Retrait des gestionnaires de file d'attente
+        for target in (logger, slow_logger):
+            for handler in list(target.handlers):
+                target.removeHandler(handler)
+
+    # Retourne explicitement None
+    return None
+
+# Écriture des derniers enregistrements à la fin du processus
+atexit.register(stop_logging)
+
+def is_logging_enabled() -> bool:
+    """
+    Indique si les opérations sont journalisées ou observées (configuration par défaut au premier appel).
+
+    Returns:
+        bool: True si le niveau INFO est actif ou si un observateur est enregistré.
+    """
+    # Configuration par défaut si l'application ne l'a pas faite au démarrage (vérifiée de nouveau sous verrou :
+    # un seul thread configure, les autres attendent la fin de la configuration)
+    if listener is None and logger.level == logging.NOTSET:
+        with lock:
+            if listener is None and logger.level == logging.NOTSET:
+                configure_logging()
+    return bool(observers) or logger.isEnabledFor(logging.INFO)
+
 # Définition de la fonction de journalisation des opérations de base de données
 def logs(
-        query: Optional[str] = None, 
-        data: Optional[Tuple[Any, ...]] = None
+        operation: str = "RESET",
+        query: Optional[str] = None,
+        data: Optional[Tuple[Any, ...]] = None,
+        rows: Optional[int] = None,
+        duration: Optional[float] = None,
+        table: str = "task",
+        saved: Optional[float] = None
         ) -> None:
     """
-    Configure et enregistre les logs des opérations sur la base de données.
+    Enregistre une opération sur la base de données sous forme structurée.
+
+    Les valeurs des paramètres ne sont pas journalisées, seulement leur nombre. Une opération dont la durée
+    atteint le seuil TASK_MANAGER_SLOW_QUERY_MS est aussi enregistrée dans le journal des requêtes lentes.
 
     Args:
+        operation (str): Le nom de l'opération (INSERT, SELECT, UPDATE, DELETE, MIGRATE, RESET...).
         query (Optional[str]): La requête SQL exécutée.
-        data (Optional[Tuple[Any, ...]]): Les données associées à la requête.
+        data (Optional[Tuple[Any, ...]]): Les paramètres associés à la requête.
+        rows (Optional[int]): Le nombre de lignes lues ou modifiées.
+        duration (Optional[float]): La durée d'exécution, en secondes.
+        table (str): La table concernée.
+        saved (Optional[float]): La durée de la requête évitée (lecture servie par le cache), en secondes.
 
     Returns:
         None: La fonction ne retourne rien.
     """
-    # Configuration de base pour le système de logging (uniquement si non configuré)
-    logging.basicConfig(
-        # Spécifie le fichier où les logs seront écrits
-        filename="task_manager.log",
-        # Définit le niveau de logging minimum à INFO
-        level=logging.INFO,
-        # Définit le format des messages de log (horodatage - niveau - message)
-        format="%(asctime)s - %(levelname)s - %(message)s"
-    )
-
-    # Initialisation de la variable qui contiendra le message de log final
-    message: str
-
-    # Vérifie si une requête et des données sont fournies (opérations CRUD)
-    if query and data:
-        # Nettoie la requête (enlève les retours à la ligne et les espaces inutiles)
-        message = query.replace("\n", "").strip()
-        # Ajoute les données associées à la fin du message
-        message += f" = {data}"
-    # Si la requête ou les données sont manquantes (souvent pour la réinitialisation)
-    else: 
-        # Définit un message générique pour la réinitialisation
-        message = "Réinitialisation de la base de données"
- 
-    # Enregistrement du message de log formaté
-    logger.info(msg=message)
-    
+    # Coût quasi nul lorsque la journalisation est désactivée (ou l'opération non échantillonnée) et sans observateur
+    logged: bool = (is_logging_enabled() and logger.isEnabledFor(logging.INFO)
+                    and (sample_rate >= 1.0 or random.random() < sample_rate))
+    slow: bool = slow_query_ms is not None and duration is not None and duration * 1000 >= slow_query_ms
+    if not logged and not slow and not observers:
+        return None
+
+    # Champs structurés, sérialisés plus tard par le thread de l'écouteur
+    fields: Dict[str, Any] = {"operation": operation, "table": table}
+    if query is not None:
+        fields["query"] = query
+    if data is not None:
+        fields["parameters"] = len(data)
+    if rows is not None and rows >= 0:
+        fields["rows"] = rows
+    if duration is not None:
+        fields["duration_ms"] = round(duration * 1000, 3)
+    if saved is not None:
+        fields["saved_ms"] = round(saved * 1000, 3)
+
+    # Transmission aux observateurs (chaque opération, sans échantillonnage)
+    for observer in observers:
+        observer(fields)
+
+    # Enregistrement du message de log, si le niveau est actif et que l'opération est échantillonnée
+    if logged:
+        logger.info(operation, extra={"fields": fields})
+
+    # Enregistrement dans le journal des requêtes lentes (forme de la requête, sans échantillonnage)
+    if slow:
+        slow_logger.warning(operation, extra={"fields": fields})
+
     # Ne retourne rien
-    return None
\ No newline at end of file
+    return None
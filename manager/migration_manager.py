@@ -0,0 +1,383 @@
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+from .connection_manager import ConnectionManager
+from .constant_manager import FINISHED_STATUS, PRIORITY, STATUS
+from .database_manager import Database
+from .logging_manager import logs
+
+
+def encode_case(column: str, values: List[str]) -> str:
+    """
+    Construit l'expression SQL convertissant une colonne texte en code entier (position dans la liste).
+
+    Les valeurs inconnues donnent NULL, refusé par la contrainte NOT NULL : elles ne sont jamais converties
+    en silence (elles sont signalées au préalable, voir CHECKS).
+
+    Args:
+        column (str): Le nom de la colonne texte.
+        values (List[str]): Les valeurs possibles, dans l'ordre des codes.
+
+    Returns:
+        str: L'expression CASE correspondante.
+    """
+    branches: str = " ".join(f"WHEN '{value}' THEN {code}" for code, value in enumerate(values))
+    return f"CASE lower(trim({column})) {branches} ELSE NULL END"
+
+def known_values(column: str, values: List[str]) -> str:
+    """
+    Construit la condition SQL vraie lorsqu'une colonne texte contient une valeur de la liste (casse et espaces ignorés).
+
+    Args:
+        column (str): Le nom de la colonne texte.
+        values (List[str]): Les valeurs possibles.
+
+    Returns:
+        str: La condition IN correspondante.
+    """
+    quoted: str = ", ".join(f"'{value}'" for value in values)
+    return f"lower(trim({column})) IN ({quoted})"
+
+def version_triggers(tables: List[str]) -> str:
+    """
+    Construit les déclencheurs incrémentant le compteur de modifications après chaque écriture dans des tables.
+
+    Args:
+        tables (List[str]): Les tables surveillées.
+
+    Returns:
+        str: Les instructions CREATE TRIGGER (insertion, modification et suppression de chaque table).
+    """
+    return "\n".join(
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()} AFTER {event} ON {table} BEGIN "
+        "UPDATE task_version SET version = version + 1; END;"
+        for table in tables for event in ("INSERT", "UPDATE", "DELETE"))
+
+# Codes des statuts achevés, dans les conditions des déclencheurs (ex: "2, 3")
+FINISHED_CODES: str = ", ".join(str(STATUS.index(status)) for status in FINISHED_STATUS)
+
+# Instant courant en secondes Unix, dans les scripts SQL
+NOW: str = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+# Définit le type d'une migration : (version cible, description, script SQL)
+Migration = Tuple[int, str, str]
+
+# Liste ordonnée des migrations du schéma (la version courante est stockée dans PRAGMA user_version)
+MIGRATIONS: List[Migration] = [
+    (1, "Création de la table 'task'", """
+    CREATE TABLE IF NOT EXISTS task(
+        id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+        label TEXT NOT NULL,
+        collection TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        status TEXT NOT NULL
+    );
+    """),
+    (2, "Index secondaires sur les colonnes de filtre et de tri", """
+    -- Tri par défaut (collection, id) et filtre sur la collection
+    CREATE INDEX IF NOT EXISTS task_collection_idx ON task(collection);
+    -- Filtre sur le statut seul, déjà trié par collection
+    CREATE INDEX IF NOT EXISTS task_status_idx ON task(status, collection);
+    -- Filtres combinant statut et priorité, déjà triés par collection
+    CREATE INDEX IF NOT EXISTS task_status_priority_idx ON task(status, priority, collection);
+    -- Filtre sur la priorité seule, déjà trié par collection
+    CREATE INDEX IF NOT EXISTS task_priority_idx ON task(priority, collection);
+    -- Filtre sur le libellé
+    CREATE INDEX IF NOT EXISTS task_label_idx ON task(label);
+    -- Mise à jour des statistiques utilisées par le planificateur de requêtes
+    PRAGMA optimize;
+    """),
+    (3, "Index couvrant pour les statistiques par collection et statut", """
+    -- Tableau croisé collection x statut lu dans l'ordre de l'index, sans accès à la table
+    CREATE INDEX IF NOT EXISTS task_collection_status_idx ON task(collection, status);
+    PRAGMA optimize;
+    """),
+    (4, "Index plein texte FTS5 sur le libellé et la collection", """
+    -- Index externe : le texte reste stocké dans 'task', seul l'index inversé est conservé
+    CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5(
+        label,
+        collection,
+        content='task',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    );
+    -- Synchronisation de l'index à chaque écriture dans 'task'
+    CREATE TRIGGER IF NOT EXISTS task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts(rowid, label, collection) VALUES (new.id, new.label, new.collection);
+    END;
+    CREATE TRIGGER IF NOT EXISTS task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, label, collection) VALUES ('delete', old.id, old.label, old.collection);
+    END;
+    CREATE TRIGGER IF NOT EXISTS task_fts_update AFTER UPDATE OF label, collection ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, label, collection) VALUES ('delete', old.id, old.label, old.collection);
+        INSERT INTO task_fts(rowid, label, collection) VALUES (new.id, new.label, new.collection);
+    END;
+    -- Classement BM25 pondéré : le libellé compte dix fois plus que la collection
+    INSERT INTO task_fts(task_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)');
+    -- Indexation des tâches existantes
+    INSERT INTO task_fts(task_fts) VALUES ('rebuild');
+    """),
+    (5, "Priorité et statut stockés sous forme de codes entiers contrôlés", f"""
+    -- Nouvelle table : codes entiers ordonnés comme PRIORITY et STATUS, valeurs hors liste refusées
+    CREATE TABLE task_encoded(
+        id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+        label TEXT NOT NULL,
+        collection TEXT NOT NULL,
+        priority INTEGER NOT NULL CHECK (priority BETWEEN 0 AND {len(PRIORITY) - 1}),
+        status INTEGER NOT NULL CHECK (status BETWEEN 0 AND {len(STATUS) - 1})
+    );
+    -- Copie des tâches avec conversion des libellés en codes (les identifiants sont conservés)
+    INSERT INTO task_encoded(id, label, collection, priority, status)
+        SELECT id, label, collection, {encode_case("priority", PRIORITY)}, {encode_case("status", STATUS)} FROM task;
+    -- Conservation du compteur AUTOINCREMENT (les identifiants supprimés ne sont pas réutilisés)
+    DELETE FROM sqlite_sequence WHERE name = 'task_encoded';
+    INSERT INTO sqlite_sequence(name, seq) SELECT 'task_encoded', seq FROM sqlite_sequence WHERE name = 'task';
+    -- Remplacement de l'ancienne table (ses index et déclencheurs disparaissent avec elle)
+    DROP TABLE task;
+    ALTER TABLE task_encoded RENAME TO task;
+    -- Index secondaires, plus compacts avec des clés entières
+    CREATE INDEX task_collection_idx ON task(collection);
+    CREATE INDEX task_status_idx ON task(status, collection);
+    CREATE INDEX task_status_priority_idx ON task(status, priority, collection);
+    CREATE INDEX task_priority_idx ON task(priority, collection);
+    CREATE INDEX task_label_idx ON task(label);
+    CREATE INDEX task_collection_status_idx ON task(collection, status);
+    -- Déclencheurs de synchronisation de l'index plein texte (les identifiants n'ont pas changé)
+    CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts(rowid, label, collection) VALUES (new.id, new.label, new.collection);
+    END;
+    CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, label, collection) VALUES ('delete', old.id, old.label, old.collection);
+    END;
+    CREATE TRIGGER task_fts_update AFTER UPDATE OF label, collection ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, label, collection) VALUES ('delete', old.id, old.label, old.collection);
+        INSERT INTO task_fts(rowid, label, collection) VALUES (new.id, new.label, new.collection);
+    END;
+    PRAGMA optimize;
+    """),
+    (6, "Compteur de modifications de la table 'task' (validité du cache des lectures)", """
+    CREATE TABLE IF NOT EXISTS task_version(
+        version INTEGER NOT NULL
+    );
+    -- Valeur de départ aléatoire : une base recréée ne reprend pas les versions d'une base précédente
+    INSERT INTO task_version(version) VALUES (abs(random() % 1000000000000));
+    """),
+    (7, "Index de tri par priorité (lectures triées et file des tâches les plus urgentes)", """
+    -- Tâches d'un statut dans l'ordre (priorité, id) : lecture des k premières sans tri (read --sort priority, next)
+    CREATE INDEX IF NOT EXISTS task_status_rank_idx ON task(status, priority);
+    -- Toutes les tâches dans l'ordre (priorité, id)
+    CREATE INDEX IF NOT EXISTS task_rank_idx ON task(priority);
+    PRAGMA optimize;
+    """),
+    (8, "Journal des changements de la table 'task' (export incrémental)", """
+    -- Un changement par ligne insérée, modifiée ou supprimée ; la séquence n'est jamais réutilisée (AUTOINCREMENT)
+    CREATE TABLE IF NOT EXISTS task_change(
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        operation TEXT NOT NULL,
+        task_id INTEGER NOT NULL,
+        label TEXT,
+        collection TEXT,
+        priority INTEGER,
+        status INTEGER
+    );
+    -- Séquence de départ : l'horodatage en microsecondes, une base recréée reprend donc au-delà des séquences
+    -- déjà lues par un consommateur sur une base précédente
+    INSERT INTO sqlite_sequence(name, seq)
+        SELECT 'task_change', CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER)
+        WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'task_change');
+    -- État initial : une insertion par tâche existante, la lecture depuis le début du journal reconstruit la table
+    INSERT INTO task_change(operation, task_id, label, collection, priority, status)
+        SELECT 'insert', id, label, collection, priority, status FROM task ORDER BY id;
+    -- Déclencheurs d'alimentation du journal (une modification sans effet n'est pas enregistrée)
+    CREATE TRIGGER task_change_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_change(operation, task_id, label, collection, priority, status)
+            VALUES ('insert', new.id, new.label, new.collection, new.priority, new.status);
+    END;
+    CREATE TRIGGER task_change_update AFTER UPDATE ON task
+        WHEN old.label IS NOT new.label OR old.collection IS NOT new.collection
+          OR old.priority IS NOT new.priority OR old.status IS NOT new.status BEGIN
+        INSERT INTO task_change(operation, task_id, label, collection, priority, status)
+            VALUES ('update', new.id, new.label, new.collection, new.priority, new.status);
+    END;
+    CREATE TRIGGER task_change_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_change(operation, task_id) VALUES ('delete', old.id);
+    END;
+    """),
+    (9, "Archive des tâches achevées (date de fin, table d'archive et vue de lecture)", f"""
+    -- Date de fin (secondes Unix) des tâches terminées ou annulées, tenue à jour par déclencheurs
+    -- ('task' n'a pas de colonne de date, et ses lectures renvoient toutes ses colonnes)
+    CREATE TABLE IF NOT EXISTS task_finished(
+        task_id INTEGER PRIMARY KEY,
+        finished_at INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS task_finished_at_idx ON task_finished(finished_at);
+    -- Tâches déjà achevées : leur date de fin est inconnue, la date de la migration en tient lieu
+    INSERT OR IGNORE INTO task_finished(task_id, finished_at) SELECT id, {NOW} FROM task WHERE status IN ({FINISHED_CODES});
+    CREATE TRIGGER task_finished_insert AFTER INSERT ON task WHEN new.status IN ({FINISHED_CODES}) BEGIN
+        INSERT OR REPLACE INTO task_finished(task_id, finished_at) VALUES (new.id, {NOW});
+    END;
+    -- Une tâche rouverte perd sa date de fin ; passer de terminée à annulée la conserve
+    CREATE TRIGGER task_finished_update AFTER UPDATE OF status ON task
+        WHEN (old.status IN ({FINISHED_CODES})) IS NOT (new.status IN ({FINISHED_CODES})) BEGIN
+        DELETE FROM task_finished WHERE task_id = old.id;
+        INSERT INTO task_finished(task_id, finished_at) SELECT new.id, {NOW} WHERE new.status IN ({FINISHED_CODES});
+    END;
+    CREATE TRIGGER task_finished_delete AFTER DELETE ON task BEGIN
+        DELETE FROM task_finished WHERE task_id = old.id;
+    END;
+    -- Tâches archivées : colonnes de 'task' (identifiants conservés), date de fin et date d'archivage
+    CREATE TABLE IF NOT EXISTS task_archive(
+        id INTEGER PRIMARY KEY,
+        label TEXT NOT NULL,
+        collection TEXT NOT NULL,
+        priority INTEGER NOT NULL,
+        status INTEGER NOT NULL,
+        finished_at INTEGER NOT NULL,
+        archived_at INTEGER NOT NULL
+    );
+    -- Tris par collection et par priorité, fusionnés avec ceux de 'task' dans la vue
+    CREATE INDEX IF NOT EXISTS task_archive_collection_idx ON task_archive(collection);
+    CREATE INDEX IF NOT EXISTS task_archive_priority_idx ON task_archive(priority);
+    -- Tâches actives et archivées (read task --archived) : les critères sont appliqués à chaque table
+    CREATE VIEW IF NOT EXISTS task_all AS
+        SELECT id, label, collection, priority, status FROM task
+        UNION ALL SELECT id, label, collection, priority, status FROM task_archive;
+    -- Journal des changements : une tâche archivée quitte 'task' sans être supprimée
+    DROP TRIGGER IF EXISTS task_change_delete;
+    CREATE TRIGGER task_change_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_change(operation, task_id)
+            VALUES (CASE WHEN EXISTS (SELECT 1 FROM task_archive WHERE id = old.id) THEN 'archive' ELSE 'delete' END, old.id);
+    END;
+    """),
+    (10, "Compteur de modifications tenu par déclencheurs (toute écriture invalide le cache des lectures)", f"""
+    -- Chaque ligne insérée, modifiée ou supprimée dans 'task' ou 'task_archive' change la version des données,
+    -- quelle que soit la connexion qui écrit (application, autre processus, client sqlite3)
+    {version_triggers(["task", "task_archive"])}
+    """),
+]
+
+# Nombre de lignes incompatibles citées lorsqu'une migration est refusée
+CHECK_SAMPLE: int = 5
+
+# Contrôles préalables des migrations : version -> requête renvoyant les lignes que la migration ne peut pas convertir
+# (la migration est alors refusée avant toute modification, au lieu de réécrire ces données)
+CHECKS: Dict[int, str] = {
+    5: f"SELECT id, priority, status FROM task "
+       f"WHERE NOT {known_values('priority', PRIORITY)} OR NOT {known_values('status', STATUS)} ORDER BY id LIMIT {CHECK_SAMPLE}",
+}
+
+def check_migration(version: int, manager: Optional[ConnectionManager] = None) -> None:
+    """
+    Vérifie que les données existantes peuvent être converties par une migration.
+
+    Args:
+        version (int): La version cible de la migration.
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        None: La fonction ne retourne rien.
+
+    Raises:
+        ValueError: Si des lignes ne peuvent pas être converties (quelques-unes sont citées).
+    """
+    if version not in CHECKS:
+        return None
+    with Database(manager) as cur:
+        rows: List[Tuple] = cur.execute(CHECKS[version]).fetchall()
+    if rows:
+        sample: str = ", ".join(f"tâche {row[0]} ({', '.join(map(repr, row[1:]))})" for row in rows)
+        raise ValueError(f"migration {version} refusée, valeurs inconnues à corriger au préalable : {sample}"
+                         f"{'...' if len(rows) == CHECK_SAMPLE else ''}")
+    return None
+
+def get_schema_version(manager: Optional[ConnectionManager] = None) -> int:
+    """
+    Lit la version du schéma enregistrée dans la base de données.
+
+    Args:
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        int: La version courante du schéma (0 pour une base vierge).
+    """
+    with Database(manager) as cur:
+        return cur.execute("PRAGMA user_version").fetchone()[0]
+
+def pending_migrations(manager: Optional[ConnectionManager] = None) -> List[Migration]:
+    """
+    Liste les migrations qui restent à appliquer.
+
+    Args:
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        List[Migration]: Les migrations dont la version dépasse la version courante, dans l'ordre.
+    """
+    version: int = get_schema_version(manager)
+    return [migration for migration in MIGRATIONS if migration[0] > version]
+
+def migrate(manager: Optional[ConnectionManager] = None) -> List[Migration]:
+    """
+    Applique, dans l'ordre, toutes les migrations en attente.
+
+    Chaque migration s'exécute dans sa propre transaction avec la mise à jour de PRAGMA user_version :
+    une migration échouée est annulée entièrement et les suivantes ne sont pas tentées. Une migration dont
+    les données existantes ne peuvent pas être converties est refusée avant d'être appliquée (voir CHECKS).
+
+    Args:
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        List[Migration]: Les migrations appliquées.
+
+    Raises:
+        ValueError: Si des données existantes ne peuvent pas être converties par une migration.
+    """
+    # Liste des migrations effectivement appliquées
+    applied: List[Migration] = []
+
+    for version, description, script in pending_migrations(manager):
+        # Données incompatibles : arrêt avant la migration (les précédentes restent appliquées)
+        check_migration(version, manager)
+
+        # Script et mise à jour de la version dans une même transaction (annulée par Database en cas d'erreur)
+        start: float = perf_counter()
+        with Database(manager) as cur:
+            cur.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {version};\nCOMMIT;")
+
+        # Enregistrement de l'opération dans les logs
+        logs(f"MIGRATE {version}", duration=perf_counter() - start, table="schema")
+        applied.append((version, description, script))
+
+    # Retourne les migrations appliquées
+    return applied
+
+def reset_schema(manager: Optional[ConnectionManager] = None) -> None:
+    """
+    Supprime toutes les tables de la base de données puis reconstruit le schéma à jour.
+
+    Args:
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    with Database(manager) as cur:
+        # Liste des vues et tables créées par l'application (les tables internes de SQLite sont exclues) ;
+        # les vues puis les tables virtuelles passent en premier, ces dernières supprimant elles-mêmes leurs tables annexes
+        tables: List[Tuple[str, str]] = [(row[0], row[1]) for row in cur.execute(
+            "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%' "
+            "ORDER BY type = 'view' DESC, sql LIKE 'CREATE VIRTUAL%' DESC")]
+
+        # Suppression des vues et des tables (les index et déclencheurs associés disparaissent avec elles)
+        drops: str = "".join(f'DROP {kind.upper()} IF EXISTS "{name}";\n' for kind, name in tables)
+        cur.executescript(f"BEGIN;\n{drops}PRAGMA user_version = 0;\nCOMMIT;")
+
+    # Enregistrement de l'opération (RESET) dans les logs
+    logs("RESET", table="schema")
+
+    # Reconstruction du schéma complet
+    migrate(manager)
+
+    # Retourne explicitement None
+    return None
@@ -0,0 +1,278 @@
+import cProfile
+import re
+import sqlite3
+import sys
+import threading
+from functools import partial
+from sqlite3 import Connection
+from time import perf_counter
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from . import connection_manager, logging_manager, shard_manager
+
+
+# Nombre d'instructions de la machine virtuelle SQLite entre deux appels du gestionnaire de progression
+# (petit pour que les instructions courtes soient mesurées ; la trace SQL n'est active qu'avec --trace-sql)
+PROGRESS_STEPS: int = 10
+
+# Littéraux d'une instruction développée par SQLite (chaînes hors noms qualifiés 'main'.'table', nombres, blobs),
+# remplacés par "?" : les totaux sont regroupés par forme d'instruction, sans les valeurs des paramètres
+LITERALS: re.Pattern = re.compile(r"[xX]'[0-9a-fA-F]*'|(?<![.\w])'(?:[^']|'')*'(?!\.)|(?<![\w.])\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+
+# Définit le type de l'instruction en cours d'un thread : forme, texte développé, début, connexion, modifications au début
+Running = Tuple[str, str, float, Connection, int]
+
+
+class Profiler:
+    """Définition du profileur d'une commande : durée de chaque phase, opérations SQL et profil cProfile facultatif."""
+
+    started: float
+    phases: Dict[str, float]
+    connections: int
+    operations: List[Dict[str, Any]]
+    trace_sql: bool
+    statements: Dict[str, List[float]]
+    running: Dict[int, Running]
+    traced: List[Connection]
+    output: str
+    profile: Optional[cProfile.Profile]
+
+    def __init__(self, phases: Dict[str, float], trace_sql: bool = False, output: str = "") -> None:
+        """
+        Initialise le profileur et commence la mesure de l'exécution de la commande.
+
+        Args:
+            phases (Dict[str, float]): Les durées déjà mesurées avant la commande (import, analyse, chargement), en secondes.
+            trace_sql (bool): Capture chaque instruction SQL (set_trace_callback), sa durée, ses lignes et son coût (set_progress_handler).
+            output (str): Le fichier pstats où écrire le profil cProfile (vide pour ne pas profiler les fonctions).
+        """
+        self.started = perf_counter()
+        self.phases = dict(phases)
+        self.connections = 0
+        self.operations = []
+        self.trace_sql = trace_sql
+        self.statements = {}
+        self.running = {}
+        self.traced = []
+        self.output = output
+        self.profile = cProfile.Profile() if output else None
+
+    def start(self) -> "Profiler":
+        """
+        Installe les points d'observation (connexions, opérations journalisées) et démarre cProfile si demandé.
+
+        Les connexions déjà ouvertes (ex: dans le shell) reçoivent aussi la trace SQL.
+
+        Returns:
+            Profiler: Le profileur lui-même.
+        """
+        connection_manager.connect_hooks.append(self.on_connect)
+        logging_manager.observers.append(self.on_operation)
+        if self.trace_sql:
+            managers: List[connection_manager.ConnectionManager] = [connection_manager.get_manager()]
+            managers.extend(shard.manager for shard in shard_manager.shards)
+            for manager in managers:
+                for con in manager.connections():
+                    self.trace(con)
+        if self.profile is not None:
+            self.profile.enable()
+        return self
+
+    def stop(self) -> None:
+        """
+        Retire les points d'observation (trace SQL comprise) et arrête cProfile.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        if self.profile is not None:
+            self.profile.disable()
+        connection_manager.connect_hooks.remove(self.on_connect)
+        logging_manager.observers.remove(self.on_operation)
+
+        # Les connexions restent ouvertes (shell) : les commandes suivantes ne sont plus tracées
+        for con in self.traced:
+            try:
+                con.set_trace_callback(None)
+                con.set_progress_handler(None, 0)
+            except sqlite3.ProgrammingError:
+                # Connexion fermée entre-temps
+                pass
+        self.traced = []
+
+        # Fin des instructions encore en cours
+        for thread in list(self.running):
+            self.finish(thread)
+        return None
+
+    def trace(self, con: Connection) -> None:
+        """
+        Installe la trace SQL (instructions et étapes de la machine virtuelle) sur une connexion.
+
+        Args:
+            con (sqlite3.Connection): La connexion tracée.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        con.set_trace_callback(partial(self.on_statement, con))
+        con.set_progress_handler(self.on_progress, PROGRESS_STEPS)
+        self.traced.append(con)
+        return None
+
+    def on_connect(self, con: Connection, duration: float) -> None:
+        """
+        Comptabilise l'ouverture d'une connexion et y installe la trace SQL si elle est demandée.
+
+        Args:
+            con (sqlite3.Connection): La connexion ouverte.
+            duration (float): La durée d'ouverture et d'application du profil de PRAGMA, en secondes.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        self.connections += 1
+        self.phases["connexion"] = self.phases.get("connexion", 0.0) + duration
+        if self.trace_sql:
+            self.trace(con)
+        return None
+
+    def finish(self, thread: int, rows: Optional[int] = None) -> None:
+        """
+        Termine l'instruction en cours d'un thread : sa durée et ses lignes sont ajoutées à ses totaux.
+
+        Args:
+            thread (int): L'identifiant du thread.
+            rows (Optional[int]): Les lignes lues, d'après l'opération journalisée (les écritures sont comptées
+                                  par la connexion, modifications des déclencheurs comprises).
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        running: Optional[Running] = self.running.pop(thread, None)
+        if running is None:
+            return None
+        statement, _, started, con, changes = running
+        totals: List[float] = self.statements[statement]
+        totals[2] += perf_counter() - started
+        try:
+            changed: int = con.total_changes - changes
+        except sqlite3.ProgrammingError:
+            changed = 0
+        totals[3] += changed or rows or 0
+        return None
+
+    def on_statement(self, con: Connection, statement: str) -> None:
+        """
+        Enregistre une instruction SQL exécutée (appelée par SQLite au début de chaque instruction).
+
+        L'instruction précédente du même thread se termine à cet instant : sa durée est celle écoulée entre
+        les deux appels (lecture du curseur comprise). Les totaux sont regroupés par forme d'instruction
+        (littéraux remplacés par "?") : les valeurs des paramètres ne sont ni conservées ni affichées.
+
+        Args:
+            con (sqlite3.Connection): La connexion qui exécute l'instruction.
+            statement (str): Le texte de l'instruction, paramètres inclus.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        now: float = perf_counter()
+        thread: int = threading.get_ident()
+        # Les déclencheurs signalent de nouveau le texte de l'instruction qui les exécute : même instruction
+        running: Optional[Running] = self.running.get(thread)
+        if running is not None and running[1] == statement and running[3] is con:
+            return None
+        shape: str = " ".join(LITERALS.sub("?", statement).split())
+
+        # Instruction imbriquée (déclencheur, table virtuelle, préfixée par "--") : comptée, comprise dans la durée
+        # de l'instruction qui l'exécute
+        if running is not None and shape.startswith("--"):
+            self.statements.setdefault(shape, [0, 0, 0.0, 0])[0] += 1
+            return None
+
+        self.finish(thread)
+        self.statements.setdefault(shape, [0, 0, 0.0, 0])[0] += 1
+        self.running[thread] = (shape, statement, now, con, con.total_changes)
+        return None
+
+    def on_progress(self) -> int:
+        """
+        Attribue un lot d'instructions de la machine virtuelle à l'instruction SQL en cours du thread.
+
+        Returns:
+            int: 0 pour laisser l'instruction se poursuivre.
+        """
+        running: Optional[Running] = self.running.get(threading.get_ident())
+        if running is not None:
+            self.statements[running[0]][1] += PROGRESS_STEPS
+        return 0
+
+    def on_operation(self, fields: Dict[str, Any]) -> None:
+        """
+        Enregistre une opération journalisée par la couche de données (durée et nombre de lignes).
+
+        Une lecture est journalisée une fois son curseur épuisé : l'instruction en cours du thread se termine
+        avec le nombre de lignes lues.
+
+        Args:
+            fields (Dict[str, Any]): Les champs structurés de l'opération.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        self.operations.append(fields)
+        running: Optional[Running] = self.running.get(threading.get_ident())
+        if running is not None and running[0].upper().startswith(("SELECT", "WITH")):
+            self.finish(threading.get_ident(), fields.get("rows"))
+        return None
+
+    def report(self, stream: TextIO = sys.stderr) -> None:
+        """
+        Arrête la mesure et affiche le résumé sur la sortie d'erreur (la sortie de la commande reste inchangée).
+
+        Args:
+            stream (TextIO): Le flux du résumé.
+
+        Returns:
+            None: La fonction ne retourne rien.
+        """
+        self.stop()
+        elapsed: float = perf_counter() - self.started
+
+        # Temps passé dans SQLite, d'après les opérations chronométrées par la couche de données
+        sql: float = sum(operation.get("duration_ms", 0.0) for operation in self.operations) / 1000
+        rows: int = sum(operation.get("rows", 0) for operation in self.operations)
+
+        # Le reste de l'exécution : code Python de la commande, rendu Rich, écriture de la sortie
+        phases: Dict[str, float] = {
+            **self.phases,
+            "requêtes SQL": sql,
+            "exécution (Python, rendu)": max(0.0, elapsed - sql - self.phases.get("connexion", 0.0)),
+        }
+        total: float = sum(phases.values())
+
+        stream.write("Profil de la commande\n")
+        for name, duration in phases.items():
+            share: float = duration / total if total else 0.0
+            stream.write(f"  {name:<28} {duration * 1000:>10.2f} ms {share:>6.1%}\n")
+        stream.write(f"  {'total':<28} {total * 1000:>10.2f} ms\n")
+        stream.write(f"  {len(self.operations)} opération(s) SQL, {rows} ligne(s), {self.connections} connexion(s) ouverte(s)\n")
+
+        # Détail de chaque opération de la couche de données
+        for operation in self.operations:
+            stream.write(f"    {operation['operation']:<14} {operation.get('duration_ms', 0.0):>10.3f} ms "
+                         f"{operation.get('rows', 0):>8} ligne(s)  {' '.join(operation.get('query', '').split())[:80]}\n")
+
+        # Détail de chaque instruction SQL (--trace-sql), des plus coûteuses aux moins coûteuses
+        if self.trace_sql:
+            stream.write("Instructions SQL (exécutions, étapes de la machine virtuelle SQLite, durée, lignes)\n")
+            for statement, (executions, steps, duration, rows) in sorted(self.statements.items(), key=lambda item: -item[1][2]):
+                stream.write(f"  {executions:>6} x {steps:>10} étapes {duration * 1000:>10.3f} ms {rows:>8} ligne(s)  {statement[:100]}\n")
+
+        # Profil des fonctions Python (lisible avec pstats ou snakeviz)
+        if self.profile is not None:
+            self.profile.dump_stats(self.output)
+            stream.write(f"Profil cProfile écrit dans {self.output}\n")
+
+        return None
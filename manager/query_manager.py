@@ -0,0 +1,602 @@
+import json
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .constant_manager import OPEN_STATUS, PRIORITY, STATUS
+
+# Colonnes de la table 'task', dans l'ordre canonique utilisé pour construire les requêtes
+COLUMNS: List[str] = ["id", "label", "collection", "priority", "status"]
+
+# Position de chaque colonne dans l'ordre canonique
+POSITIONS: Dict[str, int] = {column: position for position, column in enumerate(COLUMNS)}
+
+# Opérations prises en charge par le constructeur de requêtes
+OPERATIONS: List[str] = ["SELECT", "SEARCH", "UPDATE", "DELETE"]
+
+# Colonnes de tri des lectures, chacune servie par un index (l'identifiant départage les égalités)
+SORTS: List[str] = ["collection", "priority", "id"]
+
+# Colonnes stockées sous forme d'entiers : le code d'une valeur est sa position dans la liste des constantes
+CODES: Dict[str, Dict[str, int]] = {
+    "priority": {value: code for code, value in enumerate(PRIORITY)},
+    "status": {value: code for code, value in enumerate(STATUS)},
+}
+
+# Définit un nœud de l'arbre d'une expression de filtre : l'opération, puis la colonne ou les sous-nœuds
+# (ex: ("and", ("cmp", "priority", ">="), ("not", ("cmp", "status", "="))))
+Node = Tuple[Any, ...]
+
+# Définit la forme d'un critère : le nom de la colonne (égalité), le triplet (colonne, présence d'une liste
+# de valeurs, nombre d'intervalles) pour un critère à plusieurs cibles, ou ("where", nœud) pour une expression
+Filter = Union[str, Tuple[str, bool, int], Tuple[str, Node]]
+
+# Clé des options de filtrage portant une expression de filtre (ex: {"where": "priority >= haute"})
+EXPRESSION: str = "where"
+
+# Opérateurs de comparaison des expressions de filtre
+COMPARISONS: List[str] = ["=", "!=", "<", "<=", ">", ">="]
+
+# Colonnes texte, seules acceptées par le préfixe (^=) et le motif LIKE
+TEXT_COLUMNS: List[str] = ["label", "collection"]
+
+# Mots-clés des expressions de filtre (insensibles à la casse)
+KEYWORDS: List[str] = ["and", "or", "not", "in", "between", "like"]
+
+# Jetons des expressions : chaîne entre guillemets, symbole, ou mot (colonne, mot-clé, valeur sans espace)
+TOKEN: re.Pattern = re.compile(
+    r"""\s*(?:(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|(?P<symbol>!=|<=|>=|\^=|=|<|>|\(|\)|,)|(?P<word>[^\s"'()=!<>,^]+))""")
+
+# Nombre maximal de formes de requêtes conservées en cache
+CACHE_SIZE: int = 256
+
+def encode(column: str, value: Any) -> Any:
+    """
+    Convertit une valeur de priorité ou de statut en son code entier stocké dans la table.
+
+    Les autres colonnes, ainsi que les codes déjà entiers, sont retournés tels quels.
+
+    Args:
+        column (str): Le nom de la colonne.
+        value (Any): La valeur (libellé de la constante ou code entier).
+
+    Returns:
+        Any: La valeur à transmettre à SQLite.
+
+    Raises:
+        ValueError: Si la valeur ne fait pas partie des constantes de la colonne.
+    """
+    codes: Optional[Dict[str, int]] = CODES.get(column)
+    if codes is None or (isinstance(value, int) and 0 <= value < len(codes)):
+        return value
+    if value not in codes:
+        raise ValueError(f"Valeur inconnue pour la colonne {column} : {value} (valeurs possibles : {', '.join(codes)})")
+    return codes[value]
+
+def encode_row(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """
+    Encode la priorité et le statut d'une ligne à insérer (label, collection, priority, status).
+
+    Args:
+        row (Tuple[Any, ...]): La ligne à insérer.
+
+    Returns:
+        Tuple[Any, ...]: La ligne avec la priorité et le statut sous forme de codes entiers.
+    """
+    label, collection, priority, status = row
+    return (label, collection, encode("priority", priority), encode("status", status))
+
+def parse_ids(spec: str) -> List[Any]:
+    """
+    Analyse une liste d'identifiants et d'intervalles (ex: "3,8,100-2000").
+
+    Args:
+        spec (str): Les identifiants et intervalles "début-fin", séparés par des virgules.
+
+    Returns:
+        List[Any]: Les identifiants (int) et les intervalles ({"from": début, "to": fin}).
+
+    Raises:
+        ValueError: Si un élément n'est ni un entier ni un intervalle croissant d'entiers.
+    """
+    targets: List[Any] = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        start, _, end = item.partition("-")
+        if not start.isdigit() or (end and not end.isdigit()):
+            raise ValueError(f"Identifiant ou intervalle invalide : {item}")
+        if not end:
+            targets.append(int(start))
+        elif int(start) > int(end):
+            raise ValueError(f"Intervalle décroissant : {item}")
+        else:
+            targets.append({"from": int(start), "to": int(end)})
+    return targets
+
+def criterion(column: str, value: Any) -> Tuple[Filter, Tuple[Any, ...]]:
+    """
+    Détermine la forme d'un critère et ses paramètres.
+
+    Une valeur simple donne une égalité. Une liste donne un critère à plusieurs cibles : ses valeurs
+    simples sont transmises en un seul paramètre JSON (IN sur json_each, la requête ne dépend donc pas
+    de leur nombre) et chaque intervalle {"from", "to"} devient un BETWEEN.
+
+    Args:
+        column (str): Le nom de la colonne.
+        value (Any): La valeur simple, ou la liste de valeurs et d'intervalles.
+
+    Returns:
+        Tuple[Filter, Tuple[Any, ...]]: La forme du critère et ses paramètres, dans l'ordre de la requête.
+    """
+    # Valeur simple, ou liste réduite à une seule valeur : égalité
+    if not isinstance(value, (list, tuple)):
+        return column, (encode(column, value),)
+    if len(value) == 1 and not isinstance(value[0], dict):
+        return column, (encode(column, value[0]),)
+
+    # Liste : valeurs simples regroupées, intervalles séparés
+    members: List[Any] = [encode(column, item) for item in value if not isinstance(item, dict)]
+    ranges: List[Any] = [bound for item in value if isinstance(item, dict)
+                         for bound in (encode(column, item["from"]), encode(column, item["to"]))]
+
+    return (column, bool(members), len(ranges) // 2), (*((json.dumps(members),) if members else ()), *ranges)
+
+def canonicalize(values: Dict[str, Any]) -> Tuple[Tuple[Filter, ...], Tuple[Any, ...]]:
+    """
+    Ne conserve que les valeurs renseignées et les ordonne selon l'ordre canonique des colonnes.
+
+    Deux dictionnaires portant sur les mêmes colonnes produisent ainsi la même forme, quel que soit leur ordre.
+    La priorité et le statut sont convertis en codes entiers.
+
+    Args:
+        values (Dict[str, Any]): Les valeurs indexées par nom de colonne (valeur simple, ou liste de valeurs et d'intervalles),
+                                 et l'expression de filtre éventuelle sous la clé "where".
+
+    Returns:
+        Tuple[Tuple[Filter, ...], Tuple[Any, ...]]: Les formes des critères retenus et leurs paramètres, dans le même ordre.
+
+    Raises:
+        ValueError: Si une colonne ne fait pas partie de la table 'task' ou si une valeur est inconnue.
+    """
+    # Liste blanche des noms de colonnes (ils sont insérés tels quels dans le SQL)
+    unknown: List[str] = [column for column in values if column not in POSITIONS and column != EXPRESSION]
+    if unknown:
+        raise ValueError(f"Colonne(s) inconnue(s) : {', '.join(unknown)}")
+
+    # Colonnes renseignées, triées selon l'ordre canonique
+    columns: List[str] = sorted((k for k, v in values.items() if v and k != EXPRESSION), key=POSITIONS.__getitem__)
+
+    # Forme et paramètres de chaque critère
+    shapes: List[Filter] = []
+    data: List[Any] = []
+    for column in columns:
+        shape, parameters = criterion(column, values[column])
+        shapes.append(shape)
+        data.extend(parameters)
+
+    # Expression de filtre éventuelle, combinée par AND aux autres critères
+    if values.get(EXPRESSION):
+        node, parameters = parse_expression(values[EXPRESSION])
+        shapes.append((EXPRESSION, node))
+        data.extend(parameters)
+
+    return tuple(shapes), tuple(data)
+
+def tokenize(text: str) -> List[Tuple[str, str, int]]:
+    """
+    Découpe une expression de filtre en jetons.
+
+    Args:
+        text (str): L'expression (ex: 'priority >= haute and status != "à faire"').
+
+    Returns:
+        List[Tuple[str, str, int]]: Les jetons (nature, texte, position) ; les chaînes sont retournées sans guillemets.
+
+    Raises:
+        ValueError: Si un caractère ne peut commencer aucun jeton (ex: guillemet non refermé).
+    """
+    tokens: List[Tuple[str, str, int]] = []
+    position: int = 0
+    while text[position:].strip():
+        match: Optional[re.Match] = TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"Expression invalide à la position {position + 1} : {text[position:].strip()[:20]}")
+        kind: str = match.lastgroup
+        value: str = match.group(kind)
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        tokens.append((kind, value, match.start(kind)))
+        position = match.end()
+    return tokens
+
+
+class ExpressionParser:
+    """Définition de l'analyseur (descente récursive) des expressions de filtre.
+
+    Grammaire, des opérateurs les moins prioritaires aux plus prioritaires :
+
+        expression := terme ("or" terme)*
+        terme      := facteur ("and" facteur)*
+        facteur    := "not" facteur | "(" expression ")" | critère
+        critère    := colonne ["not"] ( ("=" | "!=" | "<" | "<=" | ">" | ">=" | "^=" | "like") valeur
+                                      | "in" "(" valeur ("," valeur)* ")"
+                                      | "between" valeur "and" valeur )
+    """
+
+    text: str
+    tokens: List[Tuple[str, str, int]]
+    index: int
+    data: List[Any]
+
+    def __init__(self, text: str) -> None:
+        """
+        Initialise l'analyseur.
+
+        Args:
+            text (str): L'expression à analyser.
+        """
+        self.text = text
+        self.tokens = tokenize(text)
+        self.index = 0
+        self.data = []
+
+    def parse(self) -> Tuple[Node, Tuple[Any, ...]]:
+        """
+        Analyse l'expression complète.
+
+        Returns:
+            Tuple[Node, Tuple[Any, ...]]: L'arbre de l'expression et ses paramètres, dans l'ordre de la condition SQL.
+
+        Raises:
+            ValueError: Si l'expression est vide, mal formée, ou porte sur une colonne ou une valeur inconnue.
+        """
+        if not self.tokens:
+            raise ValueError("Expression de filtre vide")
+        node: Node = self.expression()
+        if self.index < len(self.tokens):
+            self.fail("fin de l'expression attendue")
+        return node, tuple(self.data)
+
+    def fail(self, expected: str) -> None:
+        """
+        Lève l'erreur de syntaxe correspondant au jeton courant.
+
+        Args:
+            expected (str): Ce qui était attendu à cette position.
+
+        Raises:
+            ValueError: Toujours.
+        """
+        if self.index < len(self.tokens):
+            _, value, position = self.tokens[self.index]
+            raise ValueError(f"Expression invalide à la position {position + 1} ('{value}') : {expected}")
+        raise ValueError(f"Expression incomplète : {expected}")
+
+    def keyword(self, *words: str) -> Optional[str]:
+        """
+        Consomme le jeton courant s'il s'agit de l'un des mots-clés (ou symboles) donnés.
+
+        Args:
+            *words (str): Les mots-clés (en minuscules) ou symboles acceptés.
+
+        Returns:
+            Optional[str]: Le mot-clé consommé, ou None.
+        """
+        if self.index < len(self.tokens):
+            kind, value, _ = self.tokens[self.index]
+            if kind != "string" and value.lower() in words:
+                self.index += 1
+                return value.lower()
+        return None
+
+    def expect(self, *words: str) -> str:
+        """
+        Consomme un mot-clé ou symbole obligatoire.
+
+        Args:
+            *words (str): Les mots-clés ou symboles acceptés.
+
+        Returns:
+            str: Le mot-clé consommé.
+
+        Raises:
+            ValueError: Si le jeton courant n'en fait pas partie.
+        """
+        word: Optional[str] = self.keyword(*words)
+        if word is None:
+            self.fail(f"'{' ou '.join(words)}' attendu")
+        return word
+
+    def expression(self) -> Node:
+        """Analyse une disjonction (OR) de termes."""
+        nodes: List[Node] = [self.term()]
+        while self.keyword("or"):
+            nodes.append(self.term())
+        return nodes[0] if len(nodes) == 1 else ("or", *nodes)
+
+    def term(self) -> Node:
+        """Analyse une conjonction (AND) de facteurs."""
+        nodes: List[Node] = [self.factor()]
+        while self.keyword("and"):
+            nodes.append(self.factor())
+        return nodes[0] if len(nodes) == 1 else ("and", *nodes)
+
+    def factor(self) -> Node:
+        """Analyse une négation, un groupe entre parenthèses ou un critère."""
+        if self.keyword("not"):
+            return ("not", self.factor())
+        if self.keyword("("):
+            node: Node = self.expression()
+            self.expect(")")
+            return node
+        return self.criterion()
+
+    def value(self, column: str) -> Any:
+        """
+        Consomme une valeur et la convertit pour la colonne (identifiant entier, code de priorité ou de statut).
+
+        Args:
+            column (str): La colonne comparée.
+
+        Returns:
+            Any: La valeur à transmettre à SQLite.
+        """
+        if self.index >= len(self.tokens) or self.tokens[self.index][0] == "symbol":
+            self.fail("valeur attendue")
+        kind, value, _ = self.tokens[self.index]
+        self.index += 1
+        if column == "id":
+            if not value.isdigit():
+                raise ValueError(f"Identifiant invalide : {value}")
+            return int(value)
+        return encode(column, value)
+
+    def criterion(self) -> Node:
+        """Analyse un critère portant sur une colonne."""
+        if self.index >= len(self.tokens) or self.tokens[self.index][0] != "word" or self.tokens[self.index][1] not in POSITIONS:
+            self.fail(f"colonne attendue ({', '.join(COLUMNS)})")
+        column: str = self.tokens[self.index][1]
+        self.index += 1
+
+        # Négation placée après la colonne (ex: status not in (...))
+        negated: bool = self.keyword("not") is not None
+        node: Node
+
+        # Liste de valeurs : un seul paramètre JSON, quel que soit leur nombre
+        if self.keyword("in"):
+            self.expect("(")
+            members: List[Any] = [self.value(column)]
+            while self.keyword(","):
+                members.append(self.value(column))
+            self.expect(")")
+            self.data.append(json.dumps(members))
+            node = ("in", column)
+
+        # Intervalle (bornes incluses)
+        elif self.keyword("between"):
+            self.data.append(self.value(column))
+            self.expect("and")
+            self.data.append(self.value(column))
+            node = ("between", column)
+
+        # Préfixe et motif LIKE, réservés aux colonnes texte
+        elif (operator := self.keyword("^=", "like")) is not None:
+            if column not in TEXT_COLUMNS:
+                raise ValueError(f"L'opérateur {operator} ne s'applique qu'aux colonnes {', '.join(TEXT_COLUMNS)}")
+            text: str = self.value(column)
+            if operator == "^=":
+                # Préfixe : intervalle [préfixe, préfixe + U+10FFFF[, parcouru dans l'index de la colonne
+                self.data.extend((text, text + "\U0010ffff"))
+                node = ("prefix", column)
+            else:
+                self.data.append(text)
+                node = ("like", column)
+
+        # Comparaison (sur le rang pour la priorité et le statut)
+        else:
+            operator = self.keyword(*COMPARISONS)
+            if operator is None:
+                self.fail("opérateur attendu (=, !=, <, <=, >, >=, ^=, like, in, between)")
+            self.data.append(self.value(column))
+            node = ("cmp", column, operator)
+
+        return ("not", node) if negated else node
+
+def parse_expression(text: str) -> Tuple[Node, Tuple[Any, ...]]:
+    """
+    Analyse une expression de filtre (ex: 'priority >= haute and status != terminée').
+
+    Args:
+        text (str): L'expression.
+
+    Returns:
+        Tuple[Node, Tuple[Any, ...]]: L'arbre de l'expression et ses paramètres.
+
+    Raises:
+        ValueError: Si l'expression est mal formée ou porte sur une colonne ou une valeur inconnue.
+    """
+    return ExpressionParser(text).parse()
+
+def expression_columns(node: Node) -> List[str]:
+    """
+    Liste les colonnes référencées par une expression de filtre.
+
+    Args:
+        node (Node): L'arbre de l'expression.
+
+    Returns:
+        List[str]: Les colonnes, dans l'ordre de l'expression.
+    """
+    if node[0] in ("and", "or", "not"):
+        return [column for child in node[1:] for column in expression_columns(child)]
+    return [node[1]]
+
+def grouped(rendered: str) -> str:
+    """
+    Place une condition entre parenthèses, sauf si elle forme déjà un groupe (AND, OR ou préfixe).
+
+    Args:
+        rendered (str): La condition construite par render_expression().
+
+    Returns:
+        str: La condition, utilisable comme opérande de NOT ou de AND.
+    """
+    return rendered if rendered.startswith("(") and rendered.endswith(")") else f"({rendered})"
+
+def render_expression(node: Node, prefix: str = "") -> str:
+    """
+    Construit la condition SQL d'une expression de filtre.
+
+    Args:
+        node (Node): L'arbre de l'expression.
+        prefix (str): Le préfixe de table des colonnes (ex: "task.").
+
+    Returns:
+        str: La condition, avec ses paramètres '?' dans l'ordre de l'analyse.
+    """
+    operation: str = node[0]
+    if operation in ("and", "or"):
+        return f"({f' {operation.upper()} '.join(render_expression(child, prefix) for child in node[1:])})"
+    if operation == "not":
+        return f"NOT {grouped(render_expression(node[1], prefix))}"
+    column: str = f"{prefix}{node[1]}"
+    if operation == "in":
+        return f"{column} IN (SELECT value FROM json_each(?))"
+    if operation == "between":
+        return f"{column} BETWEEN ? AND ?"
+    if operation == "prefix":
+        return f"({column} >= ? AND {column} < ?)"
+    if operation == "like":
+        return f"{column} LIKE ?"
+    return f"{column} {node[2]} ?"
+
+def condition(shape: Filter, prefix: str = "") -> str:
+    """
+    Construit la condition SQL d'un critère.
+
+    Args:
+        shape (Filter): La forme du critère.
+        prefix (str): Le préfixe de table des colonnes (ex: "task.").
+
+    Returns:
+        str: La condition, avec ses paramètres '?' dans l'ordre de criterion().
+    """
+    # Égalité
+    if isinstance(shape, str):
+        return f"{prefix}{shape} = ?"
+
+    # Expression de filtre, placée entre parenthèses pour être combinée par AND
+    if shape[0] == EXPRESSION:
+        return grouped(render_expression(shape[1], prefix))
+
+    # Plusieurs cibles : liste de valeurs et/ou intervalles, réunis par OR
+    column, members, ranges = shape
+    alternatives: List[str] = [
+        *([f"{prefix}{column} IN (SELECT value FROM json_each(?))"] if members else []),
+        *[f"{prefix}{column} BETWEEN ? AND ?"] * ranges,
+    ]
+    return alternatives[0] if len(alternatives) == 1 else f"({' OR '.join(alternatives)})"
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_query(
+        operation: str,
+        filters: Tuple[Filter, ...],
+        columns: Tuple[Filter, ...] = (),
+        keyset: bool = False,
+        limited: bool = False,
+        sort: str = "collection",
+        descending: bool = False,
+        anchored: bool = False,
+        ranked: bool = False,
+        archived: bool = False
+        ) -> str:
+    """
+    Construit la requête paramétrée correspondant à une forme d'opération (mise en cache LRU).
+
+    Pour une même forme, la chaîne retournée est identique à chaque appel, ce qui permet aussi
+    au cache de requêtes préparées de sqlite3 de réutiliser la requête compilée.
+
+    Args:
+        operation (str): L'opération ("SELECT", "SEARCH", "UPDATE" ou "DELETE").
+        filters (Tuple[Filter, ...]): Les formes des critères de la clause WHERE, dans l'ordre canonique.
+        columns (Tuple[Filter, ...]): Les colonnes de la clause SET (UPDATE uniquement, valeurs simples).
+        keyset (bool): Ajoute la reprise après une tâche (colonne de tri, id) (SELECT uniquement).
+        limited (bool): Ajoute une clause LIMIT (SELECT et SEARCH uniquement).
+        sort (str): La colonne de tri, départagée par l'identifiant (SELECT uniquement).
+        descending (bool): Trie par ordre décroissant (colonne de tri et identifiant) (SELECT uniquement).
+        anchored (bool): La valeur de tri de la reprise est un paramètre, et non lue dans la table : la tâche
+                         de reprise peut se trouver dans un autre fragment (SELECT avec reprise uniquement).
+        ranked (bool): Ajoute le rang BM25 en dernière colonne, pour fusionner plusieurs résultats (SEARCH uniquement).
+        archived (bool): Lit aussi les tâches archivées, par la vue 'task_all' (SELECT uniquement).
+
+    Returns:
+        str: La requête SQL avec ses paramètres '?' dans l'ordre : SET, MATCH, WHERE, reprise, LIMIT.
+
+    Raises:
+        ValueError: Si l'opération, une colonne ou la colonne de tri est inconnue, ou si la forme est incomplète.
+    """
+    # Vérification de l'opération et des colonnes (la clé de cache ne contient que des formes valides)
+    if operation not in OPERATIONS:
+        raise ValueError(f"Opération inconnue : {operation}")
+    if sort not in SORTS:
+        raise ValueError(f"Tri inconnu : {sort} (tris possibles : {', '.join(SORTS)})")
+    names: List[str] = [name for shape in (*filters, *columns) for name in (
+        [shape] if isinstance(shape, str) else expression_columns(shape[1]) if shape[0] == EXPRESSION else [shape[0]])]
+    unknown: List[str] = [column for column in names if column not in POSITIONS]
+    if unknown:
+        raise ValueError(f"Colonne(s) inconnue(s) : {', '.join(unknown)}")
+    if not all(isinstance(column, str) for column in columns):
+        raise ValueError("Une seule valeur par colonne à modifier")
+
+    # Conditions de la clause WHERE (égalités, listes et intervalles)
+    conditions: List[str] = [condition(shape) for shape in filters]
+
+    # Lecture : filtres, reprise éventuelle, tri (colonne, id) dans un même sens et limite éventuelle
+    if operation == "SELECT":
+        table: str = "task_all" if archived else "task"
+        direction, after = ("DESC", "<") if descending else ("ASC", ">")
+        if keyset and sort == "id":
+            conditions.append(f"id {after} ?")
+        elif keyset and anchored:
+            conditions.append(f"({sort}, id) {after} (?, ?)")
+        elif keyset:
+            conditions.append(f"({sort}, id) {after} ((SELECT {sort} FROM {table} WHERE id = ?), ?)")
+        where: str = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        order: str = f"id {direction}" if sort == "id" else f"{sort} {direction}, id {direction}"
+        return f"SELECT * FROM {table}{where} ORDER BY {order}{' LIMIT ?' if limited else ''}"
+
+    # Recherche plein texte : correspondance FTS5, filtres sur la table, tri par pertinence (rang BM25 de l'index)
+    if operation == "SEARCH":
+        conditions = ["task_fts MATCH ?", *(condition(shape, "task.") for shape in filters)]
+        return (f"SELECT task.*{', task_fts.rank' if ranked else ''} FROM task_fts JOIN task ON task.id = task_fts.rowid WHERE {' AND '.join(conditions)} "
+                f"ORDER BY task_fts.rank{' LIMIT ?' if limited else ''}")
+
+    # Une modification ou une suppression sans critère toucherait toute la table
+    if not filters:
+        raise ValueError(f"Aucun critère pour l'opération {operation}")
+
+    # Suppression
+    if operation == "DELETE":
+        return f"DELETE FROM task WHERE {' AND '.join(conditions)}"
+
+    # Mise à jour : au moins une colonne à modifier
+    if not columns:
+        raise ValueError("Aucune colonne à modifier pour l'opération UPDATE")
+    assignments: str = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE task SET {assignments} WHERE {' AND '.join(conditions)}"
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_next_query(statuses: int = len(OPEN_STATUS)) -> str:
+    """
+    Construit la requête des tâches ouvertes les plus urgentes (priorité décroissante, puis identifiant décroissant).
+
+    Chaque statut est lu dans l'ordre de l'index (status, priority) et les lectures sont fusionnées (MERGE) :
+    la lecture s'arrête après `limit` tâches, sans trier la table.
+
+    Args:
+        statuses (int): Le nombre de statuts ouverts.
+
+    Returns:
+        str: La requête SQL avec ses paramètres '?' dans l'ordre : un statut par branche, puis la limite.
+    """
+    branches: str = " UNION ALL ".join(["SELECT * FROM task WHERE status = ?"] * statuses)
+    return f"{branches} ORDER BY priority DESC, id DESC LIMIT ?"
@@ -0,0 +1,268 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from sqlite3 import Cursor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .database_manager import (
+    delete_from_database,
+    insert_into_database,
+    insert_many_into_database,
+    iter_select_from_database,
+    next_from_database,
+    run_write,
+    search_database,
+    update_from_database,
+)
+from .logging_manager import logs
+
+
+# Socket Unix par défaut du serveur (surchargeable via la variable d'environnement TASK_MANAGER_SERVER)
+DEFAULT_SOCKET: str = os.environ.get("TASK_MANAGER_SERVER", "task_manager.sock")
+
+# Taille maximale d'une ligne de requête JSON, en octets
+MAX_REQUEST_SIZE: int = 64 * 1024 * 1024
+
+# Définit le type d'une opération : fonction recevant les arguments JSON de la requête
+Handler = Callable[[Dict[str, Any]], Any]
+
+def read_rows(args: Dict[str, Any]) -> List[List[Any]]:
+    """
+    Exécute une lecture paginée et retourne toutes les lignes de la page demandée.
+
+    Args:
+        args (Dict[str, Any]): Les arguments "options", "after_id", "limit", "sort", "descending" et "archived" de la requête.
+
+    Returns:
+        List[List[Any]]: Les lignes lues.
+    """
+    return [list(row) for page in iter_select_from_database(
+        args.get("options", {}), after_id=args.get("after_id", 0), limit=args.get("limit", 0),
+        sort=args.get("sort", "collection"), descending=args.get("descending", False),
+        archived=args.get("archived", False)) for row in page]
+
+def search_rows(args: Dict[str, Any]) -> List[List[Any]]:
+    """
+    Exécute une recherche plein texte et retourne les lignes trouvées.
+
+    Args:
+        args (Dict[str, Any]): Les arguments "text", "options" et "limit" de la requête.
+
+    Returns:
+        List[List[Any]]: Les lignes trouvées, par pertinence décroissante.
+    """
+    return [list(row) for page in search_database(
+        args["text"], args.get("options", {}), limit=args.get("limit", 0)) for row in page]
+
+# Opérations de lecture, servies en parallèle par le pool de lecteurs
+READ_OPERATIONS: Dict[str, Handler] = {
+    "select": read_rows,
+    "search": search_rows,
+    "next": lambda args: [list(row) for row in next_from_database(args.get("limit", 20))],
+}
+
+# Opérations d'écriture, sérialisées par la tâche d'écriture unique
+WRITE_OPERATIONS: Dict[str, Handler] = {
+    "insert": lambda args: insert_into_database(tuple(args["values"])),
+    "insert_many": lambda args: insert_many_into_database(map(tuple, args["rows"])),
+    "update": lambda args: update_from_database(args["columns"], args["options"]),
+    "delete": lambda args: delete_from_database(args["options"]),
+}
+
+
+class TaskServer:
+    """Définition du serveur asyncio exposant les opérations de la base de données en JSON sur un socket Unix."""
+
+    path: str
+    readers: ThreadPoolExecutor
+    writer: ThreadPoolExecutor
+    batch_size: int
+    queue: "Optional[asyncio.Queue[Tuple[str, Dict[str, Any], asyncio.Future]]]"
+
+    def __init__(self, path: str = DEFAULT_SOCKET, readers: int = 4, batch_size: int = 256) -> None:
+        """
+        Initialise le serveur.
+
+        Args:
+            path (str): Le chemin du socket Unix.
+            readers (int): Le nombre de threads de lecture (une connexion SQLite chacun).
+            batch_size (int): Le nombre maximal d'écritures validées par un même commit.
+        """
+        self.path = path
+        self.batch_size = batch_size
+
+        # Pool de lecteurs et thread d'écriture unique (chaque thread garde sa propre connexion)
+        self.readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="reader")
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer")
+
+        # File des écritures en attente (créée dans la boucle d'événements)
+        self.queue = None
+
+    def apply_batch(self, batch: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[bool, Any]]:
+        """
+        Applique un lot d'écritures dans une seule transaction (exécuté dans le thread d'écriture).
+
+        Chaque écriture est isolée par un point de sauvegarde : une écriture en erreur est annulée
+        sans empêcher la validation des autres.
+
+        Args:
+            batch (List[Tuple[str, Dict[str, Any]]]): Les opérations et leurs arguments.
+
+        Returns:
+            List[Tuple[bool, Any]]: Pour chaque écriture, son succès et son résultat (ou le message d'erreur).
+        """
+        def apply(cur: Cursor) -> List[Tuple[bool, Any]]:
+            # Résultats recalculés à chaque tentative (le lot entier est rejoué si la base est verrouillée)
+            results: List[Tuple[bool, Any]] = []
+            for operation, args in batch:
+                try:
+                    results.append((True, WRITE_OPERATIONS[operation](args)))
+                except Exception as error:
+                    results.append((False, str(error)))
+            return results
+
+        # Un seul commit (et un seul fsync) pour tout le lot, dans une transaction d'écriture BEGIN IMMEDIATE
+        results: List[Tuple[bool, Any]] = run_write(apply)
+
+        # Enregistrement du lot dans les logs
+        logs("GROUP COMMIT", rows=len(batch), table="server")
+
+        return results
+
+    async def write_loop(self) -> None:
+        """
+        Consomme la file des écritures : regroupe les écritures en attente et les valide ensemble.
+
+        Returns:
+            None: La boucle ne se termine qu'à l'arrêt du serveur.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            # Attente de la première écriture, puis récupération de celles déjà en file
+            pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = [await self.queue.get()]
+            while len(pending) < self.batch_size and not self.queue.empty():
+                pending.append(self.queue.get_nowait())
+
+            # Validation groupée dans le thread d'écriture
+            try:
+                results: List[Tuple[bool, Any]] = await loop.run_in_executor(
+                    self.writer, self.apply_batch, [(operation, args) for operation, args, _ in pending])
+            except Exception as error:
+                results = [(False, str(error))] * len(pending)
+
+            # Réponse à chaque requête du lot
+            for (_, _, future), result in zip(pending, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Exécute une requête : lecture dans le pool de lecteurs, écriture via la file d'écriture.
+
+        Args:
+            request (Dict[str, Any]): La requête ({"id", "op", "args"}).
+
+        Returns:
+            Dict[str, Any]: La réponse ({"id", "ok", "result"} ou {"id", "ok", "error"}).
+        """
+        operation: str = request.get("op", "")
+        args: Dict[str, Any] = request.get("args", {})
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # Les arguments sont transmis tels quels aux opérations : seul un objet JSON est accepté
+        if not isinstance(args, dict):
+            return {"id": request.get("id"), "ok": False, "error": "Arguments invalides : objet JSON attendu"}
+
+        try:
+            # Lecture : exécutée en parallèle des autres lectures et des écritures
+            if operation in READ_OPERATIONS:
+                result: Any = await loop.run_in_executor(self.readers, READ_OPERATIONS[operation], args)
+                return {"id": request.get("id"), "ok": True, "result": result}
+
+            # Écriture : mise en file pour la prochaine validation groupée
+            if operation in WRITE_OPERATIONS:
+                future: asyncio.Future = loop.create_future()
+                await self.queue.put((operation, args, future))
+                ok, result = await future
+                return {"id": request.get("id"), "ok": ok, ("result" if ok else "error"): result}
+
+            return {"id": request.get("id"), "ok": False, "error": f"Opération inconnue : {operation}"}
+        except Exception as error:
+            return {"id": request.get("id"), "ok": False, "error": str(error)}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Sert une connexion cliente : une requête JSON par ligne, une réponse JSON par ligne.
+
+        Les requêtes d'un même client sont traitées en parallèle ; le champ "id" relie chaque réponse à sa requête.
+
+        Args:
+            reader (asyncio.StreamReader): Le flux de lecture du client.
+            writer (asyncio.StreamWriter): Le flux d'écriture vers le client.
+
+        Returns:
+            None: La fonction se termine à la déconnexion du client.
+        """
+        lock: asyncio.Lock = asyncio.Lock()
+        tasks: List[asyncio.Task] = []
+
+        async def send(response: Dict[str, Any]) -> None:
+            # Les écritures sur le flux sont sérialisées
+            async with lock:
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+
+        async def respond(line: bytes) -> None:
+            # Décodage, exécution et envoi de la réponse (les écritures sur le flux sont sérialisées) ;
+            # une requête invalide reçoit toujours une réponse d'erreur, sans interrompre la connexion
+            try:
+                request: Any = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("objet JSON attendu")
+                response: Dict[str, Any] = await self.dispatch(request)
+            except json.JSONDecodeError as error:
+                response = {"id": None, "ok": False, "error": f"JSON invalide : {error}"}
+            except Exception as error:
+                response = {"id": None, "ok": False, "error": f"Requête invalide : {error}"}
+            await send(response)
+
+        try:
+            try:
+                while line := await reader.readline():
+                    tasks = [task for task in tasks if not task.done()]
+                    tasks.append(asyncio.create_task(respond(line)))
+            except ValueError:
+                # Ligne plus longue que MAX_REQUEST_SIZE (LimitOverrunError) : la suite du flux ne peut plus être
+                # découpée en requêtes, la connexion est fermée après une réponse d'erreur
+                await asyncio.gather(*tasks)
+                await send({"id": None, "ok": False, "error": f"Requête trop longue (plus de {MAX_REQUEST_SIZE} octets)"})
+            await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self) -> None:
+        """
+        Démarre le serveur et la tâche d'écriture, puis sert les clients jusqu'à l'arrêt.
+
+        Returns:
+            None: La fonction ne retourne qu'à l'arrêt du serveur.
+        """
+        # Suppression d'un socket laissé par une exécution précédente
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        self.queue = asyncio.Queue()
+        write_task: asyncio.Task = asyncio.create_task(self.write_loop())
+        server: asyncio.AbstractServer = await asyncio.start_unix_server(self.handle, path=self.path, limit=MAX_REQUEST_SIZE)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            write_task.cancel()
+            self.readers.shutdown(wait=False)
+            self.writer.shutdown(wait=True)
+            if os.path.exists(self.path):
+                os.unlink(self.path)
@@ -0,0 +1,567 @@
+import atexit
+import heapq
+import os
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, groupby, islice
+from queue import Full, Queue
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from . import database_manager, migration_manager, stats_manager
+from .config_manager import get_setting, load_settings
+from .connection_manager import ConnectionManager, get_manager
+from .database_manager import FilterOptions, Result, Row, run_write
+from .migration_manager import Migration
+from .query_manager import POSITIONS
+
+
+# Nombre de fragments (fichiers SQLite) entre lesquels les tâches sont réparties (0 = base unique)
+SHARDS: int = int(get_setting("database", "shards", 0))
+
+# Répartition explicite : collection -> numéro de fragment (section [shards] du fichier de configuration) ;
+# les autres collections sont réparties par hachage de leur nom
+SHARD_MAP: Dict[str, int] = {str(collection): int(index) for collection, index in load_settings().get("shards", {}).items()}
+
+# Nombre de bits de l'identifiant attribués au sein d'un fragment : le fragment k numérote ses tâches
+# à partir de k << ID_BITS, ce qui garde les identifiants uniques sur l'ensemble des fragments
+ID_BITS: int = 40
+
+# Nombre de connexions de chaque fragment (lectures simultanées), si TASK_MANAGER_POOL_SIZE n'est pas défini
+SHARD_POOL_SIZE: int = 4
+
+# Nombre de pages lues d'avance par chaque fragment lors d'une lecture fusionnée (mémoire bornée)
+PREFETCH: int = 2
+
+# Marque la fin des pages d'un fragment dans sa file
+DONE: object = object()
+
+# Type du résultat d'une opération exécutée sur un fragment
+T = TypeVar("T")
+
+
+class Shard:
+    """Définition d'un fragment : un fichier SQLite et le gestionnaire de ses connexions."""
+
+    index: int
+    manager: ConnectionManager
+
+    def __init__(self, index: int, manager: ConnectionManager) -> None:
+        """
+        Initialise le fragment.
+
+        Args:
+            index (int): Le numéro du fragment.
+            manager (ConnectionManager): Le gestionnaire de connexions du fichier du fragment.
+        """
+        self.index = index
+        self.manager = manager
+
+
+# Fragments ouverts et gestionnaire partagé dont ils sont issus (ils sont recréés si celui-ci est reconfiguré)
+shards: List[Shard] = []
+origin: Optional[ConnectionManager] = None
+
+# Pool de threads exécutant en parallèle les opérations courtes sur les fragments (un thread par fragment)
+executor: Optional[ThreadPoolExecutor] = None
+
+# Verrou protégeant la création des fragments
+lock: threading.Lock = threading.Lock()
+
+def shard_path(database: str, index: int) -> str:
+    """
+    Retourne le fichier d'un fragment, dérivé du fichier de la base (ex: database.shard0.sqlite3).
+
+    Args:
+        database (str): Le fichier de la base de données.
+        index (int): Le numéro du fragment.
+
+    Returns:
+        str: Le chemin du fichier du fragment.
+    """
+    root, extension = os.path.splitext(database)
+    return f"{root}.shard{index}{extension}"
+
+def get_shards() -> List[Shard]:
+    """
+    Retourne les fragments, créés au premier appel à partir du gestionnaire partagé (fichier, profil).
+
+    Les connexions de chaque fragment forment un pool : elles passent d'un thread à l'autre et peuvent être
+    fermées depuis le thread principal.
+
+    Returns:
+        List[Shard]: Les fragments, par numéro.
+    """
+    global shards, origin, executor
+    with lock:
+        base: ConnectionManager = get_manager()
+        if origin is not base:
+            for shard in shards:
+                shard.manager.close()
+            shards = [Shard(index, ConnectionManager(shard_path(base.database, index), base.pool_size or SHARD_POOL_SIZE, base.profile))
+                      for index in range(SHARDS)]
+            origin = base
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=max(1, SHARDS), thread_name_prefix="shard")
+        return shards
+
+def close_shards() -> None:
+    """
+    Ferme les connexions de tous les fragments (appelée automatiquement à la sortie du processus).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    global shards, origin
+    with lock:
+        for shard in shards:
+            shard.manager.close()
+        shards, origin = [], None
+    return None
+
+# Fermeture propre des connexions à la fin du processus
+atexit.register(close_shards)
+
+def shard_of(collection: str) -> int:
+    """
+    Retourne le fragment d'une collection : répartition explicite, sinon hachage stable (CRC32) de son nom.
+
+    Args:
+        collection (str): Le nom de la collection.
+
+    Returns:
+        int: Le numéro du fragment.
+
+    Raises:
+        ValueError: Si la répartition explicite désigne un fragment inexistant.
+    """
+    index: Optional[int] = SHARD_MAP.get(collection)
+    if index is None:
+        return zlib.crc32(collection.encode()) % SHARDS
+    if not 0 <= index < SHARDS:
+        raise ValueError(f"Fragment inexistant pour la collection {collection} : {index} (fragments : 0 à {SHARDS - 1})")
+    return index
+
+def route(options: FilterOptions) -> List[int]:
+    """
+    Détermine les fragments concernés par des critères : ceux des collections et des identifiants demandés.
+
+    Seuls les critères simples (valeurs et intervalles d'identifiants) restreignent les fragments ;
+    une expression de filtre est évaluée par chaque fragment.
+
+    Args:
+        options (FilterOptions): Les critères de sélection.
+
+    Returns:
+        List[int]: Les numéros des fragments à interroger, dans l'ordre.
+    """
+    targets: Set[int] = set(range(SHARDS))
+
+    # Collections : le fragment de chacune
+    collections: Any = options.get("collection")
+    if collections:
+        values: List[Any] = collections if isinstance(collections, list) else [collections]
+        if all(isinstance(value, str) for value in values):
+            targets &= {shard_of(value) for value in values}
+
+    # Identifiants : le fragment est donné par leurs bits de poids fort
+    ids: Any = options.get("id")
+    if ids:
+        spans: Set[int] = set()
+        for value in ids if isinstance(ids, list) else [ids]:
+            if isinstance(value, dict):
+                spans.update(range(int(value["from"]) >> ID_BITS, min(int(value["to"]) >> ID_BITS, SHARDS - 1) + 1))
+            else:
+                spans.add(int(value) >> ID_BITS)
+        targets &= spans
+
+    return sorted(targets)
+
+def fan_out(function: Callable[[Shard], T], indexes: Iterable[int]) -> List[T]:
+    """
+    Exécute une opération sur plusieurs fragments en parallèle, chacun dans un thread du pool.
+
+    Args:
+        function (Callable[[Shard], T]): L'opération, qui reçoit le fragment.
+        indexes (Iterable[int]): Les numéros des fragments.
+
+    Returns:
+        List[T]: Les résultats, dans l'ordre des fragments.
+
+    Raises:
+        Exception: La première erreur levée par un fragment (une fois toutes les opérations lancées).
+    """
+    targets: List[Shard] = [get_shards()[index] for index in indexes]
+    futures: List["Future[T]"] = [executor.submit(function, shard) for shard in targets]
+    return [future.result() for future in futures]
+
+def offer(queue: "Queue[Any]", item: Any, stop: threading.Event) -> bool:
+    """
+    Dépose un élément dans une file bornée, en abandonnant si la lecture a été interrompue ou si le processus se termine.
+
+    Args:
+        queue (Queue[Any]): La file du fragment.
+        item (Any): La page, l'erreur ou la marque de fin.
+        stop (threading.Event): L'interruption de la lecture par le consommateur.
+
+    Returns:
+        bool: True si l'élément a été déposé.
+    """
+    while not stop.is_set() and threading.main_thread().is_alive():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
+
+def produce(pages: Callable[[ConnectionManager], Iterator[Result]], shard: Shard, queue: "Queue[Any]", stop: threading.Event) -> None:
+    """
+    Lit les pages d'un fragment et les dépose dans sa file (quelques pages d'avance au plus).
+
+    Args:
+        pages (Callable[[ConnectionManager], Iterator[Result]]): La lecture, qui reçoit le gestionnaire du fragment.
+        shard (Shard): Le fragment.
+        queue (Queue[Any]): La file du fragment.
+        stop (threading.Event): L'interruption de la lecture par le consommateur.
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    try:
+        # La lecture est fermée dans ce thread, qui détient sa transaction
+        iterator: Iterator[Result] = pages(shard.manager)
+        try:
+            for page in iterator:
+                if not offer(queue, page, stop):
+                    return None
+        finally:
+            iterator.close()
+        offer(queue, DONE, stop)
+    except Exception as error:
+        offer(queue, error, stop)
+    return None
+
+def stream(pages: Callable[[ConnectionManager], Iterator[Result]], shard: Shard, stop: threading.Event) -> Iterator[Result]:
+    """
+    Lit un fragment dans un thread dédié et retourne ses pages au fil de la lecture.
+
+    Le thread ne dépend pas du pool : plusieurs lectures peuvent rester ouvertes en même temps, et une lecture
+    abandonnée n'empêche pas le processus de se terminer.
+
+    Args:
+        pages (Callable[[ConnectionManager], Iterator[Result]]): La lecture, qui reçoit le gestionnaire du fragment.
+        shard (Shard): Le fragment.
+        stop (threading.Event): L'interruption de la lecture par le consommateur.
+
+    Yields:
+        Result: Les pages du fragment, dans l'ordre.
+
+    Raises:
+        Exception: L'erreur levée par la lecture du fragment.
+    """
+    queue: "Queue[Any]" = Queue(maxsize=PREFETCH)
+    threading.Thread(target=produce, args=(pages, shard, queue, stop), name=f"shard{shard.index}", daemon=True).start()
+    while (item := queue.get()) is not DONE:
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+def merge_pages(
+        pages: Callable[[ConnectionManager], Iterator[Result]],
+        indexes: List[int],
+        key: Callable[[Row], Any],
+        reverse: bool = False,
+        limit: int = 0,
+        page_size: int = 500
+        ) -> Iterator[Result]:
+    """
+    Lit plusieurs fragments en parallèle et fusionne leurs lignes déjà triées (fusion k-voies).
+
+    Chaque fragment est lu dans son thread avec quelques pages d'avance : la mémoire dépend du nombre de fragments
+    et de la taille des pages, jamais du nombre de tâches. Une lecture interrompue arrête tous les fragments.
+
+    Args:
+        pages (Callable[[ConnectionManager], Iterator[Result]]): La lecture triée d'un fragment.
+        indexes (List[int]): Les numéros des fragments à lire.
+        key (Callable[[Row], Any]): La clé de tri des lignes, identique à l'ordre de la lecture.
+        reverse (bool): Les lignes sont triées par ordre décroissant.
+        limit (int): Le nombre maximal de lignes fusionnées (0 pour aucune limite).
+        page_size (int): Le nombre de lignes par page retournée.
+
+    Yields:
+        Result: Des pages successives d'au plus `page_size` lignes, dans l'ordre global.
+    """
+    stop: threading.Event = threading.Event()
+    streams: List[Iterator[Result]] = [stream(pages, get_shards()[index], stop) for index in indexes]
+    try:
+        # Un seul fragment : ses pages sont déjà triées et limitées
+        if len(streams) == 1:
+            yield from streams[0]
+            return
+
+        # Fusion des flux triés, puis découpage en pages
+        rows: Iterator[Row] = heapq.merge(*map(chain.from_iterable, streams), key=key, reverse=reverse)
+        if limit:
+            rows = islice(rows, limit)
+        while page := list(islice(rows, page_size)):
+            yield page
+    finally:
+        stop.set()
+
+def sort_value(task_id: int, sort: str, archived: bool = False) -> Optional[Any]:
+    """
+    Lit la valeur de tri d'une tâche dans son fragment (reprise d'une lecture répartie).
+
+    Args:
+        task_id (int): L'identifiant de la tâche.
+        sort (str): La colonne de tri ("collection" ou "priority").
+        archived (bool): La tâche peut être archivée.
+
+    Returns:
+        Optional[Any]: La valeur de la colonne, ou None si la tâche n'existe pas.
+    """
+    index: int = task_id >> ID_BITS
+    if sort not in POSITIONS or index >= SHARDS:
+        return None
+    rows: Any = fan_out(lambda shard: database_manager.execute_query(
+        f"SELECT {sort} FROM {'task_all' if archived else 'task'} WHERE id = ?", (task_id,), "SELECT", shard.manager), [index])[0]
+    return rows[0][0] if rows else None
+
+def insert_into_database(values: Tuple[Any, ...]) -> None:
+    """
+    Insère une tâche dans le fragment de sa collection.
+
+    Args:
+        values (Tuple[Any, ...]): Les valeurs (label, collection, priority, status).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    fan_out(lambda shard: database_manager.insert_into_database(values, shard.manager), [shard_of(values[1])])
+    return None
+
+def insert_many_into_database(rows: Iterable[Row], chunk_size: int = 10_000) -> int:
+    """
+    Insère un flux de tâches par paquets, chaque paquet étant réparti entre les fragments et inséré en parallèle.
+
+    Args:
+        rows (Iterable[Row]): Les tuples (label, collection, priority, status).
+        chunk_size (int): Le nombre de lignes lues par paquet.
+
+    Returns:
+        int: Le nombre de lignes insérées.
+    """
+    total: int = 0
+    iterator: Iterator[Row] = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        # Regroupement des lignes du paquet par fragment
+        groups: Dict[int, List[Row]] = {}
+        for row in chunk:
+            groups.setdefault(shard_of(row[1]), []).append(row)
+
+        # Une transaction par fragment, toutes en parallèle
+        total += sum(fan_out(lambda shard: database_manager.insert_many_into_database(
+            groups[shard.index], chunk_size, shard.manager), sorted(groups)))
+    return total
+
+def iter_select_from_database(
+        options: FilterOptions,
+        after_id: int = 0,
+        limit: int = 0,
+        page_size: int = 500,
+        sort: str = "collection",
+        descending: bool = False,
+        archived: bool = False
+        ) -> Iterator[Result]:
+    """
+    Lit des tâches page par page sur les fragments concernés, fusionnées dans l'ordre (colonne de tri, id).
+
+    Chaque fragment applique les critères, la reprise et la limite ; la fusion conserve les `limit` premières lignes.
+
+    Args:
+        options (FilterOptions): Les critères de filtrage.
+        after_id (int): L'identifiant de la dernière tâche déjà lue.
+        limit (int): Le nombre maximal de tâches (0 pour aucune limite).
+        page_size (int): Le nombre de tâches par page.
+        sort (str): La colonne de tri ("collection", "priority" ou "id").
+        descending (bool): Trie par ordre décroissant.
+        archived (bool): Lit aussi les tâches archivées, sur tous les fragments (une tâche archivée reste dans son
+                         fragment d'origine si la répartition des collections a changé depuis).
+
+    Yields:
+        Result: Des pages successives d'au plus `page_size` lignes.
+    """
+    # Reprise : la valeur de tri de la tâche de reprise est lue dans son fragment puis transmise aux autres
+    anchor: Optional[Any] = None
+    if after_id and sort != "id":
+        anchor = sort_value(after_id, sort, archived)
+        if anchor is None:
+            return
+
+    # Clé de fusion identique à l'ordre de chaque fragment
+    position: int = POSITIONS.get(sort, 0)
+    key: Callable[[Row], Any] = (lambda row: row[0]) if sort == "id" else (lambda row: (row[position], row[0]))
+
+    yield from merge_pages(
+        lambda manager: database_manager.iter_select_from_database(
+            options, after_id, limit, page_size, sort, descending, anchor, archived, manager),
+        list(range(SHARDS)) if archived else route(options), key, descending, limit, page_size)
+
+def search_database(text: str, options: FilterOptions, limit: int = 0, page_size: int = 500) -> Iterator[Result]:
+    """
+    Recherche des tâches en plein texte sur les fragments concernés, fusionnées par rang BM25.
+
+    Le rang est calculé par chaque fragment avec ses propres statistiques : l'ordre global est approché.
+
+    Args:
+        text (str): La requête plein texte.
+        options (FilterOptions): Les critères de filtrage supplémentaires.
+        limit (int): Le nombre maximal de tâches (0 pour aucune limite).
+        page_size (int): Le nombre de tâches par page.
+
+    Yields:
+        Result: Des pages successives d'au plus `page_size` lignes, de la plus pertinente à la moins pertinente.
+    """
+    for page in merge_pages(
+            lambda manager: database_manager.search_database(text, options, limit, page_size, True, manager),
+            route(options), lambda row: row[-1], False, limit, page_size):
+        # Le rang ne sert qu'à la fusion
+        yield [row[:-1] for row in page]
+
+def next_from_database(limit: int = 20) -> Result:
+    """
+    Retourne les tâches ouvertes les plus urgentes : les `limit` premières de chaque fragment, fusionnées.
+
+    Args:
+        limit (int): Le nombre de tâches à retourner.
+
+    Returns:
+        Result: Les tâches, de la plus urgente à la moins urgente.
+    """
+    priority: int = POSITIONS["priority"]
+    results: List[Result] = fan_out(lambda shard: database_manager.next_from_database(limit, shard.manager), range(SHARDS))
+    return list(islice(heapq.merge(*results, key=lambda row: (row[priority], row[0]), reverse=True), limit))
+
+def update_from_database(columns: FilterOptions, options: FilterOptions) -> int:
+    """
+    Met à jour des tâches sur les fragments concernés, en parallèle (une transaction par fragment).
+
+    L'identifiant d'une tâche désigne son fragment : une tâche ne peut donc pas recevoir une collection
+    d'un autre fragment (elle changerait d'identifiant). Une telle modification est refusée avant toute écriture.
+
+    Args:
+        columns (FilterOptions): Les colonnes à modifier et leurs nouvelles valeurs.
+        options (FilterOptions): Les critères de sélection.
+
+    Returns:
+        int: Le nombre de tâches modifiées.
+
+    Raises:
+        ValueError: Si des tâches sélectionnées appartiennent à un autre fragment que la nouvelle collection.
+    """
+    indexes: List[int] = route(options)
+
+    # Nouvelle collection : seules les tâches de son fragment peuvent la recevoir
+    if columns.get("collection"):
+        target: int = shard_of(columns["collection"])
+        others: List[int] = [index for index in indexes if index != target]
+        found: List[bool] = fan_out(lambda shard: any(database_manager.iter_select_from_database(
+            options, limit=1, manager=shard.manager)), others)
+        sources: List[int] = [index for index, exists in zip(others, found) if exists]
+        if sources:
+            raise ValueError(f"Collection '{columns['collection']}' stockée dans le fragment {target} : les tâches "
+                             f"sélectionnées du fragment {', '.join(map(str, sources))} ne peuvent pas en changer "
+                             "(l'identifiant d'une tâche désigne son fragment)")
+        # Les tâches ajoutées entre-temps dans un autre fragment ne sont pas modifiées
+        indexes = [index for index in indexes if index == target]
+
+    return sum(fan_out(lambda shard: database_manager.update_from_database(columns, options, shard.manager), indexes))
+
+def delete_from_database(options: FilterOptions) -> int:
+    """
+    Supprime des tâches sur les fragments concernés, en parallèle (une transaction par fragment).
+
+    Args:
+        options (FilterOptions): Les critères de sélection.
+
+    Returns:
+        int: Le nombre de tâches supprimées.
+    """
+    return sum(fan_out(lambda shard: database_manager.delete_from_database(options, shard.manager), route(options)))
+
+def count_by(columns: Tuple[str, ...]) -> Iterator[Row]:
+    """
+    Compte les tâches par groupe sur chaque fragment en parallèle, puis additionne les groupes communs.
+
+    Les groupes de chaque fragment sont triés : ils sont fusionnés (fusion k-voies) puis additionnés groupe par groupe.
+
+    Args:
+        columns (Tuple[str, ...]): Les colonnes de regroupement.
+
+    Yields:
+        Row: Les valeurs des colonnes de regroupement suivies du nombre de tâches, triées par groupe.
+    """
+    results: List[Result] = fan_out(lambda shard: list(stats_manager.count_by(columns, shard.manager)), range(SHARDS))
+    for group, rows in groupby(heapq.merge(*results, key=lambda row: row[:-1]), key=lambda row: row[:-1]):
+        yield (*group, sum(row[-1] for row in rows))
+
+def reserve_ids(shard: Shard) -> None:
+    """
+    Place le compteur AUTOINCREMENT d'un fragment au début de sa plage d'identifiants.
+
+    Args:
+        shard (Shard): Le fragment (schéma déjà créé).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    start: int = shard.index << ID_BITS
+    run_write(lambda cur: (
+        cur.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = 'task' AND seq < ?", (start, start)),
+        cur.execute("INSERT INTO sqlite_sequence (name, seq) SELECT 'task', ? "
+                    "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'task')", (start,))), shard.manager)
+    return None
+
+def databases() -> List[ConnectionManager]:
+    """
+    Retourne les gestionnaires de connexions de toutes les bases : les fragments, ou la base unique.
+
+    Returns:
+        List[ConnectionManager]: Les gestionnaires, par numéro de fragment.
+    """
+    return [shard.manager for shard in get_shards()] if SHARDS else [get_manager()]
+
+def migrate_databases() -> List[Tuple[ConnectionManager, List[Migration]]]:
+    """
+    Applique les migrations en attente de chaque base (les fragments en parallèle).
+
+    Returns:
+        List[Tuple[ConnectionManager, List[Migration]]]: Chaque base et les migrations qui y ont été appliquées.
+    """
+    if not SHARDS:
+        return [(get_manager(), migration_manager.migrate())]
+
+    def apply(shard: Shard) -> Tuple[ConnectionManager, List[Migration]]:
+        applied: List[Migration] = migration_manager.migrate(shard.manager)
+        reserve_ids(shard)
+        return shard.manager, applied
+
+    return fan_out(apply, range(SHARDS))
+
+def reset_databases() -> None:
+    """
+    Reconstruit le schéma de chaque base, toutes les tâches étant supprimées (les fragments en parallèle).
+
+    Returns:
+        None: La fonction ne retourne rien.
+    """
+    if not SHARDS:
+        return migration_manager.reset_schema()
+
+    def reset(shard: Shard) -> None:
+        migration_manager.reset_schema(shard.manager)
+        reserve_ids(shard)
+
+    fan_out(reset, range(SHARDS))
+    return None
@@ -0,0 +1,46 @@
+from time import perf_counter
+from typing import Iterator, List, Optional, Tuple
+
+from .connection_manager import ConnectionManager
+from .database_manager import Database, Row
+from .logging_manager import logs
+from .query_manager import POSITIONS
+
+
+def count_by(columns: Tuple[str, ...], manager: Optional[ConnectionManager] = None) -> Iterator[Row]:
+    """
+    Compte les tâches par combinaison de valeurs des colonnes indiquées, directement dans SQLite (GROUP BY).
+
+    Les groupes sont lus un par un depuis le curseur : la mémoire utilisée dépend du nombre de groupes,
+    jamais du nombre de tâches. Les index de la table (ex: (collection, status)) sont parcourus sans tri.
+
+    Args:
+        columns (Tuple[str, ...]): Les colonnes de regroupement (ex: ("collection", "status")).
+        manager (Optional[ConnectionManager]): Le gestionnaire de connexions de la base (par défaut, le gestionnaire partagé).
+
+    Yields:
+        Row: Les valeurs des colonnes de regroupement (codes entiers pour la priorité et le statut)
+             suivies du nombre de tâches, triées par groupe.
+
+    Raises:
+        ValueError: Si une colonne ne fait pas partie de la table 'task'.
+    """
+    # Liste blanche des noms de colonnes (ils sont insérés tels quels dans le SQL)
+    unknown: List[str] = [column for column in columns if column not in POSITIONS]
+    if unknown or not columns:
+        raise ValueError(f"Colonne(s) de regroupement invalide(s) : {', '.join(unknown)}")
+
+    # Construction de la requête d'agrégation
+    expression: str = ", ".join(columns)
+    query: str = f"SELECT {expression}, COUNT(*) FROM task GROUP BY {expression} ORDER BY {expression}"
+
+    # Lecture des groupes depuis le curseur
+    groups: int = 0
+    start: float = perf_counter()
+    with Database(manager) as cur:
+        for row in cur.execute(query):
+            groups += 1
+            yield row
+
+    # Enregistrement de l'opération (une fois tous les groupes lus)
+    logs("STATS", query, (), groups, perf_counter() - start)
@@ -0,0 +1,33 @@
+import os
+from typing import Any, Iterator
+
+import pytest
+
+
+@pytest.fixture
+def database(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """
+    Prépare une base migrée dans un dossier temporaire et en fait la base du gestionnaire partagé le temps du test.
+
+    Args:
+        tmp_path (Any): Le dossier temporaire du test.
+        monkeypatch (pytest.MonkeyPatch): La restauration de l'environnement après le test.
+
+    Yields:
+        str: Le fichier de la base de données.
+    """
+    # Journalisation désactivée, et fichiers éventuels hors du dépôt
+    monkeypatch.setenv("TASK_MANAGER_LOG_LEVEL", "OFF")
+    monkeypatch.setenv("TASK_MANAGER_SLOW_QUERY_MS", "OFF")
+    monkeypatch.chdir(tmp_path)
+
+    from manager import connection_manager
+    from manager.migration_manager import reset_schema
+
+    # Base temporaire, puis retour au gestionnaire d'origine
+    previous: str = connection_manager.get_manager().database
+    path: str = os.path.join(str(tmp_path), "tasks.sqlite3")
+    connection_manager.configure(database=path)
+    reset_schema()
+    yield path
+    connection_manager.configure(database=previous)
@@ -0,0 +1,107 @@
+import os
+import sqlite3
+from typing import Any, Iterator, List
+
+import pytest
+
+from manager.cache_manager import STATS_FILE, ResultCache, cache
+
+
+@pytest.fixture
+def cached(database: str, tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """
+    Active le cache des lectures sur disque (dossier temporaire) pour la base du test.
+
+    Args:
+        database (str): Le fichier de la base de données migrée.
+        tmp_path (Any): Le dossier temporaire du test.
+        monkeypatch (pytest.MonkeyPatch): La restauration de la configuration du cache après le test.
+
+    Yields:
+        str: Le dossier du cache.
+    """
+    directory: str = os.path.join(str(tmp_path), "cache")
+    monkeypatch.setattr(cache, "directory", directory)
+    monkeypatch.setattr(cache, "size", 0)
+    cache.clear()
+    yield directory
+    cache.clear()
+
+
+def labels() -> List[Any]:
+    """
+    Lit les libellés de toutes les tâches (lecture mise en cache).
+
+    Returns:
+        List[Any]: Les libellés, dans l'ordre de lecture.
+    """
+    from manager.database_manager import iter_select_from_database
+    return [row[1] for page in iter_select_from_database({}) for row in page]
+
+
+def test_repeated_read_is_served_from_disk(cached: str) -> None:
+    """Une lecture répétée sans écriture est servie par le cache, et comptée dans les statistiques partagées."""
+    from manager.database_manager import insert_into_database
+
+    insert_into_database(("tâche", "divers", "basse", "à faire"))
+    assert labels() == labels() == ["tâche"]
+    assert cache.disk_stats()["hits"] == 1
+    assert os.path.exists(os.path.join(cached, STATS_FILE))
+
+
+def test_external_write_invalidates(database: str, cached: str) -> None:
+    """Une écriture d'une autre connexion, sans passer par l'application, invalide le résultat conservé."""
+    from manager.database_manager import insert_into_database
+
+    insert_into_database(("tâche", "divers", "basse", "à faire"))
+    assert labels() == ["tâche"]
+
+    # Client SQLite externe : seuls les déclencheurs de la base changent la version des données
+    with sqlite3.connect(database) as con:
+        con.execute("UPDATE task SET label = 'EXTERNAL'")
+    assert labels() == ["EXTERNAL"]
+
+    with sqlite3.connect(database) as con:
+        con.execute("DELETE FROM task")
+    assert labels() == []
+
+
+def test_application_writes_invalidate(cached: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Les écritures de l'application (insertion en masse, modification, archivage) invalident aussi le cache en mémoire."""
+    from manager.archive_manager import archive_tasks
+    from manager.database_manager import insert_many_into_database, iter_select_from_database, update_from_database
+
+    monkeypatch.setattr(cache, "size", 8)
+    insert_many_into_database([("a", "divers", "basse", "à faire"), ("b", "divers", "basse", "terminée")])
+    assert labels() == ["a", "b"]
+
+    update_from_database({"label": "c"}, {"id": 1})
+    assert labels() == ["c", "b"]
+
+    # Tâche archivée : elle quitte les lectures, mais reste lue avec l'archive
+    archive_tasks(older_than=-1)
+    assert labels() == ["c"]
+    assert [row[1] for page in iter_select_from_database({}, archived=True) for row in page] == ["c", "b"]
+
+
+def test_directory_is_capped(tmp_path: Any) -> None:
+    """Au-delà de la taille maximale, les fichiers les moins récemment utilisés sont supprimés."""
+    store: ResultCache = ResultCache(size=0, directory=str(tmp_path), max_bytes=0)
+    store.put(("base", "q1", ()), 1, [(1, "a")], 2.0)
+    assert [name for name in os.listdir(tmp_path) if name != STATS_FILE] == []
+
+    # Taille d'un fichier : place pour deux entrées seulement
+    store.max_bytes = 1_000_000
+    store.put(("base", "q1", ()), 1, [(1, "a")], 2.0)
+    size: int = os.path.getsize(store.path(("base", "q1", ())))
+    store.max_bytes = 2 * size
+    os.utime(store.path(("base", "q1", ())), (1, 1))
+    store.put(("base", "q2", ()), 1, [(1, "a")], 2.0)
+    os.utime(store.path(("base", "q2", ())), (2, 2))
+
+    # q1 est relue (marquée récente) : q2 est la plus ancienne au moment d'ajouter q3
+    assert store.get(("base", "q1", ()), 1) == ([(1, "a")], 2.0)
+    store.put(("base", "q3", ()), 1, [(1, "a")], 2.0)
+    assert os.path.exists(store.path(("base", "q1", ())))
+    assert not os.path.exists(store.path(("base", "q2", ())))
+    assert os.path.exists(store.path(("base", "q3", ())))
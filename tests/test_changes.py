@@ -0,0 +1,94 @@
+from typing import Any, Dict, List, Tuple
+
+from manager.change_manager import compact_changes, iter_changes, last_change
+from manager.database_manager import Row, delete_from_database, insert_many_into_database, iter_select_from_database, update_from_database
+
+
+def changes(since: int = 0) -> List[Row]:
+    """
+    Lit le journal des changements à partir d'une séquence.
+
+    Args:
+        since (int): La dernière séquence déjà lue.
+
+    Returns:
+        List[Row]: Les changements (seq, operation, task_id, label, collection, priority, status), dans l'ordre.
+    """
+    return [row for page in iter_changes(since) for row in page]
+
+
+def replay(rows: List[Row]) -> Dict[int, Tuple[Any, ...]]:
+    """
+    Reconstruit les tâches en rejouant des changements dans l'ordre du journal.
+
+    Args:
+        rows (List[Row]): Les changements.
+
+    Returns:
+        Dict[int, Tuple[Any, ...]]: Les tâches (label, collection, priority, status) par identifiant.
+    """
+    tasks: Dict[int, Tuple[Any, ...]] = {}
+    for _, operation, task_id, *values in rows:
+        if operation in ("insert", "update"):
+            tasks[task_id] = tuple(values)
+        else:
+            tasks.pop(task_id, None)
+    return tasks
+
+
+def table() -> Dict[int, Tuple[Any, ...]]:
+    """
+    Lit les tâches de la table 'task'.
+
+    Returns:
+        Dict[int, Tuple[Any, ...]]: Les tâches (label, collection, priority, status) par identifiant.
+    """
+    return {row[0]: tuple(row[1:]) for page in iter_select_from_database({}) for row in page}
+
+
+def test_log_follows_writes(database: str) -> None:
+    """Chaque insertion, modification effective et suppression est journalisée ; la reprise ne relit que la suite."""
+    insert_many_into_database([("a", "x", "basse", "à faire"), ("b", "x", "basse", "à faire")])
+    first: int = last_change()
+
+    update_from_database({"label": "a2"}, {"id": 1})
+    update_from_database({"label": "a2"}, {"id": 1})
+    delete_from_database({"id": 2})
+
+    assert [(row[1], row[2]) for row in changes(first)] == [("update", 1), ("delete", 2)]
+    assert replay(changes()) == table()
+
+
+def test_compaction_keeps_last_change_per_task(database: str) -> None:
+    """La compaction ne garde que le dernier changement de chaque tâche : le journal reconstruit toujours la table."""
+    insert_many_into_database([("a", "x", "basse", "à faire"), ("b", "x", "basse", "à faire"), ("c", "x", "basse", "à faire")])
+    update_from_database({"label": "a2"}, {"id": 1})
+    update_from_database({"status": "en cours"}, {"id": 1})
+    delete_from_database({"id": 2})
+
+    assert compact_changes() == 3
+    assert [(row[1], row[2]) for row in changes()] == [("insert", 3), ("update", 1), ("delete", 2)]
+    assert replay(changes()) == table()
+
+    # Les marques de suppression ne sont retirées qu'à la demande
+    assert compact_changes(purge_deletes=True) == 1
+    assert [(row[1], row[2]) for row in changes()] == [("insert", 3), ("update", 1)]
+    assert replay(changes()) == table()
+
+
+def test_compaction_stops_at_cursor(database: str) -> None:
+    """Les changements postérieurs au curseur de compaction sont conservés tels quels (consommateurs en retard)."""
+    insert_many_into_database([("a", "x", "basse", "à faire")])
+    cursor: int = last_change()
+    update_from_database({"label": "a2"}, {"id": 1})
+    update_from_database({"label": "a3"}, {"id": 1})
+
+    assert compact_changes(before=cursor) == 0
+    assert [row[3] for row in changes()] == ["a", "a2", "a3"]
+
+    # Sans curseur : tout le journal, la séquence n'est jamais réutilisée
+    last: int = last_change()
+    assert compact_changes() == 2
+    assert [row[3] for row in changes()] == ["a3"]
+    insert_many_into_database([("b", "x", "basse", "à faire")])
+    assert changes()[-1][0] > last
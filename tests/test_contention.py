@@ -0,0 +1,28 @@
+from typing import Any, Dict
+
+import pytest
+
+from benchmarks.contention_benchmark import stress
+
+
+def test_concurrent_writers(database: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Vérifie que des processus d'écriture concurrents ne perdent aucune écriture et n'échouent jamais sur un verrou.
+
+    Args:
+        database (str): Le fichier de la base de données migrée.
+        monkeypatch (pytest.MonkeyPatch): La restauration de l'environnement après le test.
+
+    Returns:
+        None: Le test échoue si une écriture manque en base ou si une transaction a épuisé ses tentatives.
+    """
+    # Configuration transmise aux processus fils par l'environnement
+    monkeypatch.setenv("TASK_MANAGER_WRITE_RETRIES", "5")
+    monkeypatch.setenv("TASK_MANAGER_BUSY_TIMEOUT", "5000")
+
+    result: Dict[str, Any] = stress(database, writers=4, writes=50)
+
+    # Écritures absentes en base, écritures en échec dans les processus, "database is locked" non rattrapés
+    assert result["missing"] == 0
+    assert result["lost"] == 0
+    assert result["failures"] == 0
@@ -0,0 +1,129 @@
+import json
+from typing import Any, List
+
+import pytest
+
+from manager.constant_manager import PRIORITY, STATUS
+from manager.query_manager import canonicalize, compile_query, criterion, parse_expression, parse_ids, tokenize
+
+
+def codes(column: str, *values: str) -> List[int]:
+    """
+    Retourne les codes entiers de valeurs de priorité ou de statut.
+
+    Args:
+        column (str): "priority" ou "status".
+        *values (str): Les valeurs.
+
+    Returns:
+        List[int]: Les codes, dans l'ordre des valeurs.
+    """
+    constants: List[str] = PRIORITY if column == "priority" else STATUS
+    return [constants.index(value) for value in values]
+
+
+def test_tokenize_strings_and_symbols() -> None:
+    """Les chaînes perdent leurs guillemets et leurs échappements, les symboles composés restent entiers."""
+    tokens = tokenize('label ^= "a \\"b\\"" and priority>=haute')
+    assert [(kind, value) for kind, value, _ in tokens] == [
+        ("word", "label"), ("symbol", "^="), ("string", 'a "b"'),
+        ("word", "and"), ("word", "priority"), ("symbol", ">="), ("word", "haute")]
+
+
+def test_tokenize_unterminated_string() -> None:
+    """Un guillemet non refermé est une erreur, avec sa position."""
+    with pytest.raises(ValueError, match="position"):
+        tokenize('label = "abc')
+
+
+def test_precedence_and_parameters() -> None:
+    """AND lie plus fort que OR ; les paramètres suivent l'ordre de la condition SQL."""
+    node, data = parse_expression("priority >= haute or status = terminée and collection = x")
+    assert node == ("or", ("cmp", "priority", ">="), ("and", ("cmp", "status", "="), ("cmp", "collection", "=")))
+    assert data == (*codes("priority", "haute"), *codes("status", "terminée"), "x")
+
+
+def test_negation_groups_and_lists() -> None:
+    """NOT préfixé ou placé après la colonne, groupes entre parenthèses, IN en un seul paramètre JSON."""
+    node, data = parse_expression("not (id between 2 and 5) and status not in (terminée, annulée)")
+    assert node == ("and", ("not", ("between", "id")), ("not", ("in", "status")))
+    assert data == (2, 5, json.dumps(codes("status", "terminée", "annulée")))
+
+
+def test_prefix_is_a_range() -> None:
+    """Le préfixe devient un intervalle parcouru dans l'index de la colonne."""
+    node, data = parse_expression("collection ^= pro")
+    assert node == ("prefix", "collection")
+    assert data == ("pro", "pro\U0010ffff")
+
+
+@pytest.mark.parametrize("text, message", [
+    ("", "vide"),
+    ("owner = x", "colonne attendue"),
+    ("priority = inconnue", "Valeur inconnue"),
+    ("priority ^= haute", "ne s'applique qu'aux colonnes"),
+    ("id = abc", "Identifiant invalide"),
+    ("status = terminée and", "Expression incomplète"),
+    ("(status = terminée", "Expression incomplète"),
+    ("status = terminée label = x", "fin de l'expression attendue"),
+])
+def test_invalid_expressions(text: str, message: str) -> None:
+    """Chaque erreur de syntaxe ou de valeur est une ValueError explicite."""
+    with pytest.raises(ValueError, match=message):
+        parse_expression(text)
+
+
+def test_parse_ids() -> None:
+    """Identifiants et intervalles croissants ; les intervalles décroissants et les valeurs non entières sont refusés."""
+    assert parse_ids("3, 8,100-2000,") == [3, 8, {"from": 100, "to": 2000}]
+    with pytest.raises(ValueError, match="décroissant"):
+        parse_ids("9-2")
+    with pytest.raises(ValueError, match="invalide"):
+        parse_ids("a-b")
+
+
+def test_criterion_shapes() -> None:
+    """Égalité pour une valeur, liste JSON et BETWEEN pour plusieurs cibles (la forme ne dépend pas du nombre de valeurs)."""
+    assert criterion("status", "terminée") == ("status", tuple(codes("status", "terminée")))
+    assert criterion("id", [7]) == ("id", (7,))
+    shape, data = criterion("id", [1, 2, {"from": 10, "to": 20}, 3])
+    assert shape == ("id", True, 1)
+    assert data == (json.dumps([1, 2, 3]), 10, 20)
+    assert criterion("id", [1, 2, 3, 4])[0] == criterion("id", [5, 6])[0]
+
+
+def test_canonical_order() -> None:
+    """Deux critères identiques donnent la même forme, quel que soit l'ordre des colonnes ; les colonnes inconnues sont refusées."""
+    first = canonicalize({"status": "terminée", "collection": "x"})
+    second = canonicalize({"collection": "x", "status": "terminée", "label": None})
+    assert first == second
+    with pytest.raises(ValueError, match="inconnue"):
+        canonicalize({"owner": "x"})
+
+
+def test_compiled_lists_use_json_each() -> None:
+    """Les listes de valeurs sont lues par json_each et les intervalles par BETWEEN."""
+    shapes, _ = canonicalize({"id": [1, 2, {"from": 5, "to": 9}], "where": "priority in (haute, urgente)"})
+    query: str = compile_query("SELECT", shapes)
+    assert "(id IN (SELECT value FROM json_each(?)) OR id BETWEEN ? AND ?)" in query
+    assert "(priority IN (SELECT value FROM json_each(?)))" in query
+
+
+def test_expressions_against_the_database(database: str) -> None:
+    """Les expressions compilées sélectionnent les bonnes tâches (rang de priorité, listes, préfixe, négation)."""
+    from manager.database_manager import insert_many_into_database, iter_select_from_database
+
+    insert_many_into_database([
+        ("a", "pro", "haute", "à faire"),
+        ("b", "projet", "urgente", "terminée"),
+        ("c", "perso", "basse", "en cours"),
+        ("d", "pro", "moyenne", "annulée"),
+    ])
+
+    def labels(where: str) -> List[Any]:
+        return sorted(row[1] for page in iter_select_from_database({"where": where}) for row in page)
+
+    assert labels("priority >= haute") == ["a", "b"]
+    assert labels("status in (terminée, annulée)") == ["b", "d"]
+    assert labels("collection ^= pro and not status = terminée") == ["a", "d"]
+    assert labels("label like '_' and (priority < moyenne or id = 1)") == ["a", "c"]
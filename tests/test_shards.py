@@ -0,0 +1,90 @@
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from manager import shard_manager
+from manager.constant_manager import PRIORITY, STATUS
+from manager.database_manager import Row
+
+
+@pytest.fixture
+def shards(database: str, monkeypatch: pytest.MonkeyPatch) -> Iterator[Dict[int, List[str]]]:
+    """
+    Répartit les tâches entre trois fragments dérivés de la base du test, et y insère des tâches.
+
+    Args:
+        database (str): Le fichier de la base de données migrée.
+        monkeypatch (pytest.MonkeyPatch): La restauration de la configuration des fragments après le test.
+
+    Yields:
+        Dict[int, List[str]]: Deux collections de chaque fragment, par numéro de fragment.
+    """
+    monkeypatch.setattr(shard_manager, "SHARDS", 3)
+    monkeypatch.setattr(shard_manager, "SHARD_MAP", {})
+    shard_manager.migrate_databases()
+
+    # Deux collections par fragment (hachage de leur nom)
+    collections: Dict[int, List[str]] = {index: [] for index in range(3)}
+    for number in range(100):
+        name: str = f"collection-{number}"
+        if len(collections[shard_manager.shard_of(name)]) < 2:
+            collections[shard_manager.shard_of(name)].append(name)
+
+    # Tâches de toutes les priorités, dans des collections de tous les fragments
+    shard_manager.insert_many_into_database([
+        (f"tâche {number}", collections[number % 3][number % 2], PRIORITY[number % len(PRIORITY)], STATUS[number % 2])
+        for number in range(30)])
+    yield collections
+    shard_manager.close_shards()
+
+
+def read(**arguments: Any) -> List[Row]:
+    """
+    Lit les tâches de tous les fragments (lecture fusionnée).
+
+    Args:
+        **arguments (Any): Les arguments de shard_manager.iter_select_from_database, hors critères.
+
+    Returns:
+        List[Row]: Les tâches, dans l'ordre global.
+    """
+    return [row for page in shard_manager.iter_select_from_database({}, **arguments) for row in page]
+
+
+def test_ids_designate_their_shard(shards: Dict[int, List[str]]) -> None:
+    """Chaque identifiant est unique et désigne le fragment de la collection de sa tâche."""
+    rows: List[Row] = read(sort="id")
+    assert len({row[0] for row in rows}) == 30
+    assert all(row[0] >> shard_manager.ID_BITS == shard_manager.shard_of(row[2]) for row in rows)
+
+
+@pytest.mark.parametrize("sort, descending", [("collection", False), ("priority", False), ("priority", True), ("id", True)])
+def test_merge_is_globally_sorted(shards: Dict[int, List[str]], sort: str, descending: bool) -> None:
+    """La fusion k-voies des fragments donne l'ordre (colonne de tri, id) de toutes les tâches."""
+    position: int = {"id": 0, "collection": 2, "priority": 3}[sort]
+    rows: List[Row] = read(sort=sort, descending=descending, page_size=4)
+    assert rows == sorted(rows, key=lambda row: (row[position], row[0]), reverse=descending)
+    assert read(sort=sort, descending=descending, limit=7) == rows[:7]
+
+
+@pytest.mark.parametrize("sort, descending", [("collection", False), ("priority", True), ("id", False)])
+def test_keyset_resumes_across_shards(shards: Dict[int, List[str]], sort: str, descending: bool) -> None:
+    """La reprise après une tâche d'un fragment se poursuit dans tous les fragments, sans doublon ni oubli."""
+    expected: List[Row] = read(sort=sort, descending=descending)
+    pages: List[Row] = []
+    while page := read(sort=sort, descending=descending, limit=4, after_id=pages[-1][0] if pages else 0):
+        pages.extend(page)
+    assert pages == expected
+
+
+def test_collection_change_across_shards_is_refused(shards: Dict[int, List[str]]) -> None:
+    """Une collection d'un autre fragment est refusée sans rien modifier ; dans le même fragment, elle est acceptée."""
+    source, other = shards[0][0], shards[1][0]
+    before: List[Row] = read(sort="id")
+    with pytest.raises(ValueError, match="fragment"):
+        shard_manager.update_from_database({"collection": other}, {"collection": source})
+    assert read(sort="id") == before
+
+    moved: int = shard_manager.update_from_database({"collection": shards[0][1]}, {"collection": source})
+    assert moved == sum(row[2] == source for row in before)
+    assert [row[0] for row in read(sort="id")] == [row[0] for row in before]
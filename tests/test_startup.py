@@ -0,0 +1,21 @@
+from typing import Dict, List
+
+from benchmarks.startup_benchmark import BUDGET, FORBIDDEN, import_times
+
+
+def test_startup_budget() -> None:
+    """
+    Vérifie que l'import de main.py reste dans le budget de démarrage et ne charge aucun module de commande.
+
+    Returns:
+        None: Le test échoue si le budget est dépassé ou si un module interdit est importé au démarrage.
+    """
+    times: Dict[str, int] = import_times()
+
+    # Temps cumulé de l'import de main.py, en millisecondes
+    total: float = times["main"] / 1000
+    assert total <= BUDGET, f"Import de main.py : {total:.1f} ms (budget : {BUDGET:.1f} ms)"
+
+    # Modules chargés à la demande par les commandes
+    eager: List[str] = sorted(name for name in times if name.split(".")[0] in FORBIDDEN)
+    assert not eager, f"Modules importés au démarrage : {', '.join(eager)}"